@@ -24,8 +24,10 @@ from cdse.exceptions import (
 )
 from cdse.geometry import (
     bbox_to_geojson,
+    bbox_to_geojson_bytes,
     geojson_to_bbox,
     geojson_to_wkt,
+    read_first_geometry,
     read_geojson,
     validate_geometry,
     wkt_to_geojson,
@@ -52,9 +54,11 @@ __all__ = [
     "ValidationError",
     # Geometry utilities (sentinelsat compatible)
     "read_geojson",
+    "read_first_geometry",
     "geojson_to_wkt",
     "wkt_to_geojson",
     "bbox_to_geojson",
+    "bbox_to_geojson_bytes",
     "geojson_to_bbox",
     "validate_geometry",
     # Data format converters (sentinelsat compatible)
@@ -86,9 +90,11 @@ def __getattr__(name):
     # Geocoding module
     if name in (
         "get_city_bbox",
+        "get_city_bboxes",
         "get_city_center",
         "get_location_info",
         "get_predefined_bbox",
+        "clear_geocode_cache",
         "ITALIAN_CITIES_BBOX",
         "EUROPEAN_CITIES_BBOX",
     ):
@@ -8,6 +8,7 @@ Requires: aiohttp, aiofiles (install with: pip install cdse-client[async])
 
 import asyncio
 import logging
+import os
 import time
 from pathlib import Path
 from typing import Any, Optional
@@ -43,6 +44,7 @@ class CDSEClientAsync:
         client_secret: Optional[str] = None,
         output_dir: str = ".",
         max_concurrent: int = 4,
+        chunk_size: int = 1024 * 1024,  # 1MB, same as Downloader
     ):
         """Initialize the async client.
 
@@ -51,9 +53,8 @@ class CDSEClientAsync:
             client_secret: OAuth2 client secret
             output_dir: Default output directory for downloads
             max_concurrent: Maximum concurrent downloads
+            chunk_size: Size of download chunks in bytes (default: 1MB)
         """
-        import os
-
         self.client_id = client_id or os.environ.get("CDSE_CLIENT_ID")
         self.client_secret = client_secret or os.environ.get("CDSE_CLIENT_SECRET")
 
@@ -65,6 +66,7 @@ class CDSEClientAsync:
 
         self.output_dir = Path(output_dir)
         self.max_concurrent = max_concurrent
+        self.chunk_size = chunk_size
         self._session: Any = None
         self._access_token: Optional[str] = None
         self._token_expires_at: float = 0
@@ -223,6 +225,8 @@ class CDSEClientAsync:
 
         filename = f"{product.name}.zip"
         output_path = out_dir / filename
+        # Stream into a sidecar and rename once complete (as Downloader does)
+        part_path = output_path.with_name(output_path.name + ".part")
 
         if output_path.exists():
             return output_path
@@ -256,8 +260,8 @@ class CDSEClientAsync:
                         desc=filename[:50],
                     )
 
-                async with aiofiles.open(output_path, "wb") as f:
-                    async for chunk in response.content.iter_chunked(131072):  # 128KB
+                async with aiofiles.open(part_path, "wb") as f:
+                    async for chunk in response.content.iter_chunked(self.chunk_size):
                         await f.write(chunk)
                         if pbar:
                             pbar.update(len(chunk))
@@ -265,6 +269,7 @@ class CDSEClientAsync:
                 if pbar:
                     pbar.close()
 
+        os.replace(part_path, output_path)
         return output_path
 
     async def download_all(
@@ -27,12 +27,16 @@ class _BearerSession(requests.Session):
         access_token = self._auth_handler.get_access_token()
         self.headers["Authorization"] = f"Bearer {access_token}"
 
-    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:  # type: ignore[override]
-        """Override to refresh token before each request if expired."""
+    def refresh_if_expired(self) -> None:
+        """Refresh the Bearer token if it has expired."""
         if not self._auth_handler.is_valid():
             logger.debug("Bearer token expired, refreshing")
             self._auth_handler.refresh()
             self._update_token()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        """Override to refresh token before each request if expired."""
+        self.refresh_if_expired()
         return super().request(method, url, **kwargs)
 
 
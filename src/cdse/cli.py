@@ -1,6 +1,7 @@
 """Command-line interface for CDSE Client."""
 
 import argparse
+import functools
 import json
 import os
 import sys
@@ -11,14 +12,16 @@ from cdse import CDSEClient, __version__
 from cdse.exceptions import AuthenticationError, CatalogError, DownloadError
 
 
-def main(args: Optional[list[str]] = None) -> int:
-    """Main entry point for CLI.
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the ``cdse`` command.
 
-    Args:
-        args: Command line arguments (default: sys.argv)
+    The parser is built once and reused by every call to :func:`main`.
+    ``parse_args`` returns a fresh namespace and leaves the parser
+    untouched, so callers must not add arguments to the returned object.
 
     Returns:
-        Exit code (0 for success, non-zero for errors)
+        Configured argument parser
     """
     parser = argparse.ArgumentParser(
         prog="cdse",
@@ -170,6 +173,20 @@ Examples:
     # Collections command
     subparsers.add_parser("collections", help="List available collections")
 
+    return parser
+
+
+def main(args: Optional[list[str]] = None) -> int:
+    """Main entry point for CLI.
+
+    Args:
+        args: Command line arguments (default: sys.argv)
+
+    Returns:
+        Exit code (0 for success, non-zero for errors)
+    """
+    parser = _build_parser()
+
     # Parse arguments
     parsed = parser.parse_args(args)
 
@@ -227,11 +244,10 @@ def cmd_search(client_id: str, client_secret: str, args: argparse.Namespace) ->
             print(f"Invalid bbox format: {e}", file=sys.stderr)
             return 1
     elif args.geometry:
-        from cdse import geojson_to_bbox, read_geojson
+        from cdse import geojson_to_bbox
 
         try:
-            geojson = read_geojson(args.geometry)
-            bbox = geojson_to_bbox(geojson)
+            bbox = geojson_to_bbox(args.geometry)
         except Exception as e:
             print(f"Error reading GeoJSON: {e}", file=sys.stderr)
             return 1
@@ -1,7 +1,7 @@
 """Main client for Copernicus Data Space Ecosystem."""
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from cdse.auth import OAuth2Auth
 from cdse.catalog import Catalog
@@ -194,7 +194,7 @@ class CDSEClient:
         output_dir: Optional[str] = None,
         skip_existing: bool = True,
         progress: bool = True,
-        parallel: bool = False,
+        parallel: Union[bool, str] = False,
         max_workers: int = 4,
     ) -> list[Path]:
         """Download multiple products.
@@ -204,7 +204,9 @@ class CDSEClient:
             output_dir: Override output directory
             skip_existing: Skip already downloaded products
             progress: Show progress bars
-            parallel: Enable parallel downloads for faster performance
+            parallel: Enable parallel downloads for faster performance.
+                Pass "async" to run them on one asyncio event loop
+                (requires: pip install cdse-client[async])
             max_workers: Number of parallel download workers (when parallel=True)
 
         Returns:
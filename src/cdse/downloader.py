@@ -1,13 +1,22 @@
 """Product downloader for Copernicus Data Space Ecosystem."""
 
+import asyncio
 import hashlib
+import json
 import logging
+import mmap
+import os
+import shutil
+import threading
 import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Union, cast
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 
 from cdse.exceptions import DownloadError
@@ -15,8 +24,183 @@ from cdse.product import Product
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for decoding OData responses when it is installed
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:  # pragma: no cover - depends on optional dependency
+    _json_loads = json.loads
+
 # HTTP status codes that are retryable (transient errors)
-_RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+_RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Seconds to wait before retry attempt N (exponential backoff, capped at the
+# last entry); replace the tuple to tune or add jitter
+_BACKOFF = tuple(2**i for i in range(16))
+
+# Errors raised while reading a response body that are worth resuming after
+_RESUMABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    urllib3.exceptions.HTTPError,
+)
+
+# Units used by Downloader.format_size, one per power of 1024
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# Read size for hashing files that cannot be memory-mapped
+_HASH_BUFFER_SIZE = 1024 * 1024
+
+# Minimum write buffer for downloads, so small chunk sizes still coalesce
+# into large write(2) calls instead of the default 8 KB ones
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Product name -> OData UUID, shared by all Downloader instances so a product
+# is only looked up once per process (e.g. by download_all and quicklooks)
+_UUID_CACHE_SIZE = 4096
+_uuid_cache: "OrderedDict[str, str]" = OrderedDict()
+_uuid_cache_lock = threading.Lock()
+
+# Product names resolved per batched catalog query in Downloader._prefetch_uuids
+_UUID_BATCH_SIZE = 20
+
+
+def _odata_name(product_name: str) -> str:
+    """Return the catalog name of a product (OData stores it with .SAFE)."""
+    if product_name.endswith(".SAFE"):
+        return product_name
+    return f"{product_name}.SAFE"
+
+
+def _get_cached_uuid(product_name: str) -> Optional[str]:
+    """Return the cached OData UUID for a product name, if any."""
+    with _uuid_cache_lock:
+        product_uuid = _uuid_cache.get(product_name)
+        if product_uuid is not None:
+            _uuid_cache.move_to_end(product_name)
+        return product_uuid
+
+
+def _cache_uuid(product_name: str, product_uuid: str) -> None:
+    """Remember an OData UUID, evicting the least recently used entry when full."""
+    with _uuid_cache_lock:
+        _uuid_cache[product_name] = product_uuid
+        _uuid_cache.move_to_end(product_name)
+        if len(_uuid_cache) > _UUID_CACHE_SIZE:
+            _uuid_cache.popitem(last=False)
+
+
+def _product_checksums(product: Product) -> list[Any]:
+    """Return the checksum entries of a product (STAC properties or OData)."""
+    checksums = product.properties.get("checksum", [])
+    if not checksums:
+        # Try to get from OData
+        checksums = product.raw.get("Checksum", [])
+    return checksums  # type: ignore[no-any-return]
+
+
+def _extract_md5(product: Product) -> Optional[str]:
+    """Find the MD5 checksum of a product.
+
+    The result (including None) is cached on the product as ``_md5``.
+
+    Args:
+        product: Product to inspect
+
+    Returns:
+        MD5 hex digest as published by CDSE, or None if there is none
+    """
+    try:
+        return product._md5  # type: ignore[attr-defined,no-any-return]
+    except AttributeError:
+        pass
+
+    md5_checksum = None
+    for cs in _product_checksums(product):
+        if isinstance(cs, dict):
+            if cs.get("Algorithm", "").upper() == "MD5":
+                md5_checksum = cs.get("Value")
+                break
+        elif isinstance(cs, str):
+            # Assume it's MD5 if just a string
+            md5_checksum = cs
+            break
+
+    product._md5 = md5_checksum  # type: ignore[attr-defined]
+    return md5_checksum
+
+
+def _get_odata_uuid(product: Product) -> Optional[str]:
+    """Get the OData UUID cached on a product, or None if not resolved yet."""
+    return getattr(product, "_odata_uuid", None)
+
+
+def _set_odata_uuid(product: Product, product_uuid: str) -> None:
+    """Cache a product's resolved OData UUID on the product."""
+    product._odata_uuid = product_uuid  # type: ignore[attr-defined]
+
+
+def _cumulative_progress(
+    callback: Callable[[int, int], None], total_size: int, downloaded: int = 0
+) -> Callable[[int], None]:
+    """Adapt a ``callback(downloaded, total)`` to receive per-chunk byte counts."""
+
+    def report(chunk_len: int) -> None:
+        nonlocal downloaded
+        downloaded += chunk_len
+        callback(downloaded, total_size)
+
+    return report
+
+
+def _preallocate(f: Any, size: int) -> None:
+    """Reserve disk space for a file that is about to be written sequentially.
+
+    Allocating the full size up front lets the filesystem lay the file out in
+    few extents instead of growing it chunk by chunk. This is a no-op where
+    ``posix_fallocate`` is unavailable or unsupported by the filesystem.
+
+    Args:
+        f: Open, empty file object
+        size: Expected final size in bytes
+    """
+    if not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+    except OSError as e:
+        logger.debug("Could not preallocate %d bytes: %s", size, e)
+
+
+def _drop_page_cache(f: Any) -> None:
+    """Write a file's data to disk and evict it from the page cache.
+
+    Only clean pages can be dropped, so the data is synced first. This is a
+    no-op on platforms without ``posix_fadvise``.
+
+    Args:
+        f: Open file object that has just been fully written
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    f.flush()
+    fd = f.fileno()
+    os.fdatasync(fd)
+    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _new_hasher(algorithm: str) -> Any:
+    """Create a hash object for a hashlib algorithm name or ``blake3``."""
+    if algorithm.lower() == "blake3":
+        try:
+            from blake3 import blake3
+        except ImportError as e:
+            raise ImportError(
+                "blake3 is required for BLAKE3 checksums. Install with: pip install blake3"
+            ) from e
+        return blake3()
+    return hashlib.new(algorithm)
 
 
 class Downloader:
@@ -41,20 +225,25 @@ class Downloader:
         self,
         session: requests.Session,
         output_dir: str = ".",
-        chunk_size: int = 131072,  # 128KB - much faster than default 8KB
+        chunk_size: int = 1024 * 1024,  # 1MB - far fewer per-chunk dispatches than 8KB
         max_workers: int = 4,
         timeout: int = 60,
         max_retries: int = 3,
+        drop_page_cache: bool = False,
     ):
         """Initialize the downloader.
 
         Args:
             session: Authenticated requests session (with Bearer token)
             output_dir: Default directory for downloaded files
-            chunk_size: Size of download chunks in bytes (default: 128KB)
+            chunk_size: Size of download chunks in bytes (default: 1MB). Sets both
+                the urllib3 read size and the granularity of the write loop.
             max_workers: Maximum number of parallel downloads
             timeout: Request timeout in seconds (default: 60)
             max_retries: Maximum number of retries for transient errors (default: 3)
+            drop_page_cache: Flush each finished download to disk and evict it
+                from the page cache (Linux), so bulk downloads that are not
+                read again do not crowd out other cached data
         """
         self.session = session
         self.output_dir = Path(output_dir)
@@ -62,10 +251,38 @@ class Downloader:
         self.max_workers = max_workers
         self.timeout = timeout
         self.max_retries = max_retries
+        self.drop_page_cache = drop_page_cache
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+    def _ensure_pool_size(self, workers: int) -> None:
+        """Grow the session's HTTPS connection pool for a number of workers.
+
+        Keeps enough pooled keep-alive connections per host for every parallel
+        worker, so TLS handshakes are not repeated for each product. A plain
+        HTTPAdapter is only replaced when it is too small, keeping its retry
+        and pool settings; custom adapters are left untouched.
+
+        Args:
+            workers: Number of threads that will share the session
+        """
+        pool_size = workers * 2
+        adapter = self.session.get_adapter("https://")
+        if type(adapter) is not HTTPAdapter:
+            return
+        if adapter._pool_maxsize >= pool_size:  # type: ignore[attr-defined]
+            return
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=adapter._pool_connections,  # type: ignore[attr-defined]
+                pool_maxsize=pool_size,
+                max_retries=adapter.max_retries,
+                pool_block=adapter._pool_block,  # type: ignore[attr-defined]
+            ),
+        )
+
     def _request_with_retry(
         self,
         method: str,
@@ -91,13 +308,14 @@ class Downloader:
         """
         kwargs.setdefault("timeout", self.timeout)
         last_exception: Optional[Exception] = None
+        send = getattr(self.session, method)
 
         for attempt in range(self.max_retries):
             try:
-                response = getattr(self.session, method)(url, **kwargs)
+                response = send(url, **kwargs)
 
                 if response.status_code in _RETRYABLE_STATUS_CODES:
-                    wait = 2**attempt
+                    wait = _BACKOFF[min(attempt, len(_BACKOFF) - 1)]
                     logger.warning(
                         "Request to %s returned %d, retrying in %ds (attempt %d/%d)",
                         url[:80],
@@ -114,7 +332,7 @@ class Downloader:
 
             except requests.exceptions.ConnectionError as e:
                 last_exception = e
-                wait = 2**attempt
+                wait = _BACKOFF[min(attempt, len(_BACKOFF) - 1)]
                 logger.warning(
                     "Connection error for %s, retrying in %ds (attempt %d/%d): %s",
                     url[:80],
@@ -148,7 +366,8 @@ class Downloader:
             output_dir: Override output directory
             filename: Custom filename (default: product_id.zip)
             progress: Show progress bar (default: True)
-            progress_callback: Optional callback(downloaded, total) for progress
+            progress_callback: Optional callback(downloaded, total) for progress.
+                When given, no progress bar is shown.
             skip_existing: Skip download if file already exists (default: True)
 
         Returns:
@@ -157,6 +376,42 @@ class Downloader:
         Raises:
             DownloadError: If download fails
         """
+        path, _ = self._download(
+            product,
+            output_dir=output_dir,
+            filename=filename,
+            progress=progress,
+            progress_callback=progress_callback,
+            skip_existing=skip_existing,
+        )
+        return path
+
+    def _download(
+        self,
+        product: Product,
+        output_dir: Optional[str] = None,
+        filename: Optional[str] = None,
+        progress: bool = True,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        skip_existing: bool = True,
+        hash_algorithm: Optional[str] = None,
+    ) -> tuple[Path, Optional[str]]:
+        """Download a single product, optionally hashing it while streaming.
+
+        Args:
+            product: Product to download
+            output_dir: Override output directory
+            filename: Custom filename (default: product_id.zip)
+            progress: Show progress bar
+            progress_callback: Optional callback(downloaded, total) for progress
+            skip_existing: Skip download if file already exists
+            hash_algorithm: hashlib algorithm computed over the streamed bytes,
+                so the file does not have to be read back for verification
+
+        Returns:
+            Tuple of (path, hex digest). The digest is None when no algorithm was
+            requested or when an existing file was skipped.
+        """
         # Determine output path
         out_dir = Path(output_dir) if output_dir else self.output_dir
         out_dir.mkdir(parents=True, exist_ok=True)
@@ -165,76 +420,245 @@ class Downloader:
             filename = f"{product.name}.zip"
 
         output_path = out_dir / filename
+        # Data is streamed into a sidecar and only renamed once complete, so a
+        # file at output_path is never a partial download
+        part_path = output_path.with_name(output_path.name + ".part")
 
-        # Skip if already exists
-        if skip_existing and output_path.exists():
-            return output_path
+        # A file matching the size in the product metadata is complete; skip it
+        # without resolving the URL or opening a connection
+        local_size = output_path.stat().st_size if output_path.exists() else None
+        if skip_existing and local_size is not None and local_size == product.size:
+            return output_path, None
 
         # Get download URL
         download_url = self._get_download_url(product)
         if not download_url:
+            # Like a failed HEAD: the remote size is unknown, so keep the file
+            if skip_existing and local_size is not None:
+                return output_path, None
             raise DownloadError(
                 "Could not determine download URL for product",
                 product_id=product.id,
             )
 
+        # Otherwise skip only if the file matches the size reported by the server
+        if skip_existing and local_size is not None:
+            remote_size = self._get_remote_size(download_url)
+            if remote_size is None or remote_size == local_size:
+                return output_path, None
+
+            logger.warning(
+                "Existing file %s is incomplete (%d of %d bytes), downloading again",
+                output_path.name,
+                local_size,
+                remote_size,
+            )
+            os.replace(output_path, part_path)
+
         try:
-            # Stream download with retry
-            response = self._request_with_retry("get", download_url, stream=True)
-
-            # Get file size
-            total_size = int(response.headers.get("content-length", 0))
-
-            # Download with progress bar
-            downloaded = 0
-            with open(output_path, "wb") as f:
-                # Create progress bar that tracks bytes properly
-                pbar = None
-                if progress and total_size > 0:
-                    pbar = tqdm(
-                        total=total_size,
-                        unit="B",
-                        unit_scale=True,
+            # A connection dropped mid-transfer is resumed with a Range request
+            # from the bytes already in the .part file instead of restarting
+            for attempt in range(self.max_retries):
+                try:
+                    digest = self._stream_to_part(
+                        download_url,
+                        part_path,
                         desc=filename[:50],
+                        progress=progress,
+                        progress_callback=progress_callback,
+                        hash_algorithm=hash_algorithm,
                     )
+                    break
+                except _RESUMABLE_ERRORS as e:
+                    if attempt + 1 >= self.max_retries:
+                        raise
+                    wait = _BACKOFF[min(attempt, len(_BACKOFF) - 1)]
+                    logger.warning(
+                        "Download of %s interrupted, resuming in %ds (attempt %d/%d): %s",
+                        filename,
+                        wait,
+                        attempt + 1,
+                        self.max_retries,
+                        e,
+                    )
+                    time.sleep(wait)
 
-                for chunk in response.iter_content(chunk_size=self.chunk_size):
-                    if chunk:
-                        f.write(chunk)
-                        chunk_len = len(chunk)
-                        downloaded += chunk_len
-
-                        if pbar:
-                            pbar.update(chunk_len)
-
-                        if progress_callback:
-                            progress_callback(downloaded, total_size)
-
-                if pbar:
-                    pbar.close()
-
-            return output_path
+            os.replace(part_path, output_path)
+            return output_path, digest
 
+        # The .part file is kept on failure so an interrupted download is never
+        # mistaken for a complete one and is resumed by the next attempt
         except requests.exceptions.HTTPError as e:
-            # Clean up partial file
-            if output_path.exists():
-                output_path.unlink()
             raise DownloadError(
                 f"Download failed: {e.response.status_code} - {e.response.text}",
                 product_id=product.id,
             ) from e
         except Exception as e:
-            if output_path.exists():
-                output_path.unlink()
             raise DownloadError(f"Download error: {e}", product_id=product.id) from e
 
+    def _stream_to_part(
+        self,
+        url: str,
+        part_path: Path,
+        desc: str,
+        progress: bool,
+        progress_callback: Optional[Callable[[int, int], None]],
+        hash_algorithm: Optional[str],
+    ) -> Optional[str]:
+        """Stream a download into its .part file, resuming from existing bytes.
+
+        If the .part file is not empty, only the missing bytes are requested
+        with a ``Range`` header. A server that ignores the range (200) or
+        cannot satisfy it (416) causes a restart from byte 0.
+
+        Args:
+            url: Download URL
+            part_path: Sidecar file receiving the data
+            desc: Progress bar label
+            progress: Show progress bar
+            progress_callback: Optional callback(downloaded, total) for progress
+            hash_algorithm: hashlib algorithm computed over the whole file
+
+        Returns:
+            Hex digest of the complete file, or None if no algorithm was given
+        """
+        # Products are already compressed; ask for the bytes as stored
+        headers = {"Accept-Encoding": "identity"}
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+
+        try:
+            response = self._request_with_retry("get", url, stream=True, headers=headers)
+        except requests.exceptions.HTTPError as e:
+            if not offset or e.response is None or e.response.status_code != 416:
+                raise
+            # The partial file does not fit the remote one; start over
+            offset = 0
+            del headers["Range"]
+            response = self._request_with_retry("get", url, stream=True, headers=headers)
+
+        if offset and response.status_code == 206:
+            logger.info("Resuming %s from byte %d", desc, offset)
+        else:
+            offset = 0
+
+        # Content-Length covers only the requested range
+        total_size = int(response.headers.get("content-length", 0))
+        if total_size:
+            total_size += offset
+
+        hasher = _new_hasher(hash_algorithm) if hash_algorithm else None
+        if hasher and offset:
+            with open(part_path, "rb") as existing:
+                while data := existing.read(_HASH_BUFFER_SIZE):
+                    hasher.update(data)
+
+        raw = response.raw
+        raw.decode_content = True
+
+        # Download with progress bar
+        mode = "r+b" if offset else "wb"
+        with open(part_path, mode, buffering=max(self.chunk_size, _WRITE_BUFFER_SIZE)) as f:
+            f.seek(offset)
+
+            # Create progress bar that tracks bytes properly
+            # A progress_callback replaces the terminal progress bar
+            pbar = None
+            if progress and total_size > 0 and progress_callback is None:
+                pbar = tqdm(
+                    total=total_size,
+                    initial=offset,
+                    unit="B",
+                    unit_scale=True,
+                    desc=desc,
+                )
+
+            if total_size > 0:
+                _preallocate(f, total_size)
+
+            try:
+                if pbar is None and progress_callback is None and hasher is None:
+                    # Nothing observes individual chunks (e.g. parallel mode),
+                    # so let shutil drive the read/write loop
+                    shutil.copyfileobj(raw, f, length=self.chunk_size)
+                else:
+                    # Read straight from the urllib3 stream into one reusable
+                    # buffer instead of a new bytes object per chunk
+                    buf = memoryview(bytearray(self.chunk_size))
+                    readinto = raw.readinto
+                    write = f.write
+                    hash_update = hasher.update if hasher else None
+                    # Resolve progress reporting once instead of per chunk
+                    report: Optional[Callable[[int], Any]] = (
+                        pbar.update
+                        if pbar
+                        else _cumulative_progress(progress_callback, total_size, offset)
+                        if progress_callback
+                        else None
+                    )
+                    while True:
+                        chunk_len = readinto(buf)
+                        if not chunk_len:
+                            break
+
+                        chunk = buf[:chunk_len]
+                        write(chunk)
+                        if hash_update:
+                            hash_update(chunk)
+                        if report:
+                            report(chunk_len)
+            finally:
+                # Release preallocated space beyond the bytes received
+                f.truncate()
+                if pbar:
+                    pbar.close()
+
+            if self.drop_page_cache:
+                _drop_page_cache(f)
+
+        return hasher.hexdigest() if hasher else None
+
+    def _get_remote_size(self, url: str) -> Optional[int]:
+        """Get the size of a remote file with a HEAD request.
+
+        Args:
+            url: Download URL
+
+        Returns:
+            Content-Length in bytes, or None if it cannot be determined
+        """
+        try:
+            response = self._request_with_retry("head", url, allow_redirects=True)
+            return int(response.headers["content-length"])
+        except (requests.exceptions.RequestException, KeyError, TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _is_complete(product: Product, out_dir: Path) -> bool:
+        """Check whether a product's file exists with the size in its metadata.
+
+        Args:
+            product: Product to check
+            out_dir: Directory holding ``<product.name>.zip``
+
+        Returns:
+            True if the file exists and matches ``product.size``
+        """
+        if product.size is None:
+            return False
+        try:
+            return (out_dir / f"{product.name}.zip").stat().st_size == product.size
+        except OSError:
+            return False
+
     def download_all(
         self,
         products: list[Product],
         output_dir: Optional[str] = None,
         skip_existing: bool = True,
         progress: bool = True,
-        parallel: bool = False,
+        parallel: Union[bool, str] = False,
         max_workers: Optional[int] = None,
     ) -> list[Path]:
         """Download multiple products.
@@ -244,12 +668,36 @@ class Downloader:
             output_dir: Override output directory
             skip_existing: Skip already downloaded products
             progress: Show progress bars
-            parallel: Enable parallel downloads
+            parallel: Enable parallel downloads. True uses a thread pool;
+                "async" runs all downloads on one asyncio event loop
+                (requires: pip install cdse-client[async])
             max_workers: Override max parallel workers (default: self.max_workers)
 
         Returns:
             List of paths to downloaded files
         """
+        # Products without a usable direct URL need an OData UUID; resolve
+        # them in a few batched queries instead of one query per product.
+        # Files already complete per their metadata size are skipped without a URL
+        out_dir = Path(output_dir) if output_dir else self.output_dir
+        self._prefetch_uuids(
+            [
+                p
+                for p in products
+                if (not p.download_url or p.download_url.startswith("s3://"))
+                and not (skip_existing and self._is_complete(p, out_dir))
+            ]
+        )
+
+        if parallel == "async":
+            return self._download_parallel_async(
+                products=products,
+                output_dir=output_dir,
+                skip_existing=skip_existing,
+                progress=progress,
+                max_workers=max_workers,
+            )
+
         if parallel:
             return self._download_parallel(
                 products=products,
@@ -262,20 +710,23 @@ class Downloader:
         # Sequential download
         downloaded_files = []
 
-        for idx, product in enumerate(products, 1):
-            logger.info("[%d/%d] Downloading: %s", idx, len(products), product.name)
+        # One aggregated bar that advances per product; per-file byte bars nest below it
+        with tqdm(total=len(products), desc="Downloading", disable=not progress) as pbar:
+            for idx, product in enumerate(products, 1):
+                logger.info("[%d/%d] Downloading: %s", idx, len(products), product.name)
 
-            try:
-                path = self.download(
-                    product=product,
-                    output_dir=output_dir,
-                    progress=progress,
-                    skip_existing=skip_existing,
-                )
-                downloaded_files.append(path)
-            except DownloadError as e:
-                logger.error("  Error downloading %s: %s", product.name, e.message)
-                continue
+                try:
+                    path = self.download(
+                        product=product,
+                        output_dir=output_dir,
+                        progress=progress,
+                        skip_existing=skip_existing,
+                    )
+                    downloaded_files.append(path)
+                except DownloadError as e:
+                    logger.warning("Download failed for %s: %s", product.name, e.message)
+                finally:
+                    pbar.update(1)
 
         return downloaded_files
 
@@ -300,6 +751,7 @@ class Downloader:
             List of paths to downloaded files
         """
         workers = max_workers or self.max_workers
+        self._ensure_pool_size(workers)
         downloaded_files: list[Path] = []
         failed: list[tuple[str, str]] = []
 
@@ -309,14 +761,42 @@ class Downloader:
             workers,
         )
 
+        # One byte counter shared by all workers; the total is only known when
+        # every product reports its size
+        sizes = [p.size for p in products if p.size]
+        byte_pbar = tqdm(
+            total=sum(sizes) if len(sizes) == len(products) else None,
+            unit="B",
+            unit_scale=True,
+            desc="Bytes",
+            position=1,
+            disable=not progress,
+        )
+        byte_lock = threading.Lock()
+
+        def byte_progress() -> Optional[Callable[[int, int], None]]:
+            """Create a per-download callback feeding the shared byte counter."""
+            if not progress:
+                return None
+            last = 0
+
+            def callback(downloaded: int, _total: int) -> None:
+                nonlocal last
+                with byte_lock:
+                    byte_pbar.update(downloaded - last)
+                last = downloaded
+
+            return callback
+
         def download_one(product: Product) -> tuple[Optional[Path], Optional[str]]:
             """Download a single product, return (path, error)."""
             try:
-                # Disable individual progress bars in parallel mode
+                # Per-file bars are replaced by the shared byte counter
                 path = self.download(
                     product=product,
                     output_dir=output_dir,
                     progress=False,  # Disable per-file progress in parallel
+                    progress_callback=byte_progress(),
                     skip_existing=skip_existing,
                 )
                 return (path, None)
@@ -325,12 +805,14 @@ class Downloader:
             except Exception as e:
                 return (None, f"{product.name}: {str(e)}")
 
-        with ThreadPoolExecutor(max_workers=workers) as executor:
+        with ThreadPoolExecutor(max_workers=workers) as executor, byte_pbar:
             # Submit all tasks
             future_to_product = {executor.submit(download_one, p): p for p in products}
 
             # Show overall progress bar
-            with tqdm(total=len(products), desc="Downloading", disable=not progress) as pbar:
+            with tqdm(
+                total=len(products), desc="Downloading", position=0, disable=not progress
+            ) as pbar:
                 for future in as_completed(future_to_product):
                     product = future_to_product[future]
                     path, error = future.result()
@@ -351,6 +833,227 @@ class Downloader:
         logger.info("Successfully downloaded: %d/%d", len(downloaded_files), len(products))
         return downloaded_files
 
+    def _download_parallel_async(
+        self,
+        products: list[Product],
+        output_dir: Optional[str] = None,
+        skip_existing: bool = True,
+        progress: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> list[Path]:
+        """Download products concurrently on a single asyncio event loop.
+
+        All downloads share one aiohttp connection pool, so TLS sessions and
+        keep-alive connections are reused instead of being held per thread.
+        Must not be called from within a running event loop; use
+        :class:`cdse.async_client.CDSEClientAsync` there instead.
+
+        Args:
+            products: List of products to download
+            output_dir: Override output directory
+            skip_existing: Skip already downloaded products
+            progress: Show overall progress bar
+            max_workers: Number of concurrent downloads
+
+        Returns:
+            List of paths to downloaded files
+        """
+        try:
+            import aiofiles
+            import aiohttp
+        except ImportError as e:
+            raise ImportError(
+                "aiohttp and aiofiles are required for async downloads. "
+                "Install with: pip install cdse-client[async]"
+            ) from e
+
+        workers = max_workers or self.max_workers
+        out_dir = Path(output_dir) if output_dir else self.output_dir
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        # URL resolution may hit the OData catalog; do it up front with the
+        # synchronous session. Existing files are kept on the same terms as
+        # download(): complete per metadata size, or no URL to check against
+        downloaded_files: list[Path] = []
+        jobs: list[tuple[Product, str]] = []
+        failed: list[str] = []
+        for product in products:
+            output_path = out_dir / f"{product.name}.zip"
+            if skip_existing and self._is_complete(product, out_dir):
+                downloaded_files.append(output_path)
+                continue
+            url = self._get_download_url(product)
+            if url:
+                jobs.append((product, url))
+            elif skip_existing and output_path.exists():
+                downloaded_files.append(output_path)
+            else:
+                failed.append(f"{product.name}: Could not determine download URL for product")
+
+        logger.info(
+            "Starting async download of %d products with %d concurrent downloads...",
+            len(jobs),
+            workers,
+        )
+
+        async def request(
+            session: "aiohttp.ClientSession", method: str, url: str, headers: dict[str, str]
+        ) -> "aiohttp.ClientResponse":
+            # Like _request_with_retry: back off on transient statuses. The
+            # token is read per request so downloads queued past its lifetime
+            # get a refreshed one; the refresh blocks the loop only briefly
+            attempt = 0
+            while True:
+                authorization = self._authorization()
+                if authorization:
+                    headers = {**headers, "Authorization": authorization}
+                response = await session.request(method, url, headers=headers)
+                attempt += 1
+                if response.status not in _RETRYABLE_STATUS_CODES or attempt >= self.max_retries:
+                    return response
+                response.release()
+                wait = _BACKOFF[min(attempt - 1, len(_BACKOFF) - 1)]
+                logger.warning(
+                    "Request to %s returned %d, retrying in %ds (attempt %d/%d)",
+                    url[:80],
+                    response.status,
+                    wait,
+                    attempt,
+                    self.max_retries,
+                )
+                await asyncio.sleep(wait)
+
+        async def remote_size(session: "aiohttp.ClientSession", url: str) -> Optional[int]:
+            try:
+                async with await request(session, "HEAD", url, {}) as head:
+                    return head.content_length if head.status == 200 else None
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                return None
+
+        async def stream_to_part(
+            session: "aiohttp.ClientSession", product: Product, url: str, part_path: Path
+        ) -> None:
+            # Same resume rules as _stream_to_part: request the missing bytes
+            # and restart from byte 0 on 200 (range ignored) or 416
+            offset = part_path.stat().st_size if part_path.exists() else 0
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+            response = await request(session, "GET", url, headers)
+            if offset and response.status == 416:
+                response.release()
+                offset = 0
+                response = await request(session, "GET", url, {})
+
+            async with response:
+                if response.status not in (200, 206):
+                    raise DownloadError(
+                        f"Download failed: {response.status} - {await response.text()}",
+                        product_id=product.id,
+                    )
+                if offset and response.status == 206:
+                    logger.info("Resuming %s from byte %d", product.name, offset)
+                else:
+                    offset = 0
+
+                async with aiofiles.open(part_path, "ab" if offset else "wb") as f:
+                    async for chunk in response.content.iter_chunked(self.chunk_size):
+                        await f.write(chunk)
+
+        async def download_one(
+            session: "aiohttp.ClientSession",
+            semaphore: asyncio.Semaphore,
+            product: Product,
+            url: str,
+        ) -> Path:
+            output_path = out_dir / f"{product.name}.zip"
+            part_path = output_path.with_name(output_path.name + ".part")
+
+            async with semaphore:
+                if skip_existing and output_path.exists():
+                    local_size = output_path.stat().st_size
+                    size = await remote_size(session, url)
+                    if size is None or size == local_size:
+                        return output_path
+
+                    logger.warning(
+                        "Existing file %s is incomplete (%d of %d bytes), downloading again",
+                        output_path.name,
+                        local_size,
+                        size,
+                    )
+                    os.replace(output_path, part_path)
+
+                for attempt in range(self.max_retries):
+                    try:
+                        await stream_to_part(session, product, url, part_path)
+                        break
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        if attempt + 1 >= self.max_retries:
+                            raise DownloadError(
+                                f"Download error: {e}", product_id=product.id
+                            ) from e
+                        wait = _BACKOFF[min(attempt, len(_BACKOFF) - 1)]
+                        logger.warning(
+                            "Download of %s interrupted, resuming in %ds (attempt %d/%d): %s",
+                            product.name,
+                            wait,
+                            attempt + 1,
+                            self.max_retries,
+                            e,
+                        )
+                        await asyncio.sleep(wait)
+
+            os.replace(part_path, output_path)
+            return output_path
+
+        async def run() -> list[Union[Path, BaseException]]:
+            semaphore = asyncio.Semaphore(workers)
+            timeout = aiohttp.ClientTimeout(sock_connect=self.timeout, sock_read=self.timeout)
+            connector = aiohttp.TCPConnector(limit=workers)
+            async with aiohttp.ClientSession(
+                headers={"Accept-Encoding": "identity"}, timeout=timeout, connector=connector
+            ) as session:
+                tasks = [
+                    asyncio.ensure_future(download_one(session, semaphore, product, url))
+                    for product, url in jobs
+                ]
+                with tqdm(total=len(tasks), desc="Downloading", disable=not progress) as pbar:
+                    for task in tasks:
+                        task.add_done_callback(lambda _: pbar.update(1))
+                    return await asyncio.gather(*tasks, return_exceptions=True)
+
+        for (product, _url), result in zip(jobs, asyncio.run(run())):
+            if isinstance(result, Path):
+                downloaded_files.append(result)
+            elif isinstance(result, DownloadError):
+                failed.append(f"{product.name}: {result.message}")
+            else:
+                failed.append(f"{product.name}: {result}")
+
+        # Report failures
+        if failed:
+            logger.warning("Failed downloads (%d):", len(failed))
+            for error in failed:
+                logger.warning("  - %s", error)
+
+        logger.info("Successfully downloaded: %d/%d", len(downloaded_files), len(products))
+        return downloaded_files
+
+    def _authorization(self) -> Optional[str]:
+        """Get the session's Authorization header, refreshing an expired token.
+
+        Sessions from :meth:`OAuth2Auth.get_bearer_session` refresh their token
+        before each request; this applies the same check for requests sent
+        through another HTTP client.
+
+        Returns:
+            Authorization header value, or None if the session has none
+        """
+        refresh = getattr(self.session, "refresh_if_expired", None)
+        if refresh is not None:
+            refresh()
+        authorization = self.session.headers.get("Authorization")
+        return str(authorization) if authorization else None
+
     def _get_download_url(self, product: Product) -> Optional[str]:
         """Get the download URL for a product.
 
@@ -360,44 +1063,106 @@ class Downloader:
         Returns:
             Download URL or None if not found
         """
-        # Check cache first (stored as _odata_uuid on product)
-        if hasattr(product, "_odata_uuid") and product._odata_uuid:
-            return f"{self.ODATA_URL}({product._odata_uuid})/$value"
+        # Fast path: cached UUID or direct asset URL, no network involved
+        odata_uuid = _get_odata_uuid(product)
+        if odata_uuid:
+            return f"{self.ODATA_URL}({odata_uuid})/$value"
 
-        # Check if product has direct download URL (but not S3 URLs)
-        if product.download_url:
-            url = product.download_url
-            # Skip S3 URLs - they require different authentication
-            if not url.startswith("s3://"):
-                return url
+        # Skip S3 URLs - they require different authentication
+        url = product.download_url
+        if url and not url.startswith("s3://"):
+            return url
 
         # Query OData catalog to get UUID and build proper download URL
-        try:
-            product_name = product.name
+        product_uuid = self._lookup_odata_uuid(product)
+        if product_uuid:
+            return f"{self.ODATA_URL}({product_uuid})/$value"
+        return None
 
-            # Ensure .SAFE suffix for exact match (OData stores with .SAFE)
-            if not product_name.endswith(".SAFE"):
-                product_name = f"{product_name}.SAFE"
+    def _lookup_odata_uuid(self, product: Product) -> Optional[str]:
+        """Resolve a product's OData UUID by exact name match.
 
-            # Use exact Name match - 60x FASTER than contains() or startswith()!
-            # contains(): ~25s, startswith(): ~20s, Name eq: ~0.5s
-            query_url = f"{self.CATALOG_URL}?$filter=Name eq '{product_name}'"
+        The UUID is cached on the product as ``_odata_uuid`` and in a
+        process-wide LRU cache keyed by product name.
 
-            response = self._request_with_retry("get", query_url)
+        Args:
+            product: Product to look up
 
-            data = response.json()
-            if data.get("value") and len(data["value"]) > 0:
-                product_uuid = data["value"][0].get("Id")
-                if product_uuid:
-                    # Cache the UUID on the product for future use
-                    product._odata_uuid = product_uuid
-                    return f"{self.ODATA_URL}({product_uuid})/$value"
+        Returns:
+            OData UUID or None if not found or the request failed
+        """
+        # Ensure .SAFE suffix for exact match (OData stores with .SAFE)
+        product_name = _odata_name(product.name)
 
-            return None
+        product_uuid = _get_cached_uuid(product_name)
+        if product_uuid:
+            _set_odata_uuid(product, product_uuid)
+            return product_uuid
+
+        # Use exact Name match - 60x FASTER than contains() or startswith()!
+        # contains(): ~25s, startswith(): ~20s, Name eq: ~0.5s
+        query_url = f"{self.CATALOG_URL}?$filter=Name eq '{product_name}'"
 
+        try:
+            response = self._request_with_retry("get", query_url)
+            data = _json_loads(response.content)
         except Exception:
             return None
 
+        items = data.get("value")
+        if not items:
+            return None
+
+        product_uuid = items[0].get("Id")
+        if product_uuid:
+            # Cache the UUID on the product for future use
+            _set_odata_uuid(product, product_uuid)
+            _cache_uuid(product_name, product_uuid)
+        return product_uuid  # type: ignore[no-any-return]
+
+    def _prefetch_uuids(self, products: list[Product]) -> None:
+        """Resolve the OData UUIDs of many products with batched catalog queries.
+
+        Names are combined into ``Name eq 'A' or Name eq 'B' ...`` filters of
+        up to ``_UUID_BATCH_SIZE`` products, so N lookups cost N/20 round-trips
+        instead of N. Products that are not found (or batches that fail) are
+        simply left for the per-product lookup.
+
+        Args:
+            products: Products whose UUIDs will be needed
+        """
+        pending: dict[str, list[Product]] = {}
+        for product in products:
+            if _get_odata_uuid(product):
+                continue
+            product_name = _odata_name(product.name)
+            product_uuid = _get_cached_uuid(product_name)
+            if product_uuid:
+                _set_odata_uuid(product, product_uuid)
+            else:
+                pending.setdefault(product_name, []).append(product)
+
+        names = list(pending)
+        for start in range(0, len(names), _UUID_BATCH_SIZE):
+            batch = names[start : start + _UUID_BATCH_SIZE]
+            name_filter = " or ".join(f"Name eq '{name}'" for name in batch)
+            query_url = f"{self.CATALOG_URL}?$filter={name_filter}&$top={len(batch)}"
+
+            try:
+                response = self._request_with_retry("get", query_url)
+                data = _json_loads(response.content)
+            except Exception as e:
+                logger.debug("Batched UUID lookup failed: %s", e)
+                continue
+
+            for item in data.get("value") or []:
+                product_name = item.get("Name")
+                product_uuid = item.get("Id")
+                if product_uuid and product_name in pending:
+                    _cache_uuid(product_name, product_uuid)
+                    for product in pending[product_name]:
+                        _set_odata_uuid(product, product_uuid)
+
     def get_product_info(self, product_id: str) -> dict[str, Any]:
         """Get detailed information about a product.
 
@@ -414,7 +1179,7 @@ class Downloader:
 
         try:
             response = self._request_with_retry("get", url)
-            return response.json()
+            return cast(dict[str, Any], _json_loads(response.content))
         except requests.exceptions.HTTPError as e:
             raise DownloadError(
                 f"Failed to get product info: {e.response.status_code}",
@@ -431,11 +1196,13 @@ class Downloader:
         Returns:
             Formatted string (e.g., "1.23 GB")
         """
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} PB"
+        size_bytes = int(size_bytes)
+        if size_bytes <= 0:
+            return f"{size_bytes:.2f} B"
+
+        # Pick the unit directly from the bit length: each unit spans 10 bits
+        idx = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (10 * idx)):.2f} {_SIZE_UNITS[idx]}"
 
     def verify_checksum(
         self,
@@ -448,7 +1215,7 @@ class Downloader:
         Args:
             file_path: Path to file to verify
             expected_checksum: Expected checksum value
-            algorithm: Hash algorithm (md5, sha256, sha1)
+            algorithm: Hash algorithm (md5, sha256, sha1, blake3)
 
         Returns:
             True if checksum matches, False otherwise
@@ -456,13 +1223,7 @@ class Downloader:
         if not file_path.exists():
             return False
 
-        hash_func = hashlib.new(algorithm)
-
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hash_func.update(chunk)
-
-        computed = hash_func.hexdigest()
+        computed = self.calculate_checksum(file_path, algorithm)
         return computed.lower() == expected_checksum.lower()
 
     def download_with_checksum(
@@ -486,55 +1247,39 @@ class Downloader:
         Raises:
             DownloadError: If download or checksum verification fails
         """
-        # Download the file
-        path = self.download(
-            product=product,
-            output_dir=output_dir,
-            progress=progress,
-        )
+        md5_checksum = _extract_md5(product)
 
-        # Get checksum from product properties
-        checksums = product.properties.get("checksum", [])
-        if not checksums:
-            # Try to get from OData
-            checksums = product.raw.get("Checksum", [])
-
-        if not checksums:
-            logger.warning("No checksum available for %s", product.name)
-            return path
-
-        # Find MD5 checksum
-        md5_checksum = None
-        for cs in checksums:
-            if isinstance(cs, dict):
-                if cs.get("Algorithm", "").upper() == "MD5":
-                    md5_checksum = cs.get("Value")
-                    break
-            elif isinstance(cs, str):
-                # Assume it's MD5 if just a string
-                md5_checksum = cs
-                break
-
-        if not md5_checksum:
-            logger.warning("No MD5 checksum found for %s", product.name)
-            return path
-
-        # Verify checksum
-        if self.verify_checksum(path, md5_checksum, "md5"):
-            logger.info("✓ Checksum verified: %s", product.name)
-            return path
-
-        # Checksum mismatch
-        if retry_on_mismatch:
-            logger.warning("✗ Checksum mismatch, retrying: %s", product.name)
-            path.unlink()
-            return self.download_with_checksum(
-                product=product,
+        attempts = 2 if retry_on_mismatch else 1
+        for attempt in range(attempts):
+            # Download the file, hashing it on the fly when there is something to verify
+            path, digest = self._download(
+                product,
                 output_dir=output_dir,
                 progress=progress,
-                retry_on_mismatch=False,  # Only retry once
+                hash_algorithm="md5" if md5_checksum else None,
             )
 
+            if not md5_checksum:
+                if _product_checksums(product):
+                    logger.warning("No MD5 checksum found for %s", product.name)
+                else:
+                    logger.warning("No checksum available for %s", product.name)
+                return path
+
+            # An existing file was skipped, so it has to be hashed from disk
+            if digest is None:
+                digest = self.calculate_checksum(path, "md5")
+
+            # Verify checksum
+            if digest.lower() == md5_checksum.lower():
+                logger.info("✓ Checksum verified: %s", product.name)
+                return path
+
+            # Checksum mismatch: discard the file and download it once more
+            if attempt + 1 < attempts:
+                logger.warning("✗ Checksum mismatch, retrying: %s", product.name)
+                path.unlink()
+
         raise DownloadError(
             f"Checksum verification failed for {product.name}",
             product_id=product.id,
@@ -547,20 +1292,36 @@ class Downloader:
     ) -> str:
         """Calculate checksum of a file.
 
+        CDSE publishes MD5 checksums; ``blake3`` (requires the ``blake3``
+        package) is much faster and suited to local integrity tracking.
+
         Args:
             file_path: Path to file
-            algorithm: Hash algorithm (md5, sha256, sha1)
+            algorithm: Hash algorithm (md5, sha256, sha1, blake3)
 
         Returns:
             Hexadecimal checksum string
         """
-        hash_func = hashlib.new(algorithm)
+        hash_func = _new_hasher(algorithm)
 
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hash_func.update(chunk)
+            if os.fstat(f.fileno()).st_size == 0:
+                return hash_func.hexdigest()  # type: ignore[no-any-return]
 
-        return hash_func.hexdigest()
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Not mappable: fall back to buffered reads
+                for chunk in iter(lambda: f.read(_HASH_BUFFER_SIZE), b""):
+                    hash_func.update(chunk)
+            else:
+                # Hash straight from the page cache in one call (GIL released)
+                with mm:
+                    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hash_func.update(mm)
+
+        return hash_func.hexdigest()  # type: ignore[no-any-return]
 
     def download_quicklook(
         self,
@@ -593,20 +1354,17 @@ class Downloader:
         if output_path.exists():
             return output_path
 
-        # Get product UUID first
-        if hasattr(product, "_odata_uuid") and product._odata_uuid:
-            product_uuid = product._odata_uuid
-        else:
-            # Need to look up UUID via OData
-            product_name = product.name
-            if not product_name.endswith(".SAFE"):
-                product_name = f"{product_name}.SAFE"
+        # Get product UUID first, from the product or the shared cache
+        product_name = _odata_name(product.name)
+        product_uuid = _get_odata_uuid(product) or _get_cached_uuid(product_name)
 
+        if not product_uuid:
+            # Need to look up UUID via OData
             query_url = f"{self.CATALOG_URL}?$filter=Name eq '{product_name}'"
 
             try:
                 response = self._request_with_retry("get", query_url)
-                data = response.json()
+                data = _json_loads(response.content)
 
                 if not data.get("value") or len(data["value"]) == 0:
                     raise DownloadError(
@@ -621,8 +1379,9 @@ class Downloader:
                         product_id=product.id,
                     )
 
-                # Cache UUID on product
-                product._odata_uuid = product_uuid
+                # Cache UUID on product and for other Downloader instances
+                _set_odata_uuid(product, product_uuid)
+                _cache_uuid(product_name, product_uuid)
 
             except requests.exceptions.RequestException as e:
                 raise DownloadError(
@@ -656,10 +1415,11 @@ class Downloader:
                     # Not an image; try next URL.
                     continue
 
-                with open(output_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+                # Streaming iter_content never yields empty chunks
+                with open(
+                    output_path, "wb", buffering=max(self.chunk_size, _WRITE_BUFFER_SIZE)
+                ) as f:
+                    f.writelines(response.iter_content(chunk_size=self.chunk_size))
 
                 # Basic sanity check: avoid returning an empty file
                 if output_path.stat().st_size == 0:
@@ -717,9 +1477,16 @@ class Downloader:
         downloaded_files: list[Path] = []
         failed: list[str] = []
 
+        out_dir = Path(output_dir) if output_dir else self.output_dir
+        self._prefetch_uuids(
+            [p for p in products if not (out_dir / f"{p.name}_quicklook.jpeg").exists()]
+        )
+
         if parallel:
             from concurrent.futures import ThreadPoolExecutor, as_completed
 
+            self._ensure_pool_size(max_workers)
+
             def download_one(product: Product) -> tuple[Optional[Path], Optional[str]]:
                 try:
                     path = self.download_quicklook(product, output_dir)
@@ -7,13 +7,124 @@ Optional dependency: geopy
 Install with: pip install cdse-client[geo] or pip install geopy
 """
 
+import functools
 import math
-from typing import Optional
+from typing import Any, Optional
 
 # Type alias for bounding box (min_lon, min_lat, max_lon, max_lat)
 BBox = tuple[float, float, float, float]
 
 
+def _geocode(city_name: str, user_agent: str, timeout: float) -> Any:
+    """Geocode a place name, answering repeated queries from a cache.
+
+    Nominatim's usage policy asks clients to cache results. Names are
+    normalized (case and surrounding whitespace) and always requested with
+    address details, so bbox, center and info lookups of the same city share
+    one request.
+
+    Args:
+        city_name: Name of the city
+        user_agent: User agent string for Nominatim API.
+        timeout: Network timeout in seconds for geocoding requests.
+
+    Returns:
+        geopy ``Location``, or None if the place was not found.
+
+    Raises:
+        ImportError: If geopy is not installed.
+    """
+    return _cached_geocode(city_name.strip().lower(), user_agent, timeout)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_geocode(query: str, user_agent: str, timeout: float) -> Any:
+    """Uncached Nominatim lookup behind :func:`_geocode`."""
+    geocode = _get_geocoder(user_agent, timeout)
+    return geocode(query, exactly_one=True, addressdetails=True)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_geocoder(user_agent: str, timeout: float) -> Any:
+    """Get a shared, rate-limited Nominatim ``geocode`` callable.
+
+    One geolocator per (user_agent, timeout) keeps its HTTP session alive
+    across calls. The rate limiter spaces requests at least 1 s apart, as
+    Nominatim requires, and retries timeouts and unavailable errors twice.
+
+    Raises:
+        ImportError: If geopy is not installed.
+    """
+    try:
+        from geopy.extra.rate_limiter import RateLimiter
+        from geopy.geocoders import Nominatim
+    except ImportError as e:
+        raise ImportError(
+            "geopy is required for geocoding. "
+            "Install with: pip install cdse-client[geo] or pip install geopy"
+        ) from e
+
+    geolocator = Nominatim(
+        user_agent=user_agent,
+        timeout=timeout,
+        adapter_factory=lambda proxies, ssl_context: _get_adapter(),
+    )
+    return RateLimiter(
+        geolocator.geocode,
+        min_delay_seconds=1.0,
+        max_retries=2,
+        error_wait_seconds=2.0,
+        swallow_exceptions=False,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_adapter() -> Any:
+    """Get the geopy HTTP adapter shared by all Nominatim geolocators.
+
+    One ``requests`` session keeps TCP/TLS connections to Nominatim alive
+    across geolocators with different user agents or timeouts. Its urllib3
+    retry policy backs off on 429 and 5xx responses, honouring
+    ``Retry-After``, before geopy sees the error.
+    """
+    from geopy.adapters import RequestsAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=3,
+        backoff_factor=2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    return RequestsAdapter(
+        proxies=None,
+        ssl_context=None,
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=retry,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _buffer_degrees(lat: float, buffer_km: float) -> tuple[float, float]:
+    """Convert a buffer in km to (lat, lon) degrees at the given latitude.
+
+    Cached on the exact latitude, which repeats whenever the geocode cache
+    answers a lookup, so warm queries skip the trigonometry.
+    """
+    # Convert km to degrees (approximate)
+    # 1 degree latitude ≈ 111 km
+    # 1 degree longitude ≈ 111 km * cos(latitude)
+    return buffer_km / 111.0, buffer_km / (111.0 * math.cos(math.radians(lat)))
+
+
+def clear_geocode_cache() -> None:
+    """Forget all cached geocoding results and shared geocoder clients."""
+    _cached_geocode.cache_clear()
+    _get_geocoder.cache_clear()
+    _get_adapter.cache_clear()
+
+
 def get_city_bbox(
     city_name: str,
     buffer_km: float = 15.0,
@@ -46,35 +157,14 @@ def get_city_bbox(
         >>> print(bbox)
         (8.9, 45.3, 9.4, 45.6)
     """
-    try:
-        from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
-        from geopy.geocoders import Nominatim
-    except ImportError as e:
-        raise ImportError(
-            "geopy is required for geocoding. "
-            "Install with: pip install cdse-client[geo] or pip install geopy"
-        ) from e
-
-    geolocator = Nominatim(user_agent=user_agent, timeout=timeout)
-    location = None
-    for attempt in range(3):
-        try:
-            location = geolocator.geocode(city_name, exactly_one=True)
-            break
-        except (GeocoderTimedOut, GeocoderUnavailable):
-            if attempt >= 2:
-                raise
+    location = _geocode(city_name, user_agent, timeout)
 
     if not location:
         raise ValueError(f"City not found: {city_name}")
 
     lat, lon = location.latitude, location.longitude
 
-    # Convert km to degrees (approximate)
-    # 1 degree latitude ≈ 111 km
-    # 1 degree longitude ≈ 111 km * cos(latitude)
-    lat_buffer = buffer_km / 111.0
-    lon_buffer = buffer_km / (111.0 * math.cos(math.radians(lat)))
+    lat_buffer, lon_buffer = _buffer_degrees(lat, buffer_km)
 
     bbox = (
         round(lon - lon_buffer, 6),  # min_lon
@@ -86,6 +176,45 @@ def get_city_bbox(
     return bbox
 
 
+def get_city_bboxes(
+    city_names: list[str],
+    buffer_km: float = 15.0,
+    user_agent: str = "cdse-client",
+    timeout: float = 10.0,
+) -> dict[str, BBox]:
+    """
+    Get bounding boxes for several cities.
+
+    Nominatim allows one request per second, so lookups are issued
+    sequentially through the shared rate limiter; running them concurrently
+    would not finish any sooner. Cities that were geocoded before (by any
+    geocoding function) are answered from the cache without waiting.
+
+    Args:
+        city_names: Names of the cities, preferably with country
+        buffer_km: Buffer around each city center in kilometers.
+        user_agent: User agent string for Nominatim API.
+        timeout: Network timeout in seconds for geocoding requests.
+
+    Returns:
+        Dictionary mapping each given name to its
+        (min_lon, min_lat, max_lon, max_lat) bounding box.
+
+    Raises:
+        ImportError: If geopy is not installed.
+        ValueError: If a city is not found.
+
+    Example:
+        >>> bboxes = get_city_bboxes(["Milano, Italia", "Torino, Italia"])
+        >>> bboxes["Torino, Italia"]
+        (7.49, 44.93, 7.87, 45.20)
+    """
+    return {
+        name: get_city_bbox(name, buffer_km=buffer_km, user_agent=user_agent, timeout=timeout)
+        for name in dict.fromkeys(city_names)
+    }
+
+
 def get_city_center(
     city_name: str,
     user_agent: str = "cdse-client",
@@ -109,24 +238,7 @@ def get_city_center(
         >>> lon, lat = get_city_center("Roma, Italia")
         >>> print(f"Rome is at {lat:.2f}°N, {lon:.2f}°E")
     """
-    try:
-        from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
-        from geopy.geocoders import Nominatim
-    except ImportError as e:
-        raise ImportError(
-            "geopy is required for geocoding. "
-            "Install with: pip install cdse-client[geo] or pip install geopy"
-        ) from e
-
-    geolocator = Nominatim(user_agent=user_agent, timeout=timeout)
-    location = None
-    for attempt in range(3):
-        try:
-            location = geolocator.geocode(city_name, exactly_one=True)
-            break
-        except (GeocoderTimedOut, GeocoderUnavailable):
-            if attempt >= 2:
-                raise
+    location = _geocode(city_name, user_agent, timeout)
 
     if not location:
         raise ValueError(f"City not found: {city_name}")
@@ -157,24 +269,7 @@ def get_location_info(
         ImportError: If geopy is not installed.
         ValueError: If city is not found.
     """
-    try:
-        from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
-        from geopy.geocoders import Nominatim
-    except ImportError as e:
-        raise ImportError(
-            "geopy is required for geocoding. "
-            "Install with: pip install cdse-client[geo] or pip install geopy"
-        ) from e
-
-    geolocator = Nominatim(user_agent=user_agent, timeout=timeout)
-    location = None
-    for attempt in range(3):
-        try:
-            location = geolocator.geocode(city_name, exactly_one=True, addressdetails=True)
-            break
-        except (GeocoderTimedOut, GeocoderUnavailable):
-            if attempt >= 2:
-                raise
+    location = _geocode(city_name, user_agent, timeout)
 
     if not location:
         raise ValueError(f"City not found: {city_name}")
@@ -215,7 +310,11 @@ EUROPEAN_CITIES_BBOX = {
     "lisbon": (-9.230, 38.691, -9.080, 38.796),
 }
 
+# Both tables merged for a single lookup (Italian entries take precedence)
+_ALL_CITIES_BBOX: dict[str, BBox] = {**EUROPEAN_CITIES_BBOX, **ITALIAN_CITIES_BBOX}
+
 
+@functools.lru_cache(maxsize=512)
 def get_predefined_bbox(city_name: str) -> Optional[BBox]:
     """
     Get a pre-defined bounding box for a city (no geocoding required).
@@ -233,14 +332,4 @@ def get_predefined_bbox(city_name: str) -> Optional[BBox]:
         >>> if bbox:
         ...     print(f"Milan bbox: {bbox}")
     """
-    normalized = city_name.lower().strip()
-
-    # Check Italian cities first
-    if normalized in ITALIAN_CITIES_BBOX:
-        return ITALIAN_CITIES_BBOX[normalized]
-
-    # Check European cities
-    if normalized in EUROPEAN_CITIES_BBOX:
-        return EUROPEAN_CITIES_BBOX[normalized]
-
-    return None
+    return _ALL_CITIES_BBOX.get(city_name.lower().strip())
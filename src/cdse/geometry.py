@@ -6,11 +6,57 @@ These functions are designed to be compatible with sentinelsat's API.
 """
 
 import json
+import math
+import re
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
 
 from cdse.exceptions import ValidationError
 
+# Prefer orjson for parsing and serializing GeoJSON when it is installed
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+    _json_dumps: Callable[[Any], bytes] = orjson.dumps
+except ImportError:  # pragma: no cover - depends on optional dependency
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# ijson lets read_first_geometry stop after the first feature of large files
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    ijson = None
+
+# GeoJSON geometry object types
+_GEOMETRY_TYPES = frozenset(
+    {"Point", "LineString", "Polygon", "MultiPoint", "MultiLineString", "MultiPolygon"}
+)
+
+# Nesting depth of the position sequences for each geometry type
+_GEOMETRY_DEPTH = {
+    "Point": 0,
+    "MultiPoint": 1,
+    "LineString": 1,
+    "MultiLineString": 2,
+    "Polygon": 2,
+    "MultiPolygon": 3,
+}
+
+# Leading WKT type keyword; alternatives are ordered longest first so
+# "MULTIPOINT" is never taken for "POINT"
+_WKT_TYPE_RE = re.compile(
+    r"(MULTIPOLYGON|MULTILINESTRING|MULTIPOINT|LINESTRING|POLYGON|POINT)", re.IGNORECASE
+)
+# Innermost parenthesized group, e.g. one ring "(0 0, 1 0, 1 1, 0 0)"
+_WKT_RING_RE = re.compile(r"\(([^()]*)\)")
+# Group holding one level of nested rings, e.g. one polygon of a MULTIPOLYGON
+_WKT_POLYGON_RE = re.compile(r"\(((?:[^()]|\([^()]*\))*)\)")
+
 
 def read_geojson(path: Union[str, Path]) -> dict[str, Any]:
     """Read a GeoJSON file.
@@ -34,21 +80,117 @@ def read_geojson(path: Union[str, Path]) -> dict[str, Any]:
         raise ValidationError(f"GeoJSON file not found: {path}", field="path")
 
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return _json_loads(path.read_bytes())
     except json.JSONDecodeError as e:
         raise ValidationError(f"Invalid GeoJSON: {e}", field="path") from e
     except Exception as e:
         raise ValidationError(f"Failed to read GeoJSON: {e}", field="path") from e
 
 
-def geojson_to_wkt(geojson: dict[str, Any]) -> str:
+def read_first_geometry(path: Union[str, Path]) -> dict[str, Any]:
+    """Read the first geometry of a GeoJSON file.
+
+    For a FeatureCollection, only the first feature is parsed when ``ijson``
+    is installed (``pip install cdse-client[fast]``), so large collections
+    are not loaded into memory. Other documents, or all documents without
+    ``ijson``, are read in full with :func:`read_geojson`.
+
+    Args:
+        path: Path to the GeoJSON file
+
+    Returns:
+        GeoJSON geometry dictionary
+
+    Raises:
+        ValidationError: If the file cannot be read or contains no geometry
+
+    Example:
+        >>> geometry = read_first_geometry("regions.geojson")
+        >>> footprint = geojson_to_wkt(geometry)
+    """
+    path = Path(path)
+
+    if ijson is not None and path.exists():
+        try:
+            with open(path, "rb") as f:
+                feature = next(ijson.items(f, "features.item", use_float=True), None)
+        except ijson.JSONError as e:
+            raise ValidationError(f"Invalid GeoJSON: {e}", field="path") from e
+        except OSError as e:
+            raise ValidationError(f"Failed to read GeoJSON: {e}", field="path") from e
+
+        if feature is not None:
+            geometry = feature.get("geometry") if isinstance(feature, dict) else None
+            if not geometry:
+                raise ValidationError("No geometry found in GeoJSON", field="path")
+            return geometry
+
+    geometry = _extract_geometry(read_geojson(path))
+    if geometry is None:
+        raise ValidationError("No geometry found in GeoJSON", field="path")
+    return geometry
+
+
+def _read_bbox_source(path: Union[str, Path]) -> dict[str, Any]:
+    """Read the parts of a GeoJSON file that determine its bounding box.
+
+    With ``ijson``, a FeatureCollection is streamed: the result holds its
+    top-level ``bbox`` if it has one, otherwise only its first feature.
+    Other documents, or all documents without ``ijson``, are read in full.
+
+    Args:
+        path: Path to the GeoJSON file
+
+    Returns:
+        GeoJSON dictionary to pass to :func:`geojson_to_bbox`
+
+    Raises:
+        ValidationError: If the file cannot be read or parsed
+    """
+    path = Path(path)
+
+    if ijson is None or not path.exists():
+        return read_geojson(path)
+
+    bbox: Optional[list[float]] = None
+    builder = None
+    first_feature = None
+    try:
+        with open(path, "rb") as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if prefix == "bbox" and event == "start_array":
+                    bbox = []
+                elif prefix == "bbox.item" and bbox is not None:
+                    bbox.append(value)
+                elif prefix == "bbox" and event == "end_array":
+                    return {"bbox": bbox}
+                elif first_feature is None and prefix.startswith("features.item"):
+                    # Build the first feature only; later ones are skipped
+                    if builder is None and event == "start_map":
+                        builder = ijson.ObjectBuilder()
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == "features.item" and event == "end_map":
+                            first_feature = builder.value
+    except ijson.JSONError as e:
+        raise ValidationError(f"Invalid GeoJSON: {e}", field="path") from e
+    except OSError as e:
+        raise ValidationError(f"Failed to read GeoJSON: {e}", field="path") from e
+
+    if first_feature is None:
+        return read_geojson(path)
+    return {"type": "FeatureCollection", "features": [first_feature]}
+
+
+def geojson_to_wkt(geojson: Union[dict[str, Any], str, Path]) -> str:
     """Convert GeoJSON geometry to WKT format.
 
     Supports GeoJSON Feature, FeatureCollection, and raw geometry objects.
 
     Args:
-        geojson: GeoJSON dictionary (Feature, FeatureCollection, or geometry)
+        geojson: GeoJSON dictionary (Feature, FeatureCollection, or geometry),
+            or a path to a GeoJSON file read with :func:`read_first_geometry`
 
     Returns:
         WKT string representation of the geometry
@@ -64,6 +206,9 @@ def geojson_to_wkt(geojson: dict[str, Any]) -> str:
         >>> print(wkt)
         POLYGON ((0 0, 1 0, 1 1, 0 1, 0 0))
     """
+    if isinstance(geojson, (str, Path)):
+        geojson = read_first_geometry(geojson)
+
     # Extract geometry from Feature or FeatureCollection
     geometry = _extract_geometry(geojson)
 
@@ -111,22 +256,13 @@ def wkt_to_geojson(wkt: str) -> dict[str, Any]:
     """
     wkt = wkt.strip()
 
-    # Extract type and coordinates
+    # Match the type keyword in one case-insensitive regex pass
+    match = _WKT_TYPE_RE.match(wkt)
+    if match is None:
+        raise ValidationError(f"Unsupported WKT type: {wkt[:20]}", field="wkt")
+
     try:
-        if wkt.upper().startswith("POINT"):
-            return _wkt_point_to_geojson(wkt)
-        elif wkt.upper().startswith("LINESTRING"):
-            return _wkt_linestring_to_geojson(wkt)
-        elif wkt.upper().startswith("POLYGON"):
-            return _wkt_polygon_to_geojson(wkt)
-        elif wkt.upper().startswith("MULTIPOINT"):
-            return _wkt_multipoint_to_geojson(wkt)
-        elif wkt.upper().startswith("MULTILINESTRING"):
-            return _wkt_multilinestring_to_geojson(wkt)
-        elif wkt.upper().startswith("MULTIPOLYGON"):
-            return _wkt_multipolygon_to_geojson(wkt)
-        else:
-            raise ValidationError(f"Unsupported WKT type: {wkt[:20]}", field="wkt")
+        return _WKT_HANDLERS[match.group(1).upper()](wkt)
     except Exception as e:
         if isinstance(e, ValidationError):
             raise
@@ -167,11 +303,35 @@ def bbox_to_geojson(bbox: list[float]) -> dict[str, Any]:
     }
 
 
-def geojson_to_bbox(geojson: dict[str, Any]) -> list[float]:
+def bbox_to_geojson_bytes(bbox: list[float]) -> bytes:
+    """Convert bounding box to a serialized GeoJSON Polygon.
+
+    Same geometry as :func:`bbox_to_geojson`, encoded as compact UTF-8 JSON
+    ready to send as a request body. Uses ``orjson`` when installed.
+
+    Args:
+        bbox: Bounding box [min_lon, min_lat, max_lon, max_lat]
+
+    Returns:
+        GeoJSON Polygon geometry as JSON bytes
+
+    Raises:
+        ValidationError: If bbox is invalid
+
+    Example:
+        >>> bbox_to_geojson_bytes([0, 0, 1, 1])[:20]
+        b'{"type":"Polygon","'
+    """
+    return _json_dumps(bbox_to_geojson(bbox))
+
+
+def geojson_to_bbox(geojson: Union[dict[str, Any], str, Path]) -> list[float]:
     """Extract bounding box from GeoJSON.
 
     Args:
-        geojson: GeoJSON dictionary
+        geojson: GeoJSON dictionary, or a path to a GeoJSON file. A file's
+            top-level ``bbox`` is used if present; otherwise, as with
+            :func:`read_first_geometry`, only its first feature is parsed
 
     Returns:
         Bounding box [min_lon, min_lat, max_lon, max_lat]
@@ -179,28 +339,40 @@ def geojson_to_bbox(geojson: dict[str, Any]) -> list[float]:
     Raises:
         ValidationError: If GeoJSON is invalid
     """
+    if isinstance(geojson, (str, Path)):
+        geojson = _read_bbox_source(geojson)
+
+    # If bbox is already present, use it without walking the geometry
+    if "bbox" in geojson:
+        return geojson["bbox"]
+
     geometry = _extract_geometry(geojson)
 
     if geometry is None:
         raise ValidationError("No geometry found in GeoJSON", field="geojson")
 
-    # If bbox is already present, use it
-    if "bbox" in geojson:
-        return geojson["bbox"]
-
-    # Calculate bbox from coordinates
-    coords = _flatten_coordinates(geometry.get("coordinates", []))
+    # Calculate bbox from coordinates, walking the nesting the geometry type
+    # implies and falling back to a generic walk for anything irregular
+    geom_type = geometry.get("type")
+    coords = geometry.get("coordinates", [])
+    bbox = None
+    if geom_type in _GEOMETRY_DEPTH:
+        try:
+            bbox = _typed_bounds(geom_type, coords)
+        except (TypeError, IndexError, KeyError):
+            bbox = _coordinate_bounds(coords)
+    else:
+        bbox = _coordinate_bounds(coords)
 
-    if not coords:
+    if bbox is None:
         raise ValidationError("No coordinates found", field="geojson")
 
-    lons = [c[0] for c in coords]
-    lats = [c[1] for c in coords]
-
-    return [min(lons), min(lats), max(lons), max(lats)]
+    return bbox
 
 
-def simplify_geometry(geojson: dict[str, Any], tolerance: float = 0.01) -> dict[str, Any]:
+def simplify_geometry(
+    geojson: dict[str, Any], tolerance: float = 0.01, preserve_topology: bool = True
+) -> dict[str, Any]:
     """Simplify a GeoJSON geometry using Douglas-Peucker algorithm.
 
     This is a basic implementation. For production use, consider
@@ -209,21 +381,39 @@ def simplify_geometry(geojson: dict[str, Any], tolerance: float = 0.01) -> dict[
     Args:
         geojson: GeoJSON geometry
         tolerance: Simplification tolerance in degrees
+        preserve_topology: Keep the result valid (no self-intersections or
+            collapsed rings). Passing False is several times faster on large
+            polygons but may produce invalid geometries.
 
     Returns:
         Simplified GeoJSON geometry
     """
     try:
+        import numpy as np
         from shapely import simplify as shapely_simplify
-        from shapely.geometry import mapping, shape
-
-        geom = shape(_extract_geometry(geojson))
-        simplified = shapely_simplify(geom, tolerance, preserve_topology=True)
-        return mapping(simplified)
+        from shapely.geometry import Polygon, mapping, shape
     except ImportError:
         # Return original if shapely not available
         return geojson
 
+    geometry = _extract_geometry(geojson)
+    geom = None
+
+    # Build polygons from float arrays, a C-level copy that is faster than
+    # shape()'s walk over the nested lists; mixed 2D/3D rings fall back
+    if geometry is not None and geometry.get("type") == "Polygon" and geometry.get("coordinates"):
+        try:
+            shell, *holes = [np.asarray(ring, dtype=np.float64) for ring in geometry["coordinates"]]
+            geom = Polygon(shell, holes)
+        except ValueError:
+            geom = None
+
+    if geom is None:
+        geom = shape(geometry)
+
+    simplified = shapely_simplify(geom, tolerance, preserve_topology=preserve_topology)
+    return mapping(simplified)
+
 
 def validate_geometry(geojson: dict[str, Any]) -> bool:
     """Validate a GeoJSON geometry.
@@ -248,15 +438,7 @@ def validate_geometry(geojson: dict[str, Any]) -> bool:
         raise ValidationError("Geometry missing coordinates", field="geojson")
 
     # Type-specific validation
-    valid_types = [
-        "Point",
-        "LineString",
-        "Polygon",
-        "MultiPoint",
-        "MultiLineString",
-        "MultiPolygon",
-    ]
-    if geom_type not in valid_types:
+    if geom_type not in _GEOMETRY_TYPES:
         raise ValidationError(f"Invalid geometry type: {geom_type}", field="geojson")
 
     return True
@@ -274,43 +456,106 @@ def _extract_geometry(geojson: dict[str, Any]) -> Optional[dict[str, Any]]:
 
     geom_type = geojson.get("type")
 
+    # Raw geometries are the most common input, so test for them first
+    if geom_type in _GEOMETRY_TYPES:
+        return geojson
+
+    if geom_type == "Feature":
+        return geojson.get("geometry")
+
     if geom_type == "FeatureCollection":
         features = geojson.get("features", [])
         if features:
             return features[0].get("geometry")
-        return None
 
-    if geom_type == "Feature":
-        return geojson.get("geometry")
+    return None
 
-    # Assume it's a raw geometry
-    if geom_type in [
-        "Point",
-        "LineString",
-        "Polygon",
-        "MultiPoint",
-        "MultiLineString",
-        "MultiPolygon",
-    ]:
-        return geojson
 
-    return None
+def _typed_bounds(geom_type: str, coords: Any) -> Optional[list[float]]:
+    """Compute the bounds of a geometry whose nesting is given by its type.
 
+    Collects the position sequences at the fixed depth for ``geom_type`` and
+    reduces each one column-wise, with no per-element type checks.
 
-def _flatten_coordinates(coords: Any) -> list[list[float]]:
-    """Recursively flatten nested coordinate arrays to list of [lon, lat]."""
-    if not coords:
-        return []
+    Returns:
+        Bounding box, or None if there are no positions
+    """
+    depth = _GEOMETRY_DEPTH[geom_type]
+    if depth == 0:
+        if not coords:
+            return None
+        return [coords[0], coords[1], coords[0], coords[1]]
+    if depth == 1:
+        rings = [coords]
+    elif depth == 2:
+        rings = coords
+    else:
+        rings = [ring for polygon in coords for ring in polygon]
+
+    min_lon = min_lat = math.inf
+    max_lon = max_lat = -math.inf
+    for ring in rings:
+        if not ring:
+            continue
+        lons = [position[0] for position in ring]
+        lats = [position[1] for position in ring]
+        min_lon = min(min_lon, min(lons))
+        min_lat = min(min_lat, min(lats))
+        max_lon = max(max_lon, max(lons))
+        max_lat = max(max_lat, max(lats))
+
+    if min_lon == math.inf:
+        return None
+    return [min_lon, min_lat, max_lon, max_lat]
+
+
+def _coordinate_bounds(coords: Any) -> Optional[list[float]]:
+    """Compute [min_lon, min_lat, max_lon, max_lat] of nested coordinate arrays.
 
-    # Check if this is a coordinate pair [lon, lat]
-    if isinstance(coords[0], (int, float)):
-        return [coords]
+    Walks the nesting with an explicit stack and updates the bounds in the
+    same pass, without building a flattened list of positions. Each ring is
+    reduced column-wise with the builtin min/max.
 
-    # Recursively flatten
-    result = []
-    for item in coords:
-        result.extend(_flatten_coordinates(item))
-    return result
+    Returns:
+        Bounding box, or None if there are no positions
+    """
+    min_lon = min_lat = math.inf
+    max_lon = max_lat = -math.inf
+    stack = [coords]
+    while stack:
+        item = stack.pop()
+        if not item:
+            continue
+
+        # A ring or line: reduce its columns with the C-level min/max builtins
+        # instead of comparing position by position
+        first = item[0]
+        if isinstance(first, (list, tuple)) and first and isinstance(first[0], (int, float)):
+            lons = [position[0] for position in item]
+            lats = [position[1] for position in item]
+            min_lon = min(min_lon, min(lons))
+            min_lat = min(min_lat, min(lats))
+            max_lon = max(max_lon, max(lons))
+            max_lat = max(max_lat, max(lats))
+            continue
+
+        # A position [lon, lat(, alt)]
+        if isinstance(item[0], (int, float)):
+            lon, lat = item[0], item[1]
+            if lon < min_lon:
+                min_lon = lon
+            if lon > max_lon:
+                max_lon = lon
+            if lat < min_lat:
+                min_lat = lat
+            if lat > max_lat:
+                max_lat = lat
+        else:
+            stack.extend(item)
+
+    if min_lon == math.inf:
+        return None
+    return [min_lon, min_lat, max_lon, max_lat]
 
 
 def _coords_to_wkt_string(coords: list[float]) -> str:
@@ -318,6 +563,15 @@ def _coords_to_wkt_string(coords: list[float]) -> str:
     return f"{coords[0]} {coords[1]}"
 
 
+def _ring_to_wkt(coords: list[list[float]]) -> str:
+    """Convert a coordinate sequence to a parenthesized WKT point list.
+
+    Formats the positions inline in one join rather than calling
+    ``_coords_to_wkt_string`` per vertex.
+    """
+    return "(" + ", ".join([f"{c[0]} {c[1]}" for c in coords]) + ")"
+
+
 def _point_to_wkt(coords: list[float]) -> str:
     """Convert Point coordinates to WKT."""
     return f"POINT ({_coords_to_wkt_string(coords)})"
@@ -325,44 +579,30 @@ def _point_to_wkt(coords: list[float]) -> str:
 
 def _linestring_to_wkt(coords: list[list[float]]) -> str:
     """Convert LineString coordinates to WKT."""
-    points = ", ".join(_coords_to_wkt_string(c) for c in coords)
-    return f"LINESTRING ({points})"
+    return "LINESTRING " + _ring_to_wkt(coords)
 
 
 def _polygon_to_wkt(coords: list[list[list[float]]]) -> str:
     """Convert Polygon coordinates to WKT."""
-    rings = []
-    for ring in coords:
-        points = ", ".join(_coords_to_wkt_string(c) for c in ring)
-        rings.append(f"({points})")
-    return f"POLYGON ({', '.join(rings)})"
+    return "POLYGON (" + ", ".join([_ring_to_wkt(ring) for ring in coords]) + ")"
 
 
 def _multipoint_to_wkt(coords: list[list[float]]) -> str:
     """Convert MultiPoint coordinates to WKT."""
-    points = ", ".join(f"({_coords_to_wkt_string(c)})" for c in coords)
-    return f"MULTIPOINT ({points})"
+    return "MULTIPOINT (" + ", ".join([f"({c[0]} {c[1]})" for c in coords]) + ")"
 
 
 def _multilinestring_to_wkt(coords: list[list[list[float]]]) -> str:
     """Convert MultiLineString coordinates to WKT."""
-    lines = []
-    for line in coords:
-        points = ", ".join(_coords_to_wkt_string(c) for c in line)
-        lines.append(f"({points})")
-    return f"MULTILINESTRING ({', '.join(lines)})"
+    return "MULTILINESTRING (" + ", ".join([_ring_to_wkt(line) for line in coords]) + ")"
 
 
 def _multipolygon_to_wkt(coords: list[list[list[list[float]]]]) -> str:
     """Convert MultiPolygon coordinates to WKT."""
-    polygons = []
-    for polygon in coords:
-        rings = []
-        for ring in polygon:
-            points = ", ".join(_coords_to_wkt_string(c) for c in ring)
-            rings.append(f"({points})")
-        polygons.append(f"({', '.join(rings)})")
-    return f"MULTIPOLYGON ({', '.join(polygons)})"
+    polygons = [
+        "(" + ", ".join([_ring_to_wkt(ring) for ring in polygon]) + ")" for polygon in coords
+    ]
+    return "MULTIPOLYGON (" + ", ".join(polygons) + ")"
 
 
 def _parse_wkt_coords(coord_str: str) -> list[float]:
@@ -376,6 +616,13 @@ def _parse_wkt_coord_list(coords_str: str) -> list[list[float]]:
     coords_str = coords_str.strip()
     if not coords_str:
         return []
+
+    # All-2D lists (the common case) convert every number with one map()
+    # call and pair them up; lists with Z/M values are parsed per position
+    values = coords_str.replace(",", " ").split()
+    if len(values) == 2 * (coords_str.count(",") + 1):
+        numbers = list(map(float, values))
+        return [[lon, lat] for lon, lat in zip(numbers[::2], numbers[1::2])]
     return [_parse_wkt_coords(c) for c in coords_str.split(",")]
 
 
@@ -398,28 +645,9 @@ def _wkt_polygon_to_geojson(wkt: str) -> dict[str, Any]:
     """Convert WKT Polygon to GeoJSON."""
     # Find the outer parentheses
     start = wkt.index("(")
-    content = wkt[start + 1 : wkt.rindex(")")].strip()
-
-    # Parse rings
-    rings = []
-    depth = 0
-    current = ""
-
-    for char in content:
-        if char == "(":
-            depth += 1
-            if depth == 1:
-                current = ""
-                continue
-        elif char == ")":
-            depth -= 1
-            if depth == 0:
-                rings.append(_parse_wkt_coord_list(current))
-                current = ""
-                continue
-        if depth > 0:
-            current += char
+    content = wkt[start + 1 : wkt.rindex(")")]
 
+    rings = [_parse_wkt_coord_list(ring) for ring in _WKT_RING_RE.findall(content)]
     return {"type": "Polygon", "coordinates": rings}
 
 
@@ -443,54 +671,30 @@ def _wkt_multipoint_to_geojson(wkt: str) -> dict[str, Any]:
 def _wkt_multilinestring_to_geojson(wkt: str) -> dict[str, Any]:
     """Convert WKT MultiLineString to GeoJSON."""
     start = wkt.index("(")
-    content = wkt[start + 1 : wkt.rindex(")")].strip()
-
-    lines = []
-    depth = 0
-    current = ""
-
-    for char in content:
-        if char == "(":
-            depth += 1
-            if depth == 1:
-                current = ""
-                continue
-        elif char == ")":
-            depth -= 1
-            if depth == 0:
-                lines.append(_parse_wkt_coord_list(current))
-                current = ""
-                continue
-        if depth > 0:
-            current += char
+    content = wkt[start + 1 : wkt.rindex(")")]
 
+    lines = [_parse_wkt_coord_list(line) for line in _WKT_RING_RE.findall(content)]
     return {"type": "MultiLineString", "coordinates": lines}
 
 
 def _wkt_multipolygon_to_geojson(wkt: str) -> dict[str, Any]:
     """Convert WKT MultiPolygon to GeoJSON."""
     start = wkt.index("(")
-    content = wkt[start + 1 : wkt.rindex(")")].strip()
-
-    polygons = []
-    depth = 0
-    current = ""
-
-    for char in content:
-        if char == "(":
-            depth += 1
-            if depth == 1:
-                current = ""
-                continue
-        elif char == ")":
-            depth -= 1
-            if depth == 0:
-                # Parse the polygon
-                poly_geojson = _wkt_polygon_to_geojson(f"POLYGON ({current})")
-                polygons.append(poly_geojson["coordinates"])
-                current = ""
-                continue
-        if depth > 0:
-            current += char
+    content = wkt[start + 1 : wkt.rindex(")")]
 
+    polygons = [
+        [_parse_wkt_coord_list(ring) for ring in _WKT_RING_RE.findall(polygon)]
+        for polygon in _WKT_POLYGON_RE.findall(content)
+    ]
     return {"type": "MultiPolygon", "coordinates": polygons}
+
+
+# WKT type keyword -> parser
+_WKT_HANDLERS = {
+    "MULTIPOLYGON": _wkt_multipolygon_to_geojson,
+    "MULTILINESTRING": _wkt_multilinestring_to_geojson,
+    "MULTIPOINT": _wkt_multipoint_to_geojson,
+    "LINESTRING": _wkt_linestring_to_geojson,
+    "POLYGON": _wkt_polygon_to_geojson,
+    "POINT": _wkt_point_to_geojson,
+}
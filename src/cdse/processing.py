@@ -16,9 +16,16 @@ Requires: rasterio (install with: pip install cdse-client[processing])
 """
 
 import base64
-import io
+import functools
 import logging
+import math
+import os
+import re
+import shutil
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -26,6 +33,47 @@ from cdse.exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for streaming band files out of product ZIPs
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Tile size (pixels) for block-wise raster processing and tiled GeoTIFF output
+_BLOCK_SIZE = 512
+
+# GDAL settings for reading band images: a block cache (MB) large enough
+# that JP2 tiles decoded once are reused by later reads, and multi-threaded
+# JPEG2000 decoding
+_GDAL_READ_ENV = {"GDAL_CACHEMAX": 512, "GDAL_NUM_THREADS": "ALL_CPUS"}
+
+# Creation options for GeoTIFF outputs: ZSTD compresses faster and smaller
+# than LZW (on all cores), and tiles keep windowed reads of the result cheap
+_GTIFF_OPTIONS = {
+    "driver": "GTiff",
+    "compress": "zstd",
+    "zstd_level": 9,
+    "num_threads": "ALL_CPUS",
+    "tiled": True,
+    "blockxsize": _BLOCK_SIZE,
+    "blockysize": _BLOCK_SIZE,
+}
+
+# Creation options for Cloud-Optimized GeoTIFF outputs: the same ZSTD tiles
+# plus an overview pyramid, built when the file is closed. The COG driver
+# buffers the whole raster in memory until then, so it is only used for
+# AOI-sized outputs. Its layout is pixel-interleaved.
+_COG_OPTIONS = {
+    "driver": "COG",
+    "compress": "zstd",
+    "level": 9,
+    "predictor": "YES",
+    "num_threads": "ALL_CPUS",
+    "blocksize": _BLOCK_SIZE,
+    "overview_resampling": "average",
+}
+
+# Band image inside a resolution folder, e.g.
+# ".../IMG_DATA/R10m/T32TNR_20240115T101301_B04_10m.jp2" -> ("10", "B04")
+_BAND_FILE_RE = re.compile(r"/R(\d+)m/[^/]*_([A-Z0-9]+)_\d+m\.jp2$")
+
 # Sentinel-2 band information
 SENTINEL2_BANDS = {
     # 10m resolution
@@ -59,11 +107,18 @@ BAND_COMBINATIONS = {
 }
 
 
+def _gtiff_options(dtype: str) -> dict[str, Any]:
+    """Get GeoTIFF creation options for output of the given data type."""
+    # Horizontal differencing suits integer bands; floats need predictor 3
+    predictor = 3 if str(dtype).startswith("float") else 2
+    return {**_GTIFF_OPTIONS, "predictor": predictor}
+
+
 def crop_to_bbox(
     input_path: Union[str, Path],
     bbox: list[float],
     output_path: Optional[Union[str, Path]] = None,
-    bands: Optional[list[str]] = None,
+    bands: Optional[list[int]] = None,
 ) -> Path:
     """Crop a raster file to a bounding box.
 
@@ -86,15 +141,58 @@ def crop_to_bbox(
         ...     bbox=[9.15, 45.45, 9.20, 45.50],  # Milan center
         ... )
     """
+    out_image, out_meta = read_bbox(input_path, bbox, bands=bands)
+    out_meta.update(_gtiff_options(out_meta["dtype"]))
+
+    import rasterio
+
+    # Default output path
+    input_path = Path(input_path)
+    if output_path is None:
+        output_path = input_path.parent / f"{input_path.stem}_cropped.tif"
+    output_path = Path(output_path)
+
+    # Write output
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with rasterio.open(output_path, "w", **out_meta) as dst:
+        dst.write(out_image)
+
+    return output_path
+
+
+def read_bbox(
+    input_path: Union[str, Path],
+    bbox: list[float],
+    bands: Optional[list[int]] = None,
+) -> tuple[Any, dict[str, Any]]:
+    """Read the pixels of a raster inside a bounding box into memory.
+
+    Like :func:`crop_to_bbox`, but returns the cropped array instead of
+    writing it to a file, for code that goes on to process the pixels.
+
+    Args:
+        input_path: Path to input raster file (GeoTIFF or JP2)
+        bbox: Bounding box [min_lon, min_lat, max_lon, max_lat] in WGS84
+        bands: List of band indices to read (1-based), None for all
+
+    Returns:
+        Tuple of (array of shape (bands, rows, cols), metadata). The
+        metadata (crs, transform, dtype, ...) can be passed to
+        ``rasterio.open(path, "w", **meta)`` to write the array.
+
+    Raises:
+        ValidationError: If input is invalid
+        ImportError: If rasterio is not installed
+
+    Example:
+        >>> data, meta = read_bbox("B04.jp2", bbox=[9.15, 45.45, 9.20, 45.50])
+        >>> red = data[0].astype("float32")
+    """
     try:
         import rasterio
-        from rasterio.mask import mask
-        from rasterio.warp import transform_bounds
-        from shapely.geometry import box
     except ImportError as e:
         raise ImportError(
-            "rasterio and shapely are required for processing. "
-            "Install with: pip install cdse-client[processing]"
+            "rasterio is required for processing. Install with: pip install cdse-client[processing]"
         ) from e
 
     input_path = Path(input_path)
@@ -106,51 +204,67 @@ def crop_to_bbox(
             "bbox must have 4 values: [min_lon, min_lat, max_lon, max_lat]", field="bbox"
         )
 
-    # Default output path
-    if output_path is None:
-        output_path = input_path.parent / f"{input_path.stem}_cropped.tif"
-    output_path = Path(output_path)
-
     with rasterio.open(input_path) as src:
-        # Transform bbox to source CRS
-        if src.crs.to_epsg() != 4326:
-            # bbox is in WGS84, transform to source CRS
-            from rasterio.warp import transform_bounds
-
-            transformed_bbox = transform_bounds("EPSG:4326", src.crs, *bbox)
-        else:
-            transformed_bbox = bbox
+        window = _bbox_window(src, bbox, input_path)
 
-        # Create geometry for masking
-        geom = box(*transformed_bbox)
+        # Crop, reading only the selected bands
+        out_image = src.read(indexes=bands or None, window=window)
 
-        # Crop
-        out_image, out_transform = mask(src, [geom], crop=True, all_touched=True)
-
-        # Select bands if specified
-        if bands:
-            band_indices = [b - 1 for b in bands]  # Convert to 0-based
-            out_image = out_image[band_indices]
-
-        # Update metadata
         out_meta = src.meta.copy()
         out_meta.update(
             {
                 "driver": "GTiff",
                 "height": out_image.shape[1],
                 "width": out_image.shape[2],
-                "transform": out_transform,
+                "transform": src.window_transform(window),
                 "count": out_image.shape[0],
-                "compress": "lzw",
             }
         )
 
-        # Write output
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with rasterio.open(output_path, "w", **out_meta) as dst:
-            dst.write(out_image)
+    return out_image, out_meta
 
-    return output_path
+
+def _bbox_window(src: Any, bbox: list[float], path: Union[str, Path]) -> Any:
+    """Get the pixel window of an open raster covered by a WGS84 bbox.
+
+    An axis-aligned bbox is a pixel window, so only those pixels need to be
+    read instead of rasterizing a mask over the whole raster. The window is
+    rounded outwards, keeping every pixel the bbox touches, and clipped to
+    the raster.
+
+    Raises:
+        ValidationError: If the bbox does not overlap the raster
+    """
+    from rasterio.windows import Window, from_bounds
+
+    # Transform bbox to source CRS
+    if src.crs.to_epsg() != 4326:
+        # bbox is in WGS84, transform to source CRS
+        transformed_bbox = _transform_bounds("EPSG:4326", src.crs.to_wkt(), tuple(bbox))
+    else:
+        transformed_bbox = tuple(bbox)
+
+    window = from_bounds(*transformed_bbox, transform=src.transform)
+    row_start = max(math.floor(window.row_off), 0)
+    col_start = max(math.floor(window.col_off), 0)
+    row_stop = min(math.ceil(window.row_off + window.height), src.height)
+    col_stop = min(math.ceil(window.col_off + window.width), src.width)
+    if row_start >= row_stop or col_start >= col_stop:
+        raise ValidationError(f"bbox {bbox} does not overlap raster {path}", field="bbox")
+    return Window.from_slices((row_start, row_stop), (col_start, col_stop))
+
+
+@functools.lru_cache(maxsize=256)
+def _transform_bounds(src_crs: str, dst_crs: str, bounds: tuple[float, ...]) -> tuple[float, ...]:
+    """Transform bounds between CRSs, caching the result.
+
+    Batch processing crops many scenes of the same tiles to the same bbox,
+    so identical transforms repeat; each one otherwise sets up a PROJ
+    pipeline and densifies the edges again.
+    """
+    from rasterio.warp import transform_bounds
+
+    return tuple(float(v) for v in transform_bounds(src_crs, dst_crs, *bounds))
 
 
 def extract_bands_from_safe(
@@ -209,24 +323,93 @@ def _extract_bands_from_zip(
     extracted = {}
 
     with zipfile.ZipFile(zip_path, "r") as zf:
-        # Find band files
-        for band in bands:
-            res_pattern = f"R{resolution}m"
-
-            for name in zf.namelist():
-                if band in name and res_pattern in name and name.endswith(".jp2"):
-                    # Extract this band
-                    out_path = output_dir / f"{band}_{resolution}m.jp2"
+        entries = _find_zip_band_entries(zf.infolist(), bands, resolution)
+        for band, info in entries.items():
+            out_path = output_dir / f"{band}_{resolution}m.jp2"
 
-                    with zf.open(name) as src, open(out_path, "wb") as dst:
-                        dst.write(src.read())
+            # Stream through a fixed buffer instead of holding the
+            # whole (often 100 MB) band in memory. Opening by ZipInfo
+            # skips a second lookup in the central directory.
+            with zf.open(info) as src, open(out_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
 
-                    extracted[band] = out_path
-                    break
+            extracted[band] = out_path
 
     return extracted
 
 
+def _band_sources(
+    safe_path: Path, bands: list[str], resolution: int
+) -> dict[str, Union[str, Path]]:
+    """Get paths rasterio can open for band images of a SAFE folder or ZIP.
+
+    Nothing is extracted: bands of a ZIP are read inside the archive
+    through ``/vsizip/`` and bands of a SAFE folder in place.
+    """
+    import tempfile
+
+    if safe_path.suffix.lower() == ".zip":
+        if not safe_path.exists():
+            raise ValidationError(f"Path not found: {safe_path}", field="safe_path")
+        return dict(_vsizip_band_paths(safe_path, bands, resolution))
+
+    # SAFE folders are read in place; nothing is written to tmpdir
+    with tempfile.TemporaryDirectory() as tmpdir:
+        return dict(
+            extract_bands_from_safe(
+                safe_path, bands, output_dir=Path(tmpdir), resolution=resolution
+            )
+        )
+
+
+def _vsizip_band_paths(zip_path: Path, bands: list[str], resolution: int) -> dict[str, str]:
+    """Get GDAL ``/vsizip/`` paths of band images inside a product ZIP.
+
+    rasterio opens these directly, reading only the bytes it needs from the
+    archive instead of extracting each band to disk first.
+    """
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        entries = _find_zip_band_entries(zf.infolist(), bands, resolution)
+
+    archive = zip_path.resolve().as_posix()
+    return {band: f"/vsizip/{archive}/{info.filename}" for band, info in entries.items()}
+
+
+def _find_zip_band_entries(
+    infos: list[zipfile.ZipInfo], bands: list[str], resolution: int
+) -> dict[str, zipfile.ZipInfo]:
+    """Map band names to their image entries in a product ZIP."""
+    res_pattern = f"R{resolution}m"
+
+    # Index band images by (resolution, band) in one pass over the
+    # archive's thousands of entries, keeping the first match
+    index: dict[tuple[int, str], zipfile.ZipInfo] = {}
+    for info in infos:
+        match = _BAND_FILE_RE.search(info.filename)
+        if match:
+            index.setdefault((int(match.group(1)), match.group(2)), info)
+
+    entries = {}
+    for band in bands:
+        band_info = index.get((resolution, band))
+        if band_info is None:
+            # Unusually named entries: fall back to a substring scan
+            band_info = next(
+                (
+                    info
+                    for info in infos
+                    if band in info.filename
+                    and res_pattern in info.filename
+                    and info.filename.endswith(".jp2")
+                ),
+                None,
+            )
+        if band_info is not None:
+            entries[band] = band_info
+
+    return entries
+
+
 def _extract_bands_from_safe_folder(
     safe_path: Path,
     bands: list[str],
@@ -253,23 +436,24 @@ def _extract_bands_from_safe_folder(
     if not res_folder.exists():
         res_folder = img_data  # L1C doesn't have resolution subfolders
 
-    extracted = {}
-    for band in bands:
-        # Find band file
-        band_files = list(res_folder.glob(f"*_{band}_*.jp2")) + list(
-            res_folder.glob(f"*_{band}.jp2")
-        )
-
-        if band_files:
-            extracted[band] = band_files[0]
+    # Index the folder's band images in one directory scan rather than two
+    # globs per band: every "_"-separated name token after the tile ID, as
+    # in "T32TNR_20240115T101301_B04_10m.jp2" or "..._B04.jp2" (L1C)
+    by_band: dict[str, Path] = {}
+    with os.scandir(res_folder) as entries:
+        for entry in entries:
+            if entry.name.endswith(".jp2"):
+                for token in entry.name[: -len(".jp2")].split("_")[1:]:
+                    by_band.setdefault(token, Path(entry.path))
 
-    return extracted
+    return {band: by_band[band] for band in bands if band in by_band}
 
 
 def stack_bands(
-    band_paths: dict[str, Path],
+    band_paths: dict[str, Union[str, Path]],
     output_path: Union[str, Path],
     band_order: Optional[list[str]] = None,
+    max_workers: Optional[int] = None,
 ) -> Path:
     """Stack multiple bands into a single multi-band GeoTIFF.
 
@@ -277,6 +461,8 @@ def stack_bands(
         band_paths: Dictionary mapping band names to file paths
         output_path: Output GeoTIFF path
         band_order: Order of bands in output (default: sorted keys)
+        max_workers: Threads reading bands in parallel (default: one per
+            band, up to the number of CPUs)
 
     Returns:
         Path to output stacked GeoTIFF
@@ -289,7 +475,9 @@ def stack_bands(
         ... )
     """
     try:
+        import numpy as np
         import rasterio
+        from rasterio.enums import Resampling
     except ImportError as e:
         raise ImportError(
             "rasterio is required for processing. Install with: pip install cdse-client[processing]"
@@ -307,26 +495,39 @@ def stack_bands(
     # Update metadata for multi-band output
     meta.update(
         {
-            "driver": "GTiff",
+            **_gtiff_options(meta["dtype"]),
             "count": len(band_order),
-            "compress": "lzw",
+            # All bands of a pixel sit together in each tile, so per-pixel
+            # and patch reads of the stack fetch one block instead of one
+            # per band
+            "interleave": "pixel",
         }
     )
 
+    def read_band(band_name: str, out: Any) -> Any:
+        # Reading into a buffer of the output shape resamples bands of
+        # another size in the same pass
+        with rasterio.open(band_paths[band_name]) as src:
+            return src.read(1, out=out, resampling=Resampling.bilinear)
+
+    # Decode the bands in parallel (each from its own file); only the main
+    # thread writes to the output dataset
+    workers = min(max_workers or os.cpu_count() or 1, len(band_order))
+
+    # Each batch of bands is read into the same preallocated buffers, so
+    # at most one buffer per worker is ever allocated
+    buffers = [np.empty((height, width), dtype=meta["dtype"]) for _ in range(workers)]
+
     # Stack bands
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with rasterio.open(output_path, "w", **meta) as dst:
-        for i, band_name in enumerate(band_order, 1):
-            band_path = band_paths[band_name]
-            with rasterio.open(band_path) as src:
-                data = src.read(1)
-                # Resample if sizes don't match
-                if data.shape != (height, width):
-                    from rasterio.enums import Resampling
-
-                    data = src.read(1, out_shape=(height, width), resampling=Resampling.bilinear)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    with rasterio.open(output_path, "w", **meta) as dst, executor:
+        for start in range(0, len(band_order), workers):
+            batch = band_order[start : start + workers]
+            bands_data = executor.map(read_band, batch, buffers)
+            for i, data in enumerate(bands_data, start + 1):
                 dst.write(data, i)
-                dst.set_band_description(i, band_name)
+        dst.descriptions = tuple(band_order)
 
     return output_path
 
@@ -338,9 +539,14 @@ def crop_and_stack(
     output_path: Optional[Union[str, Path]] = None,
     resolution: int = 10,
 ) -> Path:
-    """Extract bands, crop to bbox, and stack into single GeoTIFF.
+    """Extract bands, crop to bbox, and stack into a Cloud-Optimized GeoTIFF.
 
-    This is a convenience function combining extract, crop, and stack operations.
+    Each band is read only within the bbox window and written straight into
+    the multi-band output, so no full-scene intermediate stack is created.
+    Bands of a ZIP product are read inside the archive, without extracting
+    them to disk. Bands on a different grid than the first one are
+    resampled onto its cropped grid. The output includes overviews, so
+    viewers and samplers can read it at reduced resolution.
 
     Args:
         safe_path: Path to .SAFE folder or .zip file
@@ -350,7 +556,11 @@ def crop_and_stack(
         resolution: Target resolution in meters
 
     Returns:
-        Path to output cropped and stacked GeoTIFF
+        Path to output cropped and stacked Cloud-Optimized GeoTIFF
+
+    Raises:
+        ValidationError: If no bands are found or the bbox does not overlap them
+        ImportError: If rasterio is not installed
 
     Example:
         >>> result = crop_and_stack(
@@ -359,7 +569,15 @@ def crop_and_stack(
         ...     bands=["B04", "B03", "B02", "B08"],  # RGB + NIR
         ... )
     """
-    import tempfile
+    try:
+        import rasterio
+        from rasterio.enums import Resampling
+        from rasterio.windows import bounds as window_bounds
+        from rasterio.windows import from_bounds
+    except ImportError as e:
+        raise ImportError(
+            "rasterio is required for processing. Install with: pip install cdse-client[processing]"
+        ) from e
 
     safe_path = Path(safe_path)
     bands = bands or ["B04", "B03", "B02"]
@@ -368,24 +586,44 @@ def crop_and_stack(
         output_path = safe_path.parent / f"{safe_path.stem}_cropped.tif"
     output_path = Path(output_path)
 
-    # Extract bands to temp directory
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir = Path(tmpdir)
+    band_paths = _band_sources(safe_path, bands, resolution)
+    if not band_paths:
+        raise ValidationError(f"No bands found in {safe_path}", field="bands")
 
-        # Extract bands
-        band_paths = extract_bands_from_safe(
-            safe_path, bands, output_dir=tmpdir, resolution=resolution
-        )
+    band_order = [band for band in bands if band in band_paths]
 
-        if not band_paths:
-            raise ValidationError(f"No bands found in {safe_path}", field="bands")
+    # Open every band once and keep it open for the whole crop, so
+    # GDAL's block cache serves repeated reads of the same tiles
+    with rasterio.Env(**_GDAL_READ_ENV), ExitStack() as stack:
+        sources = [stack.enter_context(rasterio.open(band_paths[b])) for b in band_order]
 
-        # Stack bands
-        stacked_path = tmpdir / "stacked.tif"
-        stack_bands(band_paths, stacked_path, band_order=bands)
+        # The first band's cropped grid defines the output
+        first = sources[0]
+        window = _bbox_window(first, bbox, band_paths[band_order[0]])
+        crop_bounds = window_bounds(window, first.transform)
+        height, width = int(window.height), int(window.width)
+        meta = first.meta.copy()
+        meta.update(
+            {
+                **_COG_OPTIONS,
+                "height": height,
+                "width": width,
+                "transform": first.window_transform(window),
+                "count": len(band_order),
+            }
+        )
 
-        # Crop to bbox
-        crop_to_bbox(stacked_path, bbox, output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        dst = stack.enter_context(rasterio.open(output_path, "w", **meta))
+        for i, src in enumerate(sources, 1):
+            data = src.read(
+                1,
+                window=from_bounds(*crop_bounds, transform=src.transform),
+                out_shape=(height, width),
+                resampling=Resampling.bilinear,
+            )
+            dst.write(data, i)
+        dst.descriptions = tuple(band_order)
 
     return output_path
 
@@ -394,6 +632,8 @@ def calculate_ndvi(
     nir_path: Union[str, Path],
     red_path: Union[str, Path],
     output_path: Union[str, Path],
+    dtype: str = "float32",
+    max_workers: Optional[int] = None,
 ) -> Path:
     """Calculate NDVI (Normalized Difference Vegetation Index).
 
@@ -403,12 +643,19 @@ def calculate_ndvi(
         nir_path: Path to NIR band (B08 for Sentinel-2)
         red_path: Path to Red band (B04 for Sentinel-2)
         output_path: Output GeoTIFF path
+        dtype: Output data type: "float32" (default) or "int16", which stores
+            NDVI scaled by 10000 in half the space
+        max_workers: Threads decoding and computing blocks in parallel
+            (default: number of CPUs)
 
     Returns:
-        Path to NDVI output file (values -1 to 1)
+        Path to NDVI output file (values -1 to 1, or -10000 to 10000 for int16)
+
+    Raises:
+        ValidationError: If dtype is not supported
     """
     try:
-        import numpy as np
+        import numpy  # noqa: F401
         import rasterio
     except ImportError as e:
         raise ImportError(
@@ -416,38 +663,122 @@ def calculate_ndvi(
             "Install with: pip install cdse-client[processing]"
         ) from e
 
-    output_path = Path(output_path)
-
-    with rasterio.open(nir_path) as nir_src, rasterio.open(red_path) as red_src:
-        nir = nir_src.read(1).astype(np.float32)
-        red = red_src.read(1).astype(np.float32)
-
-        # Calculate NDVI, avoiding division by zero
-        denominator = nir + red
-        ndvi = np.where(denominator > 0, (nir - red) / denominator, 0)
+    if dtype not in ("float32", "int16"):
+        raise ValidationError(
+            f"Unsupported NDVI dtype: {dtype}. Expected 'float32' or 'int16'", field="dtype"
+        )
 
-        # Clip to valid range
-        ndvi = np.clip(ndvi, -1, 1)
+    output_path = Path(output_path)
+    workers = max_workers or os.cpu_count() or 1
 
-        # Write output
+    # Write a tiled GeoTIFF and compute it block by block, so each step
+    # works on cache-sized arrays and the full tile is never in memory
+    with rasterio.open(nir_path) as nir_src:
         meta = nir_src.meta.copy()
-        meta.update(
-            {
-                "driver": "GTiff",
-                "dtype": "float32",
-                "count": 1,
-                "compress": "lzw",
-            }
-        )
+    meta.update(
+        {
+            **_gtiff_options(dtype),
+            "dtype": dtype,
+            "count": 1,
+        }
+    )
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+    # GDAL datasets are not thread-safe, so each worker reads through its
+    # own handles; rasterio releases the GIL while decoding
+    local = threading.local()
+    sources: list[Any] = []
+    sources_lock = threading.Lock()
+
+    def compute(window: Any) -> Any:
+        if not hasattr(local, "sources"):
+            local.sources = (rasterio.open(nir_path), rasterio.open(red_path))
+            with sources_lock:
+                sources.extend(local.sources)
+        nir_src, red_src = local.sources
+        nir = nir_src.read(1, window=window, out_dtype="float32")
+        red = red_src.read(1, window=window, out_dtype="float32")
+        return _ndvi_block(nir, red, dtype)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
         with rasterio.open(output_path, "w", **meta) as dst:
-            dst.write(ndvi, 1)
-            dst.set_band_description(1, "NDVI")
+            windows = [window for _, window in dst.block_windows(1)]
+            # Only the main thread writes; batches bound the finished blocks
+            # waiting in memory for their turn
+            batch_size = 2 * workers
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for start in range(0, len(windows), batch_size):
+                    batch = windows[start : start + batch_size]
+                    for window, block in zip(batch, executor.map(compute, batch)):
+                        dst.write(block, 1, window=window)
+            dst.descriptions = ("NDVI",)
+    finally:
+        for src in sources:
+            src.close()
 
     return output_path
 
 
+def _ndvi_block(nir: Any, red: Any, dtype: str) -> Any:
+    """Compute NDVI for one block of float32 NIR and Red pixels.
+
+    Works in place: the numerator reuses the NIR buffer, so only the
+    denominator is allocated on top of the two inputs. With numba
+    installed, a compiled kernel computes it in a single pass instead.
+    """
+    import numpy as np
+
+    kernel = _ndvi_kernel()
+    if kernel is not None:
+        # A separate output (not the NIR buffer) lets the loop vectorize
+        out = np.empty(nir.shape, dtype=dtype)
+        return kernel(nir, red, out, np.float32(10000 if dtype == "int16" else 1))
+
+    denominator = nir + red
+    ndvi = np.subtract(nir, red, out=nir)
+
+    # Pixels with no signal divide by infinity and come out as 0
+    denominator[denominator <= 0] = np.inf
+    np.divide(ndvi, denominator, out=ndvi)
+
+    # Clip to valid range
+    np.clip(ndvi, -1, 1, out=ndvi)
+
+    if dtype == "int16":
+        np.multiply(ndvi, 10000, out=ndvi)
+        return np.rint(ndvi, out=ndvi).astype(np.int16)
+    return ndvi
+
+
+@functools.lru_cache(maxsize=1)
+def _ndvi_kernel() -> Any:
+    """Get a numba-compiled NDVI kernel, or None if numba is not installed.
+
+    The kernel computes ``clip((nir - red) / (nir + red), -1, 1) * scale``
+    in one pass over the block instead of the five array passes of the
+    numpy version, with identical results. It releases the GIL, so the
+    worker threads of :func:`calculate_ndvi` run it in parallel.
+    """
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(nogil=True, cache=True)
+    def kernel(nir: Any, red: Any, out: Any, scale: Any) -> Any:
+        for i in range(nir.shape[0]):
+            for j in range(nir.shape[1]):
+                total = nir[i, j] + red[i, j]
+                # Pixels with no signal come out as 0
+                value = (nir[i, j] - red[i, j]) / total if total > 0 else np.float32(0)
+                value = min(max(value, np.float32(-1)), np.float32(1))
+                out[i, j] = np.rint(value * scale) if scale != 1 else value
+        return out
+
+    return kernel
+
+
 def get_bounds_from_raster(raster_path: Union[str, Path]) -> tuple[list[float], str]:
     """Get bounding box and CRS from a raster file.
 
@@ -459,7 +790,6 @@ def get_bounds_from_raster(raster_path: Union[str, Path]) -> tuple[list[float],
     """
     try:
         import rasterio
-        from rasterio.warp import transform_bounds
     except ImportError as e:
         raise ImportError(
             "rasterio is required for processing. Install with: pip install cdse-client[processing]"
@@ -471,7 +801,7 @@ def get_bounds_from_raster(raster_path: Union[str, Path]) -> tuple[list[float],
 
         # Transform to WGS84
         if crs.to_epsg() != 4326:
-            bounds = transform_bounds(crs, "EPSG:4326", *bounds)
+            bounds = _transform_bounds(crs.to_wkt(), "EPSG:4326", tuple(bounds))
 
         bbox = [bounds[0], bounds[1], bounds[2], bounds[3]]
         return bbox, str(crs)
@@ -515,12 +845,11 @@ def reproject(
         meta = src.meta.copy()
         meta.update(
             {
-                "driver": "GTiff",
+                **_gtiff_options(src.dtypes[0]),
                 "crs": target_crs,
                 "transform": transform,
                 "width": width,
                 "height": height,
-                "compress": "lzw",
             }
         )
 
@@ -535,6 +864,7 @@ def reproject(
                     dst_transform=transform,
                     dst_crs=target_crs,
                     resampling=Resampling.bilinear,
+                    num_threads=os.cpu_count() or 1,
                 )
 
     return output_path
@@ -563,7 +893,9 @@ def create_rgb_preview(
         output_path: Output image path (default: input_preview.png)
         bands: Tuple of band indices for R, G, B (1-based, default: 1, 2, 3)
         percentile_stretch: Low and high percentiles for contrast stretch
-        size: Output size (width, height) or None for original size
+        size: Output size (width, height) or None for original size.
+            A smaller size is read directly from the raster's overviews
+            when it has them.
         format: Output format ("PNG" or "JPEG")
 
     Returns:
@@ -577,9 +909,9 @@ def create_rgb_preview(
         ... )
     """
     try:
-        import numpy as np
-        import rasterio
-        from PIL import Image
+        import numpy  # noqa: F401
+        import PIL  # noqa: F401
+        import rasterio  # noqa: F401
     except ImportError as e:
         missing = "rasterio" if "rasterio" in str(e) else "Pillow"
         raise ImportError(
@@ -595,46 +927,284 @@ def create_rgb_preview(
         output_path = input_path.parent / f"{input_path.stem}_preview.{format.lower()}"
     output_path = Path(output_path)
 
-    with rasterio.open(input_path) as src:
-        # Read bands
-        rgb_data = []
+    _render_rgb_preview(input_path, output_path, bands, percentile_stretch, size, format)
+
+    return output_path
+
+
+def _render_rgb_preview(
+    input_path: Path,
+    output_path: Path,
+    bands: tuple[int, int, int],
+    percentile_stretch: tuple[float, float],
+    size: Optional[tuple[int, int]],
+    format: str,
+) -> Any:
+    """Write the preview image of :func:`create_rgb_preview` and return it.
+
+    Returns:
+        The saved PIL image, so callers need not read the file back
+    """
+    import numpy as np
+    import rasterio
+    from PIL import Image
+    from rasterio.enums import Resampling
+
+    with rasterio.Env(**_GDAL_READ_ENV), rasterio.open(input_path) as src:
         for band_idx in bands:
             if band_idx > src.count:
                 raise ValidationError(
                     f"Band {band_idx} not found. File has {src.count} bands.", field="bands"
                 )
-            data = src.read(band_idx).astype(np.float32)
-            rgb_data.append(data)
-
-        # Stack into RGB array
-        rgb = np.stack(rgb_data, axis=-1)
-
-        # Apply percentile stretch for each channel
-        for i in range(3):
-            channel = rgb[:, :, i]
-            valid_mask = ~np.isnan(channel) & (channel > 0)
-            if valid_mask.any():
-                low = np.percentile(channel[valid_mask], percentile_stretch[0])
-                high = np.percentile(channel[valid_mask], percentile_stretch[1])
-                if high > low:
-                    channel = np.clip((channel - low) / (high - low), 0, 1)
-                    rgb[:, :, i] = channel
-
-        # Convert to 8-bit
-        rgb_8bit = (rgb * 255).astype(np.uint8)
+
+        # Read all three bands in one call and view them as an (H, W, 3)
+        # RGB array. A downscaled preview of a raster with overviews is
+        # read straight at its output size from the overview pyramid, so
+        # the full-resolution bands are never read nor resized. Without
+        # overviews GDAL would decimate the full bands, which is several
+        # times slower than reading them and resizing the 8-bit image.
+        downscale = False
+        if (
+            size is not None
+            and size[0] <= src.width
+            and size[1] <= src.height
+            and src.overviews(bands[0])
+        ):
+            downscale = True
+            data = src.read(
+                indexes=list(bands),
+                out_shape=(len(bands), size[1], size[0]),
+                resampling=Resampling.average,
+            )
+            rgb_8bit = _stretch_to_uint8(np.moveaxis(data, 0, -1), percentile_stretch)
+        elif {src.dtypes[i - 1] for i in bands} in ({"uint8"}, {"uint16"}):
+            # Full-size 8/16-bit preview: stretch strip by strip so the
+            # source pixels are never all in memory at once
+            rgb_8bit = _stretch_rows_to_uint8(src, list(bands), percentile_stretch)
+        else:
+            # Apply percentile stretch for each channel and convert to 8-bit
+            data = src.read(indexes=list(bands))
+            rgb_8bit = _stretch_to_uint8(np.moveaxis(data, 0, -1), percentile_stretch)
 
         # Create PIL image
         img = Image.fromarray(rgb_8bit, mode="RGB")
 
-        # Resize if requested
-        if size:
-            img = img.resize(size, Image.Resampling.LANCZOS)
+        # Resize if requested; when shrinking, reducing_gap first box-reduces
+        # the image by an integer factor, so Lanczos runs on a small image
+        if size and not downscale:
+            img = img.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
 
         # Save
         output_path.parent.mkdir(parents=True, exist_ok=True)
         img.save(output_path, format=format, quality=95 if format == "JPEG" else None)
 
-    return output_path
+    return img
+
+
+def _percentile_stretch(rgb: Any, percentiles: tuple[float, float]) -> Any:
+    """Contrast-stretch each channel of an (H, W, C) array to float32.
+
+    Each channel's low and high percentiles, taken over its valid pixels
+    (> 0, not NaN), are mapped to 0 and 1 and the result is clipped to that
+    range. Channels without valid pixels or with a flat distribution are
+    left unchanged.
+    """
+    import numpy as np
+
+    limits = _stretch_limits(rgb, percentiles)
+    return _apply_stretch(rgb.astype(np.float32), limits)
+
+
+def _stretch_to_uint8(rgb: Any, percentiles: tuple[float, float]) -> Any:
+    """Contrast-stretch an (H, W, C) array like :func:`_percentile_stretch`
+    and scale it to 8 bits.
+
+    8/16-bit input is mapped through a per-channel lookup table built with
+    the same float arithmetic, so the result is identical without ever
+    materializing a float32 copy of the image.
+    """
+    import numpy as np
+
+    limits = _stretch_limits(rgb, percentiles)
+    if rgb.dtype not in (np.uint8, np.uint16):
+        kernel = _stretch_kernel()
+        if kernel is not None and all(lim is not None and lim[1] > lim[0] for lim in limits):
+            low = np.array([lim[0] for lim in limits if lim is not None], dtype=np.float64)
+            high = np.array([lim[1] for lim in limits if lim is not None], dtype=np.float64)
+            out = np.empty(rgb.shape, dtype=np.uint8)
+            return kernel(rgb.astype(np.float32, copy=False), low, high - low, out)
+        return (_apply_stretch(rgb.astype(np.float32), limits) * 255).astype(np.uint8)
+
+    out = np.empty(rgb.shape, dtype=np.uint8)
+    for i, lut in enumerate(_stretch_luts(limits, rgb.dtype)):
+        np.take(lut, rgb[..., i], out=out[..., i], mode="clip")
+    return out
+
+
+@functools.lru_cache(maxsize=1)
+def _stretch_kernel() -> Any:
+    """Get a numba-compiled stretch-to-uint8 kernel, or None without numba.
+
+    The kernel stretches and packs each pixel in one pass, replacing the
+    float32 copy and the five array passes of :func:`_apply_stretch` and
+    the 8-bit conversion, with identical results. It needs the limits of
+    every channel.
+    """
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(nogil=True, cache=True)
+    def kernel(rgb: Any, low: Any, span: Any, out: Any) -> Any:
+        for i in range(rgb.shape[0]):
+            for j in range(rgb.shape[1]):
+                for c in range(rgb.shape[2]):
+                    # Rounded to float32 at each step, like the in-place
+                    # numpy operations on the float32 image
+                    value = np.float32(np.float32(rgb[i, j, c] - low[c]) / span[c])
+                    # NaN fails both comparisons and comes out as 0
+                    if not value > 0:
+                        value = np.float32(0)
+                    elif value > 1:
+                        value = np.float32(1)
+                    out[i, j, c] = np.uint8(value * np.float32(255))
+        return out
+
+    return kernel
+
+
+def _stretch_rows_to_uint8(src: Any, bands: list[int], percentiles: tuple[float, float]) -> Any:
+    """Stretch 8/16-bit bands of an open dataset to an (H, W, C) uint8 array.
+
+    Same result as :func:`_stretch_to_uint8` on the whole image, computed in
+    two passes over strips of rows: the first accumulates each band's
+    histogram, the second maps each strip through the lookup tables into
+    the output. Only one strip of source pixels is held in memory.
+    """
+    import numpy as np
+    from rasterio.windows import Window
+
+    dtype = np.dtype(src.dtypes[bands[0] - 1])
+    windows = [
+        Window(0, row, src.width, min(_BLOCK_SIZE, src.height - row))
+        for row in range(0, src.height, _BLOCK_SIZE)
+    ]
+
+    counts = np.zeros((len(bands), np.iinfo(dtype).max + 1), dtype=np.int64)
+    for window in windows:
+        strip = src.read(indexes=bands, window=window)
+        for i in range(len(bands)):
+            counts[i] += np.bincount(strip[i].ravel(), minlength=counts.shape[1])
+
+    limits = [_counts_percentiles(band_counts, percentiles) for band_counts in counts]
+    luts = _stretch_luts(limits, dtype)
+
+    out = np.empty((src.height, src.width, len(bands)), dtype=np.uint8)
+    for window in windows:
+        strip = src.read(indexes=bands, window=window)
+        rows = out[window.row_off : window.row_off + window.height]
+        for i, lut in enumerate(luts):
+            np.take(lut, strip[i], out=rows[..., i], mode="clip")
+    return out
+
+
+def _stretch_luts(limits: list[Optional[tuple[float, float]]], dtype: Any) -> list[Any]:
+    """Build the 8-bit lookup table of each channel of an 8/16-bit image.
+
+    The tables are computed with the float arithmetic of
+    :func:`_percentile_stretch`, so they reproduce its result exactly.
+    """
+    import numpy as np
+
+    levels = np.arange(np.iinfo(dtype).max + 1, dtype=np.float32)[:, np.newaxis]
+    return [
+        (_apply_stretch(levels.copy(), [channel_limits]) * 255).astype(np.uint8)[:, 0]
+        for channel_limits in limits
+    ]
+
+
+def _stretch_limits(
+    rgb: Any, percentiles: tuple[float, float]
+) -> list[Optional[tuple[float, float]]]:
+    """Get the (low, high) stretch percentiles of each channel of an array."""
+    import numpy as np
+
+    # 8/16-bit reflectances: exact percentiles from a histogram, in one
+    # O(n) pass and without copying the valid pixels out for sorting
+    histogram = rgb.dtype in (np.uint8, np.uint16)
+    limits: list[Optional[tuple[float, float]]] = []
+    for i in range(rgb.shape[-1]):
+        channel = rgb[..., i]
+        if histogram:
+            limits.append(_histogram_percentiles(channel, percentiles))
+            continue
+        # NaN compares False, so this also drops NaN pixels
+        valid = channel[channel > 0]
+        if valid.size:
+            low, high = np.percentile(valid, percentiles)
+            limits.append((low, high))
+        else:
+            limits.append(None)
+    return limits
+
+
+def _apply_stretch(rgb: Any, limits: list[Optional[tuple[float, float]]]) -> Any:
+    """Stretch the channels of a float (..., C) array in place."""
+    import numpy as np
+
+    for i, channel_limits in enumerate(limits):
+        if channel_limits is not None and channel_limits[1] > channel_limits[0]:
+            low, high = channel_limits
+            # In place on the channel's own plane, without temporaries
+            channel = rgb[..., i]
+            channel -= low
+            channel /= high - low
+            np.clip(channel, 0, 1, out=channel)
+    return rgb
+
+
+def _histogram_percentiles(
+    channel: Any, percentiles: tuple[float, float]
+) -> Optional[tuple[float, float]]:
+    """Percentiles of the nonzero pixels of an unsigned integer channel.
+
+    Gives the same values as ``np.percentile`` (linear interpolation) on
+    those pixels, reading the order statistics off a cumulative histogram.
+    Returns None if the channel has no nonzero pixels.
+    """
+    import numpy as np
+
+    return _counts_percentiles(np.bincount(channel.ravel()), percentiles)
+
+
+def _counts_percentiles(
+    counts: Any, percentiles: tuple[float, float]
+) -> Optional[tuple[float, float]]:
+    """Percentiles of the nonzero values counted in a histogram.
+
+    ``counts[v]`` is the number of pixels with value ``v``; the count of
+    zeros is ignored. Returns None if no nonzero value is counted.
+    """
+    import numpy as np
+
+    counts = counts.copy()
+    counts[0] = 0  # zero is no-data
+    cdf = np.cumsum(counts)
+    n = int(cdf[-1])
+    if n == 0:
+        return None
+
+    values = []
+    for q in percentiles:
+        index = (n - 1) * q / 100
+        below = math.floor(index)
+        # The k-th smallest pixel (0-based) is in the first bin whose
+        # cumulative count exceeds k
+        low, high = np.searchsorted(cdf, [below, min(below + 1, n - 1)], side="right")
+        values.append(float(low + (high - low) * (index - below)))
+    return values[0], values[1]
 
 
 def preview_product(
@@ -677,7 +1247,6 @@ def preview_product(
         ... )
         >>> print(f"Preview saved to: {result['preview_path']}")
     """
-    import tempfile
     from importlib.util import find_spec
 
     missing_deps: list[str] = []
@@ -693,8 +1262,6 @@ def preview_product(
             "Install with: pip install cdse-client[processing]"
         )
 
-    from PIL import Image
-
     safe_path = Path(safe_path)
     bands = bands or ["B04", "B03", "B02"]  # True color
 
@@ -713,41 +1280,25 @@ def preview_product(
         tiff_path = output_path.with_suffix(".tif")
         preview_path = output_path.with_suffix(".png")
 
-    # Extract, crop (if bbox), and stack
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir = Path(tmpdir)
-
-        # Extract bands
-        band_paths = extract_bands_from_safe(
-            safe_path, bands, output_dir=tmpdir, resolution=resolution
-        )
-
+    if bbox:
+        # Each band is opened once and read only within the bbox, with no
+        # intermediate full-scene stack; the overviews of the output also
+        # serve the downscaled preview read below
+        crop_and_stack(safe_path, bbox, bands, output_path=tiff_path, resolution=resolution)
+    else:
+        # Stack the bands straight from the product into the output GeoTIFF
+        band_paths = _band_sources(safe_path, bands, resolution)
         if not band_paths:
             raise ValidationError(f"Could not extract bands from {safe_path}", field="bands")
 
-        # Stack bands
-        stacked_path = tmpdir / "stacked.tif"
-        stack_bands(band_paths, stacked_path, band_order=bands)
+        stack_bands(band_paths, tiff_path, band_order=bands)
 
-        # Crop if bbox provided
-        if bbox:
-            crop_to_bbox(stacked_path, bbox, tiff_path)
-        else:
-            import shutil
-
-            shutil.copy(stacked_path, tiff_path)
-
-    # Generate preview
-    preview_path = create_rgb_preview(
-        tiff_path, output_path=preview_path, bands=(1, 2, 3), size=size
-    )
+    # Generate preview, keeping the image for return and display
+    img = _render_rgb_preview(tiff_path, preview_path, (1, 2, 3), (2, 98), size, "PNG")
 
     # Get bounds
     bounds, crs = get_bounds_from_raster(tiff_path)
 
-    # Load image for return and display
-    img = Image.open(preview_path)
-
     result = {
         "preview_path": preview_path,
         "tiff_path": tiff_path,
@@ -786,10 +1337,9 @@ def _display_in_jupyter(
     # Create HTML with image and info
     width, height = img.size
 
-    # Convert image to base64 for inline display
-    buffer = io.BytesIO()
-    img.save(buffer, format="PNG")
-    img_base64 = base64.b64encode(buffer.getvalue()).decode()
+    # Inline the PNG already written to disk instead of encoding the image
+    # again; an inline image also survives saving and exporting the notebook
+    img_base64 = base64.b64encode(path.read_bytes()).decode("ascii")
 
     html = f"""
     <div style="border: 1px solid #ccc; padding: 10px; border-radius: 5px; max-width: 820px;">
@@ -840,23 +1390,12 @@ def quick_preview(
 
     tiff_path = Path(tiff_path)
 
-    with rasterio.open(tiff_path) as src:
+    with rasterio.Env(**_GDAL_READ_ENV), rasterio.open(tiff_path) as src:
         # Read RGB bands
-        rgb_data = []
-        for band_idx in bands:
-            data = src.read(band_idx).astype(np.float32)
-            rgb_data.append(data)
-
-        rgb = np.stack(rgb_data, axis=-1)
+        rgb = np.moveaxis(src.read(indexes=list(bands)), 0, -1)
 
         # Percentile stretch
-        for i in range(3):
-            channel = rgb[:, :, i]
-            valid = channel[channel > 0]
-            if len(valid) > 0:
-                low, high = np.percentile(valid, [2, 98])
-                if high > low:
-                    rgb[:, :, i] = np.clip((channel - low) / (high - low), 0, 1)
+        rgb = _percentile_stretch(rgb, (2, 98))
 
         # Get bounds for extent
         bounds = src.bounds
@@ -944,23 +1483,21 @@ def compare_previews(
 
     titles = titles or [Path(p).stem for p in paths]
 
-    for ax, path, title in zip(axes, paths, titles):
-        with rasterio.open(path) as src:
+    def load(path: Union[str, Path]) -> Any:
+        with rasterio.Env(**_GDAL_READ_ENV), rasterio.open(path) as src:
             # Read RGB
-            rgb = []
-            for i in range(1, min(4, src.count + 1)):
-                rgb.append(src.read(i).astype(np.float32))
-            rgb = np.stack(rgb, axis=-1)
-
-            # Stretch
-            for i in range(rgb.shape[-1]):
-                channel = rgb[:, :, i]
-                valid = channel[channel > 0]
-                if len(valid) > 0:
-                    low, high = np.percentile(valid, [2, 98])
-                    if high > low:
-                        rgb[:, :, i] = np.clip((channel - low) / (high - low), 0, 1)
+            indexes = list(range(1, min(4, src.count + 1)))
+            rgb = np.moveaxis(src.read(indexes=indexes), 0, -1)
+
+        # Stretch
+        return _percentile_stretch(rgb, (2, 98))
+
+    # Rasters are read and stretched in parallel (GDAL and numpy release
+    # the GIL); matplotlib is not thread-safe, so only this thread draws
+    with ThreadPoolExecutor(max_workers=min(n, os.cpu_count() or 1)) as executor:
+        images = list(executor.map(load, paths))
 
+    for ax, rgb, title in zip(axes, images, titles):
         ax.imshow(rgb)
         ax.set_title(title)
         ax.axis("off")
@@ -1,9 +1,24 @@
 """Product representation for CDSE catalog results."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
+# From Python 3.11 on, fromisoformat accepts the "Z" UTC suffix of STAC
+# datetimes itself
+_ISO_Z_SUPPORTED = sys.version_info >= (3, 11)
+
+
+def _parse_datetime(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 datetime string, or return None if it is invalid."""
+    if not _ISO_Z_SUPPORTED:
+        value = value.replace("Z", "+00:00")
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
 
 @dataclass
 class Product:
@@ -50,20 +65,14 @@ class Product:
 
         # Parse datetime
         dt_str = props.get("datetime")
-        dt = None
-        if dt_str:
-            try:
-                # Handle various datetime formats
-                dt_str = dt_str.replace("Z", "+00:00")
-                dt = datetime.fromisoformat(dt_str)
-            except ValueError:
-                pass
+        dt = _parse_datetime(dt_str) if dt_str else None
 
         # Get product name - try multiple fields
-        name = feature.get("id") or props.get("id") or props.get("title") or "unknown"
+        feature_id = feature.get("id", "")
+        name = feature_id or props.get("id") or props.get("title") or "unknown"
 
         return cls(
-            id=feature.get("id", ""),
+            id=feature_id,
             name=name,
             collection=props.get("collection", feature.get("collection", "")),
             datetime=dt,
@@ -1,5 +1,6 @@
 """Tests for Catalog class."""
 
+import re
 from unittest.mock import MagicMock
 
 import pytest
@@ -74,13 +75,16 @@ class TestCatalog:
             ],
         }
 
-    def test_search_success(self, catalog, mock_session, sample_response):
-        """Test successful search."""
+    @pytest.fixture
+    def search_response(self, mock_session, sample_response):
+        """Make the mock session answer searches with the sample response."""
         mock_response = MagicMock()
         mock_response.json.return_value = sample_response
-        mock_response.raise_for_status = MagicMock()
         mock_session.post.return_value = mock_response
+        return mock_response
 
+    def test_search_success(self, catalog, mock_session, search_response):
+        """Test successful search."""
         products = catalog.search(
             bbox=[9.0, 45.0, 9.5, 45.5],
             start_date="2024-01-01",
@@ -91,13 +95,8 @@ class TestCatalog:
         assert all(isinstance(p, Product) for p in products)
         mock_session.post.assert_called_once()
 
-    def test_search_with_cloud_filter(self, catalog, mock_session, sample_response):
+    def test_search_with_cloud_filter(self, catalog, search_response):
         """Test search with cloud cover filter."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = sample_response
-        mock_response.raise_for_status = MagicMock()
-        mock_session.post.return_value = mock_response
-
         products = catalog.search(
             bbox=[9.0, 45.0, 9.5, 45.5],
             start_date="2024-01-01",
@@ -117,71 +116,48 @@ class TestCatalog:
         mock_response.raise_for_status.side_effect = requests.HTTPError(response=mock_response)
         mock_session.post.return_value = mock_response
 
-        with pytest.raises(CatalogError) as exc_info:
+        with pytest.raises(CatalogError, match="Catalog search failed"):
             catalog.search(
                 bbox=[9.0, 45.0, 9.5, 45.5],
                 start_date="2024-01-01",
                 end_date="2024-01-31",
             )
 
-        assert "Catalog search failed" in str(exc_info.value)
-
-    def test_validate_bbox_invalid_length(self, catalog):
-        """Test bbox validation with wrong length."""
-        with pytest.raises(ValidationError) as exc_info:
-            catalog._validate_bbox([9.0, 45.0, 9.5])  # Only 3 values
-
-        assert "bbox must be a list of 4 values" in str(exc_info.value)
-
-    def test_validate_bbox_invalid_longitude(self, catalog):
-        """Test bbox validation with invalid longitude."""
-        with pytest.raises(ValidationError) as exc_info:
-            catalog._validate_bbox([200.0, 45.0, 210.0, 46.0])
-
-        assert "Longitude must be between -180 and 180" in str(exc_info.value)
-
-    def test_validate_bbox_invalid_latitude(self, catalog):
-        """Test bbox validation with invalid latitude."""
-        with pytest.raises(ValidationError) as exc_info:
-            catalog._validate_bbox([9.0, 100.0, 9.5, 110.0])
-
-        assert "Latitude must be between -90 and 90" in str(exc_info.value)
-
-    def test_validate_bbox_min_max_order(self, catalog):
-        """Test bbox validation with min > max."""
-        with pytest.raises(ValidationError) as exc_info:
-            catalog._validate_bbox([9.5, 45.0, 9.0, 45.5])  # min_lon > max_lon
-
-        assert "min_lon must be < max_lon" in str(exc_info.value)
-
-    def test_validate_dates_invalid_format(self, catalog):
-        """Test date validation with invalid format."""
-        with pytest.raises(ValidationError) as exc_info:
-            catalog._validate_dates("2024/01/01", "2024-01-31")
-
-        assert "Invalid date format" in str(exc_info.value)
-
-    def test_validate_dates_start_after_end(self, catalog):
-        """Test date validation with start > end."""
-        with pytest.raises(ValidationError) as exc_info:
-            catalog._validate_dates("2024-01-31", "2024-01-01")
-
-        assert "start_date must be before end_date" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        "bbox, message",
+        [
+            ([9.0, 45.0, 9.5], "bbox must be a list of 4 values"),
+            ([200.0, 45.0, 210.0, 46.0], "Longitude must be between -180 and 180"),
+            ([9.0, 100.0, 9.5, 110.0], "Latitude must be between -90 and 90"),
+            ([9.5, 45.0, 9.0, 45.5], "min_lon must be < max_lon"),
+        ],
+        ids=["length", "longitude", "latitude", "min_max_order"],
+    )
+    def test_validate_bbox_invalid(self, catalog, bbox, message):
+        """Test bbox validation rejects malformed and out-of-range boxes."""
+        with pytest.raises(ValidationError, match=re.escape(message)):
+            catalog._validate_bbox(bbox)
+
+    @pytest.mark.parametrize(
+        "start, end, message",
+        [
+            ("2024/01/01", "2024-01-31", "Invalid date format"),
+            ("2024-01-31", "2024-01-01", "start_date must be before end_date"),
+        ],
+        ids=["format", "start_after_end"],
+    )
+    def test_validate_dates_invalid(self, catalog, start, end, message):
+        """Test date validation rejects bad formats and reversed ranges."""
+        with pytest.raises(ValidationError, match=re.escape(message)):
+            catalog._validate_dates(start, end)
 
     def test_validate_cloud_cover_out_of_range(self, catalog):
         """Test cloud cover validation."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="cloud_cover must be between 0 and 100"):
             catalog._validate_cloud_cover(150.0)
 
-        assert "cloud_cover must be between 0 and 100" in str(exc_info.value)
-
-    def test_search_by_point(self, catalog, mock_session, sample_response):
+    def test_search_by_point(self, catalog, mock_session, search_response):
         """Test search by geographic point."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = sample_response
-        mock_response.raise_for_status = MagicMock()
-        mock_session.post.return_value = mock_response
-
         catalog.search_by_point(
             lon=9.25,
             lat=45.25,
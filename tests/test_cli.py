@@ -2,7 +2,7 @@
 
 import json
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import call, patch
 
 import pytest
 
@@ -34,6 +34,38 @@ def make_sample_product(
     )
 
 
+@pytest.fixture
+def sample_product():
+    """Create a sample product."""
+    return make_sample_product()
+
+
+@pytest.fixture
+def credentials(monkeypatch):
+    """Set CDSE credentials in the environment."""
+    monkeypatch.setenv("CDSE_CLIENT_ID", "test_id")
+    monkeypatch.setenv("CDSE_CLIENT_SECRET", "test_secret")
+
+
+@pytest.fixture(scope="module")
+def download_dir(tmp_path_factory):
+    """Output directory shared by the download tests, which write no files."""
+    return tmp_path_factory.mktemp("downloads")
+
+
+@pytest.fixture
+def mock_client_class():
+    """Patch the CDSEClient class used by the CLI."""
+    with patch("cdse.cli.CDSEClient") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_client(mock_client_class):
+    """Return the client instance the CLI gets from the patched class."""
+    return mock_client_class.return_value
+
+
 class TestMainCLI:
     """Tests for main CLI entry point."""
 
@@ -44,7 +76,7 @@ class TestMainCLI:
         captured = capsys.readouterr()
         assert "usage:" in captured.out.lower() or "cdse" in captured.out
 
-    def test_version_flag(self, capsys):
+    def test_version_flag(self):
         """Test --version flag."""
         with pytest.raises(SystemExit) as exc_info:
             main(["--version"])
@@ -64,17 +96,10 @@ class TestMainCLI:
 class TestSearchCommand:
     """Tests for search command."""
 
-    @patch("cdse.cli.CDSEClient")
-    def test_search_basic(self, mock_client_class, capsys, monkeypatch):
+    def test_search_basic(self, mock_client, capsys, credentials, sample_product):
         """Test basic search command."""
-        monkeypatch.setenv("CDSE_CLIENT_ID", "test_id")
-        monkeypatch.setenv("CDSE_CLIENT_SECRET", "test_secret")
-
-        # Setup mock
-        mock_client = MagicMock()
-        mock_client.search.return_value = [make_sample_product()]
+        mock_client.search.return_value = [sample_product]
         mock_client.get_products_size.return_value = 1.0
-        mock_client_class.return_value = mock_client
 
         result = main(
             [
@@ -93,15 +118,9 @@ class TestSearchCommand:
         captured = capsys.readouterr()
         assert "Found 1 products" in captured.out
 
-    @patch("cdse.cli.CDSEClient")
-    def test_search_with_json_output(self, mock_client_class, capsys, monkeypatch):
+    def test_search_with_json_output(self, mock_client, capsys, credentials, sample_product):
         """Test search with --json flag."""
-        monkeypatch.setenv("CDSE_CLIENT_ID", "test_id")
-        monkeypatch.setenv("CDSE_CLIENT_SECRET", "test_secret")
-
-        mock_client = MagicMock()
-        mock_client.search.return_value = [make_sample_product()]
-        mock_client_class.return_value = mock_client
+        mock_client.search.return_value = [sample_product]
 
         result = main(
             [
@@ -123,15 +142,9 @@ class TestSearchCommand:
         assert isinstance(output, list)
         assert len(output) == 1
 
-    @patch("cdse.cli.CDSEClient")
-    def test_search_no_results(self, mock_client_class, capsys, monkeypatch):
+    def test_search_no_results(self, mock_client, capsys, credentials):
         """Test search with no results."""
-        monkeypatch.setenv("CDSE_CLIENT_ID", "test_id")
-        monkeypatch.setenv("CDSE_CLIENT_SECRET", "test_secret")
-
-        mock_client = MagicMock()
         mock_client.search.return_value = []
-        mock_client_class.return_value = mock_client
 
         result = main(
             [
@@ -149,11 +162,8 @@ class TestSearchCommand:
         captured = capsys.readouterr()
         assert "No products found" in captured.out
 
-    def test_search_invalid_bbox(self, capsys, monkeypatch):
+    def test_search_invalid_bbox(self, capsys, credentials):
         """Test search with invalid bbox."""
-        monkeypatch.setenv("CDSE_CLIENT_ID", "test_id")
-        monkeypatch.setenv("CDSE_CLIENT_SECRET", "test_secret")
-
         result = main(
             [
                 "search",
@@ -170,11 +180,8 @@ class TestSearchCommand:
         captured = capsys.readouterr()
         assert "Invalid bbox" in captured.err
 
-    def test_search_missing_bbox_and_geometry(self, capsys, monkeypatch):
+    def test_search_missing_bbox_and_geometry(self, capsys, credentials):
         """Test search without bbox or geometry."""
-        monkeypatch.setenv("CDSE_CLIENT_ID", "test_id")
-        monkeypatch.setenv("CDSE_CLIENT_SECRET", "test_secret")
-
         result = main(
             [
                 "search",
@@ -189,81 +196,84 @@ class TestSearchCommand:
         captured = capsys.readouterr()
         assert "--bbox" in captured.err or "--geometry" in captured.err
 
-
-class TestDownloadCommand:
-    """Tests for download command."""
-
-    @patch("cdse.cli.CDSEClient")
-    def test_download_by_name(self, mock_client_class, capsys, monkeypatch, tmp_path):
-        """Test download by product name."""
-        monkeypatch.setenv("CDSE_CLIENT_ID", "test_id")
-        monkeypatch.setenv("CDSE_CLIENT_SECRET", "test_secret")
-
-        mock_client = MagicMock()
-        mock_product = make_sample_product()
-        mock_client.search_by_name.return_value = mock_product
-        mock_client.download.return_value = tmp_path / "product.zip"
-        mock_client_class.return_value = mock_client
+    def test_search_geometry_file_uses_top_level_bbox(self, mock_client, tmp_path, credentials):
+        """Test that --geometry searches a collection's top-level bbox."""
+        mock_client.search.return_value = []
+        collection = {
+            "type": "FeatureCollection",
+            "features": [{"type": "Feature", "geometry": {"type": "Point", "coordinates": [1, 1]}}],
+            "bbox": [0, 0, 10, 10],
+        }
+        file_path = tmp_path / "area.geojson"
+        file_path.write_text(json.dumps(collection))
 
         result = main(
-            [
-                "download",
-                "--name",
-                "S2A_MSIL2A_20240115T102351",
-                "-o",
-                str(tmp_path),
-            ]
+            ["search", "--geometry", str(file_path), "-s", "2024-01-01", "-e", "2024-01-31"]
         )
 
         assert result == 0
-        mock_client.search_by_name.assert_called()
-        mock_client.download.assert_called_once()
+        assert mock_client.search.call_args.kwargs["bbox"] == [0, 0, 10, 10]
 
-    @patch("cdse.cli.CDSEClient")
-    def test_download_by_uuid(self, mock_client_class, capsys, monkeypatch, tmp_path):
-        """Test download by UUID."""
-        monkeypatch.setenv("CDSE_CLIENT_ID", "test_id")
-        monkeypatch.setenv("CDSE_CLIENT_SECRET", "test_secret")
 
-        mock_client = MagicMock()
-        mock_product = make_sample_product()
-        mock_client.search_by_id.return_value = mock_product
-        mock_client.download.return_value = tmp_path / "product.zip"
-        mock_client_class.return_value = mock_client
+class TestDownloadCommand:
+    """Tests for download command."""
 
-        result = main(
-            [
+    @pytest.fixture
+    def mock_client(self, mock_client, download_dir, sample_product):
+        """Make the client mock find the sample product."""
+        mock_client.search_by_name.return_value = sample_product
+        mock_client.search_by_id.return_value = sample_product
+        mock_client.download.return_value = download_dir / "product.zip"
+        mock_client.download_quicklook.return_value = download_dir / "quicklook.jpeg"
+        return mock_client
+
+    @pytest.mark.parametrize(
+        "args, lookup, lookup_call, action",
+        [
+            (
+                ["--name", "S2A_MSIL2A_20240115T102351"],
+                "search_by_name",
+                call("S2A_MSIL2A_20240115T102351", exact=True),
                 "download",
-                "--uuid",
-                "test-uuid-12345",
-                "-o",
-                str(tmp_path),
-            ]
-        )
+            ),
+            (
+                ["--uuid", "test-uuid-12345"],
+                "search_by_id",
+                call("test-uuid-12345"),
+                "download",
+            ),
+            (
+                ["--name", "S2A_MSIL2A_20240115T102351", "--quicklook"],
+                "search_by_name",
+                call("S2A_MSIL2A_20240115T102351", exact=True),
+                "download_quicklook",
+            ),
+        ],
+        ids=["by_name", "by_uuid", "quicklook"],
+    )
+    def test_download(
+        self, mock_client, credentials, download_dir, args, lookup, lookup_call, action
+    ):
+        """Test download looks the product up and fetches it."""
+        result = main(["download", *args, "-o", str(download_dir)])
 
         assert result == 0
-        mock_client.search_by_id.assert_called_once_with("test-uuid-12345")
+        getattr(mock_client, lookup).assert_called_once_with(
+            *lookup_call.args, **lookup_call.kwargs
+        )
+        getattr(mock_client, action).assert_called_once()
 
-    def test_download_missing_uuid_and_name(self, capsys, monkeypatch):
+    def test_download_missing_uuid_and_name(self, capsys, credentials):
         """Test download without uuid or name."""
-        monkeypatch.setenv("CDSE_CLIENT_ID", "test_id")
-        monkeypatch.setenv("CDSE_CLIENT_SECRET", "test_secret")
-
         result = main(["download", "-o", "."])
 
         assert result == 1
         captured = capsys.readouterr()
         assert "--uuid" in captured.err or "--name" in captured.err
 
-    @patch("cdse.cli.CDSEClient")
-    def test_download_product_not_found(self, mock_client_class, capsys, monkeypatch):
+    def test_download_product_not_found(self, mock_client, capsys, credentials):
         """Test download when product not found."""
-        monkeypatch.setenv("CDSE_CLIENT_ID", "test_id")
-        monkeypatch.setenv("CDSE_CLIENT_SECRET", "test_secret")
-
-        mock_client = MagicMock()
         mock_client.search_by_name.return_value = None
-        mock_client_class.return_value = mock_client
 
         result = main(
             [
@@ -277,48 +287,16 @@ class TestDownloadCommand:
         captured = capsys.readouterr()
         assert "not found" in captured.err.lower()
 
-    @patch("cdse.cli.CDSEClient")
-    def test_download_quicklook(self, mock_client_class, capsys, monkeypatch, tmp_path):
-        """Test download quicklook only."""
-        monkeypatch.setenv("CDSE_CLIENT_ID", "test_id")
-        monkeypatch.setenv("CDSE_CLIENT_SECRET", "test_secret")
-
-        mock_client = MagicMock()
-        mock_product = make_sample_product()
-        mock_client.search_by_name.return_value = mock_product
-        mock_client.download_quicklook.return_value = tmp_path / "quicklook.jpeg"
-        mock_client_class.return_value = mock_client
-
-        result = main(
-            [
-                "download",
-                "--name",
-                "S2A_MSIL2A_20240115T102351",
-                "--quicklook",
-                "-o",
-                str(tmp_path),
-            ]
-        )
-
-        assert result == 0
-        mock_client.download_quicklook.assert_called_once()
-
 
 class TestCollectionsCommand:
     """Tests for collections command."""
 
-    @patch("cdse.cli.CDSEClient")
-    def test_list_collections(self, mock_client_class, capsys, monkeypatch):
+    def test_list_collections(self, mock_client, capsys, credentials):
         """Test listing collections."""
-        monkeypatch.setenv("CDSE_CLIENT_ID", "test_id")
-        monkeypatch.setenv("CDSE_CLIENT_SECRET", "test_secret")
-
-        mock_client = MagicMock()
         mock_client.get_collections.return_value = {
             "sentinel-2-l2a": "Sentinel-2 L2A",
             "sentinel-1-grd": "Sentinel-1 GRD",
         }
-        mock_client_class.return_value = mock_client
 
         result = main(["collections"])
 
@@ -1,5 +1,6 @@
 """Tests for CDSEClient class."""
 
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -38,7 +39,7 @@ class TestCDSEClient:
 
         mock_auth.assert_called_once_with("id", "secret")
 
-    def test_catalog_lazy_init(self, client, mock_auth):
+    def test_catalog_lazy_init(self, client):
         """Test catalog is lazily initialized."""
         assert client._catalog is None
 
@@ -48,7 +49,7 @@ class TestCDSEClient:
         assert isinstance(catalog, Catalog)
         assert client._catalog is catalog  # Same instance
 
-    def test_downloader_lazy_init(self, client, mock_auth):
+    def test_downloader_lazy_init(self, client):
         """Test downloader is lazily initialized."""
         assert client._downloader is None
 
@@ -101,8 +102,6 @@ class TestCDSEClient:
     @patch.object(Downloader, "download")
     def test_download(self, mock_download, client):
         """Test download delegates to downloader."""
-        from pathlib import Path
-
         mock_path = Path("/downloads/product.zip")
         mock_download.return_value = mock_path
 
@@ -115,8 +114,6 @@ class TestCDSEClient:
     @patch.object(Downloader, "download_all")
     def test_download_all(self, mock_download_all, client):
         """Test download_all delegates to downloader."""
-        from pathlib import Path
-
         mock_paths = [Path("/downloads/p1.zip"), Path("/downloads/p2.zip")]
         mock_download_all.return_value = mock_paths
 
@@ -133,7 +130,7 @@ class TestCDSEClient:
         assert isinstance(collections, dict)
         assert "sentinel-2-l2a" in collections
 
-    def test_refresh_auth(self, client, mock_auth):
+    def test_refresh_auth(self, client):
         """Test refresh_auth resets clients."""
         # Access catalog and downloader to initialize them
         _ = client.catalog
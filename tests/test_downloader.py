@@ -1,35 +1,128 @@
 """Tests for Downloader class."""
 
-import tempfile
-from pathlib import Path
-from unittest.mock import MagicMock
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 
+from cdse import downloader as downloader_module
 from cdse.downloader import Downloader
 from cdse.exceptions import DownloadError
 from cdse.product import Product
 
 
+class _BrokenStream(io.BytesIO):
+    """Raw stream that fails once its initial content has been read."""
+
+    def read(self, size=-1):
+        data = super().read(size)
+        if not data:
+            raise requests.ConnectionError("connection reset")
+        return data
+
+    def readinto(self, buffer):
+        n = super().readinto(buffer)
+        if not n:
+            raise requests.ConnectionError("connection reset")
+        return n
+
+
+class _ProductHandler(BaseHTTPRequestHandler):
+    """Serve each path's own bytes as its content, honouring Range requests.
+
+    Requests are recorded in ``server.log``; a path in ``server.unavailable``
+    answers 503 once.
+    """
+
+    def do_HEAD(self):
+        self.server.log.append(("HEAD", self.path, dict(self.headers)))
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(self.path)))
+        self.end_headers()
+
+    def do_GET(self):
+        self.server.log.append(("GET", self.path, dict(self.headers)))
+        if self.path in self.server.unavailable:
+            self.server.unavailable.discard(self.path)
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = self.path.encode()
+        byte_range = self.headers.get("Range")
+        if byte_range:
+            body = body[int(byte_range[len("bytes=") : -1]) :]
+            self.send_response(206)
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_product(name: str = "S2A_MSIL2A_20240115", **fields) -> Product:
+    """Create a Product without assets, overriding any field via ``fields``."""
+    defaults = {
+        "id": "test-product",
+        "collection": "sentinel-2-l2a",
+        "datetime": None,
+        "cloud_cover": None,
+        "geometry": {},
+        "bbox": [],
+        "properties": {},
+        "assets": {},
+    }
+    return Product(name=name, **{**defaults, **fields})
+
+
+def _stream_response(body, *, content_length=None, status_code=200):
+    """Build a mock streaming response whose raw stream yields ``body``.
+
+    ``body`` is either bytes or a ready-made raw stream; ``content_length``
+    defaults to the length of the bytes.
+    """
+    if isinstance(body, bytes):
+        if content_length is None:
+            content_length = len(body)
+        body = io.BytesIO(body)
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"content-length": str(content_length)}
+    response.raw = body
+    return response
+
+
 class TestDownloader:
     """Tests for Downloader class."""
 
+    @pytest.fixture(autouse=True)
+    def clear_uuid_cache(self):
+        """Isolate tests from the process-wide OData UUID cache."""
+        downloader_module._uuid_cache.clear()
+        yield
+        downloader_module._uuid_cache.clear()
+
     @pytest.fixture
     def mock_session(self):
         """Create a mock session."""
         return MagicMock(spec=requests.Session)
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield tmpdir
-
-    @pytest.fixture
-    def downloader(self, mock_session, temp_dir):
+    def downloader(self, mock_session, tmp_path):
         """Create a Downloader instance."""
-        return Downloader(mock_session, output_dir=temp_dir)
+        return Downloader(mock_session, output_dir=str(tmp_path))
 
     @pytest.fixture
     def sample_product(self):
@@ -46,39 +139,194 @@ class TestDownloader:
             assets={"download": {"href": "https://example.com/download/product.zip"}},
         )
 
-    def test_init_creates_output_dir(self, mock_session, temp_dir):
+    def test_init_creates_output_dir(self, mock_session, tmp_path):
         """Test that init creates output directory."""
-        output_path = Path(temp_dir) / "downloads"
+        output_path = tmp_path / "downloads"
         Downloader(mock_session, output_dir=str(output_path))
 
         assert output_path.exists()
 
-    def test_download_success(self, downloader, mock_session, sample_product, temp_dir):
+    def test_init_keeps_session_adapter(self, tmp_path):
+        """Test that init does not replace the caller's HTTPS adapter."""
+        session = requests.Session()
+        adapter = HTTPAdapter(max_retries=3)
+        session.mount("https://", adapter)
+
+        Downloader(session, output_dir=str(tmp_path), max_workers=16)
+
+        assert session.get_adapter("https://example.com") is adapter
+
+    def test_download_all_grows_connection_pool(self, tmp_path):
+        """Test that the HTTPS pool holds a connection per parallel worker."""
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(max_retries=3))
+        downloader = Downloader(session, output_dir=str(tmp_path))
+
+        downloader.download_all([], parallel=True, max_workers=16)
+
+        adapter = session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 3
+
+    def test_download_all_keeps_custom_adapter(self, tmp_path):
+        """Test that a custom adapter is never replaced to grow the pool."""
+
+        class CustomAdapter(HTTPAdapter):
+            pass
+
+        session = requests.Session()
+        adapter = CustomAdapter()
+        session.mount("https://", adapter)
+        downloader = Downloader(session, output_dir=str(tmp_path))
+
+        downloader.download_all([], parallel=True, max_workers=16)
+
+        assert session.get_adapter("https://example.com") is adapter
+
+    def test_download_success(self, downloader, mock_session, sample_product):
         """Test successful download."""
         # Mock response
-        mock_response = MagicMock()
-        mock_response.headers = {"content-length": "1000"}
-        mock_response.iter_content.return_value = [b"test data"]
-        mock_response.raise_for_status = MagicMock()
-        mock_session.get.return_value = mock_response
+        mock_session.get.return_value = _stream_response(b"test data", content_length=1000)
 
         path = downloader.download(sample_product, progress=False)
 
         assert path.exists()
         assert path.name == "S2A_MSIL2A_20240115_T32TNR.zip"
+        assert not path.with_name(path.name + ".part").exists()
+        # Space preallocated for the advertised length is released
+        assert path.read_bytes() == b"test data"
+
+    def test_download_without_progress_uses_copyfileobj(
+        self, downloader, mock_session, sample_product
+    ):
+        """Test that an unobserved download is copied without the chunk loop."""
+        mock_session.get.return_value = _stream_response(b"test data")
+
+        with patch("cdse.downloader.shutil.copyfileobj", wraps=shutil.copyfileobj) as mock_copy:
+            path = downloader.download(sample_product, progress=False)
+
+        mock_copy.assert_called_once()
+        assert path.read_bytes() == b"test data"
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="requires posix_fadvise")
+    def test_download_drop_page_cache(self, mock_session, sample_product, tmp_path):
+        """Test that a finished download is evicted from the page cache when requested."""
+        mock_session.get.return_value = _stream_response(b"test data")
+        downloader = Downloader(mock_session, output_dir=str(tmp_path), drop_page_cache=True)
+
+        with patch("cdse.downloader.os.posix_fadvise") as mock_fadvise:
+            path = downloader.download(sample_product, progress=False)
+
+        mock_fadvise.assert_called_once_with(ANY, 0, 0, os.POSIX_FADV_DONTNEED)
+        assert path.read_bytes() == b"test data"
+
+    def test_download_progress_callback_replaces_bar(
+        self, downloader, mock_session, sample_product
+    ):
+        """Test that a progress callback is used instead of a tqdm bar."""
+        mock_session.get.return_value = _stream_response(b"test data")
+        callback = MagicMock()
+
+        with patch("cdse.downloader.tqdm") as mock_tqdm:
+            downloader.download(sample_product, progress_callback=callback)
+
+        mock_tqdm.assert_not_called()
+        assert callback.call_args_list[-1].args == (9, 9)
+
+    def test_download_no_partial_at_output_path(self, mock_session, sample_product, tmp_path):
+        """Test that an interrupted download leaves only a .part sidecar."""
+        downloader = Downloader(mock_session, output_dir=str(tmp_path), max_retries=1)
+        mock_session.get.return_value = _stream_response(
+            _BrokenStream(b"partial"), content_length=1000
+        )
+
+        with pytest.raises(DownloadError):
+            downloader.download(sample_product, progress=False)
+
+        output_path = tmp_path / "S2A_MSIL2A_20240115_T32TNR.zip"
+        assert not output_path.exists()
+        assert output_path.with_name(output_path.name + ".part").read_bytes() == b"partial"
+
+    @patch("cdse.downloader.time.sleep")
+    def test_download_resumes_interrupted_stream(
+        self, mock_sleep, downloader, mock_session, sample_product
+    ):
+        """Test that a dropped connection is resumed with a Range request."""
+        sample_product.properties["checksum"] = [
+            {"Algorithm": "MD5", "Value": hashlib.md5(b"test data").hexdigest()}
+        ]
+        broken = _stream_response(_BrokenStream(b"test"), content_length=9)
+        rest = _stream_response(b" data", status_code=206)
+        mock_session.get.side_effect = [broken, rest]
+
+        path = downloader.download_with_checksum(sample_product, progress=False)
+
+        assert path.read_bytes() == b"test data"
+        assert mock_session.get.call_args.kwargs["headers"]["Range"] == "bytes=4-"
 
-    def test_download_skip_existing(self, downloader, mock_session, sample_product, temp_dir):
+    def test_download_restarts_when_range_ignored(
+        self, downloader, mock_session, sample_product, tmp_path
+    ):
+        """Test that a leftover .part file is discarded when the server sends it all."""
+        part_path = tmp_path / "S2A_MSIL2A_20240115_T32TNR.zip.part"
+        part_path.write_bytes(b"stale")
+        mock_session.get.return_value = _stream_response(b"test data")
+
+        path = downloader.download(sample_product, progress=False)
+
+        assert path.read_bytes() == b"test data"
+        assert mock_session.get.call_args.kwargs["headers"]["Range"] == "bytes=5-"
+
+    def test_download_skip_existing(self, downloader, mock_session, sample_product, tmp_path):
         """Test that existing files are skipped."""
         # Create existing file
-        existing_file = Path(temp_dir) / "S2A_MSIL2A_20240115_T32TNR.zip"
+        existing_file = tmp_path / "S2A_MSIL2A_20240115_T32TNR.zip"
         existing_file.write_text("existing content")
 
+        head_response = MagicMock()
+        head_response.status_code = 200
+        head_response.headers = {"content-length": str(len("existing content"))}
+        mock_session.head.return_value = head_response
+
         path = downloader.download(sample_product)
 
-        # Should return existing path without making request
+        # Should return existing path without downloading again
         assert path == existing_file
         mock_session.get.assert_not_called()
 
+    def test_download_skip_existing_matching_product_size(
+        self, downloader, mock_session, sample_product, tmp_path
+    ):
+        """Test that a file matching the product's size is skipped without any request."""
+        existing_file = tmp_path / "S2A_MSIL2A_20240115_T32TNR.zip"
+        existing_file.write_bytes(b"test data")
+        sample_product.properties["size"] = 9
+
+        path = downloader.download(sample_product)
+
+        assert path == existing_file
+        mock_session.head.assert_not_called()
+        mock_session.get.assert_not_called()
+
+    def test_download_replaces_truncated_existing(
+        self, downloader, mock_session, sample_product, tmp_path
+    ):
+        """Test that an existing file smaller than the remote one is downloaded again."""
+        existing_file = tmp_path / "S2A_MSIL2A_20240115_T32TNR.zip"
+        existing_file.write_bytes(b"test")
+
+        head_response = MagicMock()
+        head_response.status_code = 200
+        head_response.headers = {"content-length": "9"}
+        mock_session.head.return_value = head_response
+
+        mock_session.get.return_value = _stream_response(b"test data")
+
+        path = downloader.download(sample_product, progress=False)
+
+        assert path.read_bytes() == b"test data"
+        mock_session.get.assert_called_once()
+
     def test_download_http_error(self, downloader, mock_session, sample_product):
         """Test download handles HTTP errors."""
         mock_response = MagicMock()
@@ -94,21 +342,11 @@ class TestDownloader:
 
     def test_download_no_url(self, downloader, mock_session):
         """Test download with product that has no download URL."""
-        product = Product(
-            id="no-url-product",
-            name="NoUrlProduct",
-            collection="sentinel-2-l2a",
-            datetime=None,
-            cloud_cover=None,
-            geometry={},
-            bbox=[],
-            properties={},
-            assets={},
-        )
+        product = make_product("NoUrlProduct", id="no-url-product")
 
         # Mock OData query to return no results
         mock_response = MagicMock()
-        mock_response.json.return_value = {"value": []}
+        mock_response.content = json.dumps({"value": []}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_session.get.return_value = mock_response
 
@@ -117,34 +355,85 @@ class TestDownloader:
 
         assert "Could not determine download URL" in str(exc_info.value)
 
-    def test_download_all(self, downloader, mock_session, temp_dir):
+    def test_download_all_skips_existing_without_url(self, downloader, mock_session, tmp_path):
+        """Test that existing files are kept when their URL cannot be resolved."""
+        products = [make_product(f"Product_{i}", id=f"product-{i}") for i in range(3)]
+        for product in products:
+            (tmp_path / f"{product.name}.zip").write_bytes(b"data")
+
+        # The catalog no longer lists the products
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"value": []}).encode()
+        mock_session.get.return_value = mock_response
+
+        paths = downloader.download_all(products, progress=False)
+
+        assert paths == [tmp_path / f"{p.name}.zip" for p in products]
+        mock_session.head.assert_not_called()
+
+    def test_download_all_complete_files_need_no_lookup(self, downloader, mock_session, tmp_path):
+        """Test that files matching their metadata size are skipped without any request."""
+        products = [
+            make_product(f"Product_{i}", id=f"product-{i}", properties={"size": 4})
+            for i in range(3)
+        ]
+        for product in products:
+            (tmp_path / f"{product.name}.zip").write_bytes(b"data")
+
+        paths = downloader.download_all(products, progress=False)
+
+        assert len(paths) == 3
+        mock_session.get.assert_not_called()
+        mock_session.head.assert_not_called()
+
+    def test_download_all(self, downloader, mock_session):
         """Test downloading multiple products."""
         products = [
-            Product(
+            make_product(
+                f"Product_{i}",
                 id=f"product-{i}",
-                name=f"Product_{i}",
-                collection="sentinel-2-l2a",
-                datetime=None,
                 cloud_cover=10.0,
-                geometry={},
-                bbox=[],
-                properties={},
                 assets={"download": {"href": f"https://example.com/{i}.zip"}},
             )
             for i in range(3)
         ]
 
-        # Mock successful downloads
-        mock_response = MagicMock()
-        mock_response.headers = {"content-length": "100"}
-        mock_response.iter_content.return_value = [b"data"]
-        mock_response.raise_for_status = MagicMock()
-        mock_session.get.return_value = mock_response
+        # Mock successful downloads, one fresh stream per request
+        def make_response(*args, **kwargs):
+            return _stream_response(b"data")
+
+        mock_session.get.side_effect = make_response
 
         paths = downloader.download_all(products, progress=False)
 
         assert len(paths) == 3
-        assert all(p.exists() for p in paths)
+        assert all(p.read_bytes() == b"data" for p in paths)
+
+    def test_download_parallel_reports_bytes(self, downloader, mock_session):
+        """Test that parallel downloads feed one shared byte counter."""
+        products = [
+            make_product(
+                f"Product_{i}",
+                id=f"product-{i}",
+                cloud_cover=10.0,
+                properties={"size": 4},
+                assets={"download": {"href": f"https://example.com/{i}.zip"}},
+            )
+            for i in range(3)
+        ]
+
+        def make_response(*args, **kwargs):
+            return _stream_response(b"data")
+
+        mock_session.get.side_effect = make_response
+
+        with patch("cdse.downloader.tqdm") as mock_tqdm:
+            paths = downloader.download_all(products, parallel=True)
+
+        assert len(paths) == 3
+        byte_pbar = mock_tqdm.return_value
+        assert mock_tqdm.call_args_list[0].kwargs["total"] == 12
+        assert sum(c.args[0] for c in byte_pbar.update.call_args_list) == 12
 
     def test_format_size(self):
         """Test file size formatting."""
@@ -153,24 +442,75 @@ class TestDownloader:
         assert Downloader.format_size(1048576) == "1.00 MB"
         assert Downloader.format_size(1073741824) == "1.00 GB"
 
-    def test_get_download_url_from_odata(self, downloader, mock_session, sample_product):
+    def test_format_size_unit_boundaries(self):
+        """Test values just below a unit boundary and beyond the largest unit."""
+        assert Downloader.format_size(0) == "0.00 B"
+        assert Downloader.format_size(1023) == "1023.00 B"
+        assert Downloader.format_size(1536) == "1.50 KB"
+        assert Downloader.format_size(1024**5) == "1.00 PB"
+        assert Downloader.format_size(2048 * 1024**5) == "2048.00 PB"
+
+    def test_download_with_checksum_hashes_while_streaming(
+        self, downloader, mock_session, sample_product
+    ):
+        """Test that the checksum is verified without reading the file back."""
+        sample_product.properties["checksum"] = [
+            {"Algorithm": "MD5", "Value": hashlib.md5(b"test data").hexdigest().upper()}
+        ]
+        mock_session.get.return_value = _stream_response(b"test data")
+
+        with patch.object(downloader, "calculate_checksum") as mock_calculate:
+            path = downloader.download_with_checksum(sample_product, progress=False)
+
+        assert path.read_bytes() == b"test data"
+        mock_calculate.assert_not_called()
+
+    def test_download_with_checksum_mismatch(self, downloader, mock_session, sample_product):
+        """Test that a persistent checksum mismatch raises DownloadError."""
+        sample_product.properties["checksum"] = [{"Algorithm": "MD5", "Value": "0" * 32}]
+        mock_session.get.return_value = _stream_response(b"test data")
+
+        with pytest.raises(DownloadError, match="Checksum verification failed"):
+            downloader.download_with_checksum(sample_product, progress=False)
+
+        assert mock_session.get.call_count == 2
+
+    def test_extract_md5_cached_on_product(self, sample_product):
+        """Test that the MD5 lookup is resolved once per product."""
+        sample_product.properties["checksum"] = [
+            {"Algorithm": "SHA256", "Value": "f" * 64},
+            {"Algorithm": "MD5", "Value": "a" * 32},
+        ]
+
+        assert downloader_module._extract_md5(sample_product) == "a" * 32
+        sample_product.properties["checksum"] = []
+        assert downloader_module._extract_md5(sample_product) == "a" * 32
+
+    @pytest.mark.parametrize("algorithm", ["md5", "sha256"])
+    def test_calculate_checksum(self, downloader, tmp_path, algorithm):
+        """Test checksum calculation and verification of a file on disk."""
+        file_path = tmp_path / "data.bin"
+        file_path.write_bytes(b"x" * 3_000_000)
+        expected = hashlib.new(algorithm, b"x" * 3_000_000).hexdigest()
+
+        assert downloader.calculate_checksum(file_path, algorithm) == expected
+        assert downloader.verify_checksum(file_path, expected.upper(), algorithm)
+
+    def test_calculate_checksum_empty_file(self, downloader, tmp_path):
+        """Test checksum of an empty file (cannot be memory-mapped)."""
+        file_path = tmp_path / "empty.bin"
+        file_path.touch()
+
+        assert downloader.calculate_checksum(file_path) == hashlib.md5(b"").hexdigest()
+
+    def test_get_download_url_from_odata(self, downloader, mock_session):
         """Test getting download URL from OData API."""
         # Product without direct download URL
-        product = Product(
-            id="test-product",
-            name="S2A_MSIL2A_20240115",
-            collection="sentinel-2-l2a",
-            datetime=None,
-            cloud_cover=None,
-            geometry={},
-            bbox=[],
-            properties={},
-            assets={},  # No assets
-        )
+        product = make_product()
 
         # Mock OData response
         mock_response = MagicMock()
-        mock_response.json.return_value = {"value": [{"Id": "uuid-12345"}]}
+        mock_response.content = json.dumps({"value": [{"Id": "uuid-12345"}]}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_session.get.return_value = mock_response
 
@@ -178,3 +518,136 @@ class TestDownloader:
 
         assert url is not None
         assert "uuid-12345" in url
+
+    def test_odata_uuid_cached_across_instances(self, mock_session, tmp_path):
+        """Test that a resolved UUID is reused by other Downloader instances."""
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"value": [{"Id": "uuid-12345"}]}).encode()
+        mock_session.get.return_value = mock_response
+
+        first = Downloader(mock_session, output_dir=str(tmp_path))._get_download_url(make_product())
+        second = Downloader(mock_session, output_dir=str(tmp_path))._get_download_url(
+            make_product()
+        )
+
+        assert first == second
+        assert "uuid-12345" in second
+        mock_session.get.assert_called_once()
+
+    def test_prefetch_uuids_batches_catalog_queries(self, downloader, mock_session):
+        """Test that UUIDs for many products are resolved in one catalog query."""
+        products = [make_product(f"Product_{i}", id=f"product-{i}") for i in range(3)]
+        mock_response = MagicMock()
+        mock_response.content = json.dumps(
+            {
+                "value": [
+                    {"Name": "Product_0.SAFE", "Id": "uuid-0"},
+                    {"Name": "Product_2.SAFE", "Id": "uuid-2"},
+                ]
+            }
+        ).encode()
+        mock_session.get.return_value = mock_response
+
+        downloader._prefetch_uuids(products)
+
+        mock_session.get.assert_called_once()
+        query_url = mock_session.get.call_args.args[0]
+        assert "Name eq 'Product_0.SAFE' or Name eq 'Product_1.SAFE'" in query_url
+        assert products[0]._odata_uuid == "uuid-0"
+        assert not hasattr(products[1], "_odata_uuid")
+        assert products[2]._odata_uuid == "uuid-2"
+
+    @pytest.fixture
+    def product_server(self):
+        """Serve products over HTTP for the async download tests."""
+        pytest.importorskip("aiohttp")
+        pytest.importorskip("aiofiles")
+        server = HTTPServer(("127.0.0.1", 0), _ProductHandler)
+        server.log = []
+        server.unavailable = set()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @staticmethod
+    def _served_products(server, count=3):
+        base_url = f"http://127.0.0.1:{server.server_port}"
+        return [
+            make_product(
+                f"Product_{i}",
+                id=f"product-{i}",
+                assets={"download": {"href": f"{base_url}/{i}.zip"}},
+            )
+            for i in range(count)
+        ]
+
+    def test_download_all_async(self, mock_session, tmp_path, product_server):
+        """Test concurrent downloads on an asyncio event loop."""
+        products = self._served_products(product_server)
+        mock_session.headers = {}
+        downloader = Downloader(mock_session, output_dir=str(tmp_path))
+
+        paths = downloader.download_all(products, progress=False, parallel="async")
+
+        assert sorted(p.read_bytes() for p in paths) == [b"/0.zip", b"/1.zip", b"/2.zip"]
+        assert not list(tmp_path.glob("*.part"))
+
+    def test_download_all_async_retries_unavailable(self, mock_session, tmp_path, product_server):
+        """Test that a transient 503 is retried with backoff."""
+        products = self._served_products(product_server, count=1)
+        product_server.unavailable.add("/0.zip")
+        mock_session.headers = {}
+        downloader = Downloader(mock_session, output_dir=str(tmp_path))
+
+        with patch("cdse.downloader.asyncio.sleep") as mock_sleep:
+            paths = downloader.download_all(products, progress=False, parallel="async")
+
+        assert [p.read_bytes() for p in paths] == [b"/0.zip"]
+        mock_sleep.assert_called_once_with(1)
+
+    def test_download_all_async_resumes_part(self, mock_session, tmp_path, product_server):
+        """Test that a leftover .part file is resumed with a Range request."""
+        products = self._served_products(product_server, count=1)
+        (tmp_path / "Product_0.zip.part").write_bytes(b"/0.")
+        mock_session.headers = {}
+        downloader = Downloader(mock_session, output_dir=str(tmp_path))
+
+        paths = downloader.download_all(products, progress=False, parallel="async")
+
+        assert [p.read_bytes() for p in paths] == [b"/0.zip"]
+        assert [h.get("Range") for _, _, h in product_server.log] == ["bytes=3-"]
+
+    def test_download_all_async_skips_existing(self, mock_session, tmp_path, product_server):
+        """Test that complete and size-matching existing files are not downloaded."""
+        products = self._served_products(product_server, count=2)
+        products[0].properties["size"] = 6
+        (tmp_path / "Product_0.zip").write_bytes(b"/0.zip")
+        (tmp_path / "Product_1.zip").write_bytes(b"/1.zip")
+        mock_session.headers = {}
+        downloader = Downloader(mock_session, output_dir=str(tmp_path))
+
+        paths = downloader.download_all(products, progress=False, parallel="async")
+
+        assert sorted(paths) == [tmp_path / "Product_0.zip", tmp_path / "Product_1.zip"]
+        # Only the product without a metadata size needs a HEAD request
+        assert [(m, path) for m, path, _ in product_server.log] == [("HEAD", "/1.zip")]
+
+    def test_download_all_async_refreshes_token(self, tmp_path, product_server):
+        """Test that each request carries the token current when it is sent."""
+        session = MagicMock()
+        session.headers = {}
+        tokens = iter(["Bearer a", "Bearer b", "Bearer c"])
+
+        def refresh_if_expired():
+            session.headers["Authorization"] = next(tokens)
+
+        session.refresh_if_expired.side_effect = refresh_if_expired
+        products = self._served_products(product_server, count=3)
+        downloader = Downloader(session, output_dir=str(tmp_path), max_workers=1)
+
+        downloader.download_all(products, progress=False, parallel="async")
+
+        sent = sorted(h["Authorization"] for _, _, h in product_server.log)
+        assert sent == ["Bearer a", "Bearer b", "Bearer c"]
@@ -1,5 +1,7 @@
 """Tests for geocoding utilities."""
 
+import itertools
+from dataclasses import dataclass, field
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,7 +9,9 @@ import pytest
 from cdse.geocoding import (
     EUROPEAN_CITIES_BBOX,
     ITALIAN_CITIES_BBOX,
+    clear_geocode_cache,
     get_city_bbox,
+    get_city_bboxes,
     get_city_center,
     get_location_info,
     get_predefined_bbox,
@@ -24,6 +28,31 @@ except ImportError:
 requires_geopy = pytest.mark.skipif(not HAS_GEOPY, reason="geopy not installed")
 
 
+@dataclass
+class _Location:
+    """Stand-in for the geopy Location returned by Nominatim.geocode."""
+
+    latitude: float
+    longitude: float
+    address: str = ""
+    raw: dict = field(default_factory=dict)
+
+
+@pytest.fixture(autouse=True)
+def _clear_geocode_cache():
+    """Isolate tests from cached geocoding results."""
+    clear_geocode_cache()
+    yield
+    clear_geocode_cache()
+
+
+@pytest.fixture
+def mock_nominatim():
+    """Create a mock Nominatim geolocator."""
+    with patch("geopy.geocoders.Nominatim") as mock:
+        yield mock
+
+
 class TestGetPredefinedBbox:
     """Tests for get_predefined_bbox function."""
 
@@ -57,46 +86,47 @@ class TestGetPredefinedBbox:
         bbox = get_predefined_bbox("unknown_city_12345")
         assert bbox is None
 
-    def test_all_italian_cities_valid(self):
-        """Test all predefined Italian cities have valid bboxes."""
-        for city, bbox in ITALIAN_CITIES_BBOX.items():
-            assert len(bbox) == 4, f"Invalid bbox for {city}"
-            min_lon, min_lat, max_lon, max_lat = bbox
-            assert min_lon < max_lon, f"Invalid lon for {city}"
-            assert min_lat < max_lat, f"Invalid lat for {city}"
-            # Verify coordinates are in reasonable range for Italy
-            assert 6 < min_lon < 19, f"Invalid lon range for {city}"
-            assert 35 < min_lat < 48, f"Invalid lat range for {city}"
-
-    def test_all_european_cities_valid(self):
-        """Test all predefined European cities have valid bboxes."""
-        for city, bbox in EUROPEAN_CITIES_BBOX.items():
-            assert len(bbox) == 4, f"Invalid bbox for {city}"
-            min_lon, min_lat, max_lon, max_lat = bbox
-            assert min_lon < max_lon, f"Invalid lon for {city}"
-            assert min_lat < max_lat, f"Invalid lat for {city}"
+    def test_every_table_entry_resolves(self):
+        """Test that cities from both tables are found by name."""
+        for table in (ITALIAN_CITIES_BBOX, EUROPEAN_CITIES_BBOX):
+            for city, bbox in table.items():
+                assert get_predefined_bbox(city.upper()) == bbox
+
+    @pytest.mark.parametrize(
+        "city, bbox", list(ITALIAN_CITIES_BBOX.items()), ids=list(ITALIAN_CITIES_BBOX)
+    )
+    def test_italian_city_bbox_valid(self, city, bbox):
+        """Test each predefined Italian city has a valid bbox."""
+        assert len(bbox) == 4
+        min_lon, min_lat, max_lon, max_lat = bbox
+        assert min_lon < max_lon
+        assert min_lat < max_lat
+        # Verify coordinates are in reasonable range for Italy
+        assert 6 < min_lon < 19
+        assert 35 < min_lat < 48
+
+    @pytest.mark.parametrize(
+        "city, bbox", list(EUROPEAN_CITIES_BBOX.items()), ids=list(EUROPEAN_CITIES_BBOX)
+    )
+    def test_european_city_bbox_valid(self, city, bbox):
+        """Test each predefined European city has a valid bbox."""
+        assert len(bbox) == 4
+        min_lon, min_lat, max_lon, max_lat = bbox
+        assert min_lon < max_lon
+        assert min_lat < max_lat
 
 
 @requires_geopy
 class TestGetCityBbox:
     """Tests for get_city_bbox function (requires geopy)."""
 
-    @pytest.fixture
-    def mock_nominatim(self):
-        """Create a mock Nominatim geolocator."""
-        with patch("geopy.geocoders.Nominatim") as mock:
-            yield mock
-
     def test_get_city_bbox_success(self, mock_nominatim):
         """Test successful geocoding of a city."""
         # Mock location response
-        mock_location = MagicMock()
-        mock_location.latitude = 45.4642
-        mock_location.longitude = 9.1900
-        mock_location.address = "Milano, Lombardia, Italia"
+        location = _Location(45.4642, 9.1900, "Milano, Lombardia, Italia")
 
         mock_geolocator = MagicMock()
-        mock_geolocator.geocode.return_value = mock_location
+        mock_geolocator.geocode.return_value = location
         mock_nominatim.return_value = mock_geolocator
 
         bbox = get_city_bbox("Milano, Italia", buffer_km=10)
@@ -124,12 +154,10 @@ class TestGetCityBbox:
 
     def test_get_city_bbox_buffer_affects_size(self, mock_nominatim):
         """Test that buffer_km affects bbox size."""
-        mock_location = MagicMock()
-        mock_location.latitude = 45.0
-        mock_location.longitude = 9.0
+        location = _Location(45.0, 9.0)
 
         mock_geolocator = MagicMock()
-        mock_geolocator.geocode.return_value = mock_location
+        mock_geolocator.geocode.return_value = location
         mock_nominatim.return_value = mock_geolocator
 
         bbox_small = get_city_bbox("Test", buffer_km=5)
@@ -140,6 +168,20 @@ class TestGetCityBbox:
         large_width = bbox_large[2] - bbox_large[0]
         assert large_width > small_width
 
+    def test_get_city_bboxes(self, mock_nominatim):
+        """Test geocoding several cities, looking up duplicates once."""
+        location = _Location(45.0, 9.0)
+
+        mock_geolocator = MagicMock()
+        mock_geolocator.geocode.return_value = location
+        mock_nominatim.return_value = mock_geolocator
+
+        bboxes = get_city_bboxes(["Test", "test", "Test"], buffer_km=5)
+
+        assert list(bboxes) == ["Test", "test"]
+        assert bboxes["Test"] == get_city_bbox("Test", buffer_km=5)
+        mock_geolocator.geocode.assert_called_once()
+
     def test_geopy_not_installed(self):
         """Test error message when geopy is not installed."""
         with patch.dict("sys.modules", {"geopy": None, "geopy.geocoders": None}):
@@ -154,20 +196,12 @@ class TestGetCityBbox:
 class TestGetCityCenter:
     """Tests for get_city_center function."""
 
-    @pytest.fixture
-    def mock_nominatim(self):
-        """Create a mock Nominatim geolocator."""
-        with patch("geopy.geocoders.Nominatim") as mock:
-            yield mock
-
     def test_get_city_center_success(self, mock_nominatim):
         """Test getting city center coordinates."""
-        mock_location = MagicMock()
-        mock_location.latitude = 41.9028
-        mock_location.longitude = 12.4964
+        location = _Location(41.9028, 12.4964)
 
         mock_geolocator = MagicMock()
-        mock_geolocator.geocode.return_value = mock_location
+        mock_geolocator.geocode.return_value = location
         mock_nominatim.return_value = mock_geolocator
 
         lon, lat = get_city_center("Roma, Italia")
@@ -191,22 +225,12 @@ class TestGetCityCenter:
 class TestGetLocationInfo:
     """Tests for get_location_info function."""
 
-    @pytest.fixture
-    def mock_nominatim(self):
-        """Create a mock Nominatim geolocator."""
-        with patch("geopy.geocoders.Nominatim") as mock:
-            yield mock
-
     def test_get_location_info_success(self, mock_nominatim):
         """Test getting detailed location info."""
-        mock_location = MagicMock()
-        mock_location.latitude = 45.4642
-        mock_location.longitude = 9.1900
-        mock_location.address = "Milano, Lombardia, Italia"
-        mock_location.raw = {"place_id": 123}
+        location = _Location(45.4642, 9.1900, "Milano, Lombardia, Italia", raw={"place_id": 123})
 
         mock_geolocator = MagicMock()
-        mock_geolocator.geocode.return_value = mock_location
+        mock_geolocator.geocode.return_value = location
         mock_nominatim.return_value = mock_geolocator
 
         info = get_location_info("Milano")
@@ -224,3 +248,65 @@ class TestGetLocationInfo:
 
         with pytest.raises(ValueError):
             get_location_info("NonexistentCity")
+
+
+@requires_geopy
+class TestGeocodeCache:
+    """Tests for caching of geocoding results."""
+
+    def test_repeated_lookups_share_one_request(self, mock_nominatim):
+        """Test that bbox, center and info for one city cost a single request."""
+        location = _Location(45.4642, 9.1900, "Milano, Lombardia, Italia")
+
+        mock_geolocator = MagicMock()
+        mock_geolocator.geocode.return_value = location
+        mock_nominatim.return_value = mock_geolocator
+
+        get_city_bbox("Milano, Italia")
+        get_city_center("milano, italia ")
+        get_location_info("MILANO, ITALIA")
+
+        mock_geolocator.geocode.assert_called_once()
+
+    def test_clear_geocode_cache(self, mock_nominatim):
+        """Test that clearing the cache forces a new request."""
+        location = _Location(41.9028, 12.4964)
+
+        mock_geolocator = MagicMock()
+        mock_geolocator.geocode.return_value = location
+        mock_nominatim.return_value = mock_geolocator
+
+        get_city_center("Roma")
+        clear_geocode_cache()
+        get_city_center("Roma")
+
+        assert mock_geolocator.geocode.call_count == 2
+
+    def test_geocoder_shared_across_cities(self, mock_nominatim):
+        """Test that one Nominatim client serves lookups of different cities."""
+        location = _Location(45.0, 9.0)
+
+        mock_geolocator = MagicMock()
+        mock_geolocator.geocode.return_value = location
+        mock_nominatim.return_value = mock_geolocator
+
+        # Advance the rate limiter's clock instead of waiting out the delay
+        clock = itertools.count(0.0, 10.0)
+        with patch("geopy.extra.rate_limiter.default_timer", lambda: next(clock)):
+            get_city_center("Milano")
+            get_city_center("Torino")
+
+        mock_nominatim.assert_called_once()
+        assert mock_geolocator.geocode.call_count == 2
+
+    def test_http_session_shared_across_user_agents(self):
+        """Test that geolocators for different user agents share one session."""
+        from cdse.geocoding import _get_geocoder
+
+        first = _get_geocoder("agent-a", 10.0).func.__self__
+        second = _get_geocoder("agent-b", 5.0).func.__self__
+
+        assert first is not second
+        assert first.adapter is second.adapter
+        https = first.adapter.session.get_adapter("https://nominatim.openstreetmap.org")
+        assert 429 in https.max_retries.status_forcelist
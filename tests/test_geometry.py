@@ -7,9 +7,12 @@ import pytest
 from cdse.exceptions import ValidationError
 from cdse.geometry import (
     bbox_to_geojson,
+    bbox_to_geojson_bytes,
     geojson_to_bbox,
     geojson_to_wkt,
+    read_first_geometry,
     read_geojson,
+    simplify_geometry,
     validate_geometry,
     wkt_to_geojson,
 )
@@ -50,6 +53,80 @@ class TestReadGeoJSON:
         assert "Invalid GeoJSON" in str(exc_info.value)
 
 
+class TestReadFirstGeometry:
+    """Tests for read_first_geometry function."""
+
+    @pytest.fixture(params=["ijson", "json"])
+    def parser(self, request, monkeypatch):
+        """Run each test with the streaming parser and the full-read fallback."""
+        if request.param == "ijson":
+            pytest.importorskip("ijson")
+        else:
+            monkeypatch.setattr("cdse.geometry.ijson", None)
+        return request.param
+
+    def test_feature_collection_first_geometry(self, tmp_path, parser):
+        """Test that only the first feature's geometry is returned."""
+        first = {"type": "Point", "coordinates": [1.5, 2.5]}
+        collection = {
+            "type": "FeatureCollection",
+            "features": [
+                {"type": "Feature", "geometry": first},
+                {"type": "Feature", "geometry": {"type": "Point", "coordinates": [9, 9]}},
+            ],
+        }
+        file_path = tmp_path / "regions.geojson"
+        file_path.write_text(json.dumps(collection))
+
+        assert read_first_geometry(file_path) == first
+
+    def test_raw_geometry(self, tmp_path, parser):
+        """Test reading a file holding a bare geometry."""
+        geometry = {"type": "LineString", "coordinates": [[0.0, 0.0], [1.0, 1.0]]}
+        file_path = tmp_path / "line.geojson"
+        file_path.write_text(json.dumps(geometry))
+
+        assert read_first_geometry(str(file_path)) == geometry
+
+    def test_empty_collection_raises_error(self, tmp_path, parser):
+        """Test that a collection without features raises error."""
+        file_path = tmp_path / "empty.geojson"
+        file_path.write_text(json.dumps({"type": "FeatureCollection", "features": []}))
+
+        with pytest.raises(ValidationError, match="No geometry"):
+            read_first_geometry(file_path)
+
+    def test_geojson_to_bbox_accepts_path(self, tmp_path, parser):
+        """Test that geojson_to_bbox reads a file path."""
+        feature = {
+            "type": "Feature",
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[0, 0], [2, 0], [2, 3], [0, 0]]],
+            },
+        }
+        file_path = tmp_path / "area.geojson"
+        file_path.write_text(json.dumps({"type": "FeatureCollection", "features": [feature]}))
+
+        assert geojson_to_bbox(file_path) == [0, 0, 2, 3]
+        assert geojson_to_wkt(file_path) == "POLYGON ((0 0, 2 0, 2 3, 0 0))"
+
+    def test_geojson_to_bbox_path_uses_top_level_bbox(self, tmp_path, parser):
+        """Test that a file's top-level bbox wins over its first geometry."""
+        collection = {
+            "type": "FeatureCollection",
+            "features": [
+                {"type": "Feature", "geometry": {"type": "Point", "coordinates": [1, 1]}},
+                {"type": "Feature", "geometry": {"type": "Point", "coordinates": [9, 9]}},
+            ],
+            "bbox": [0, 0, 10, 10],
+        }
+        file_path = tmp_path / "regions.geojson"
+        file_path.write_text(json.dumps(collection))
+
+        assert geojson_to_bbox(file_path) == geojson_to_bbox(collection) == [0, 0, 10, 10]
+
+
 class TestGeoJSONToWKT:
     """Tests for geojson_to_wkt function."""
 
@@ -112,6 +189,35 @@ class TestWKTToGeoJSON:
         assert len(result["coordinates"]) == 1
         assert len(result["coordinates"][0]) == 5
 
+    def test_multipolygon_with_hole_from_wkt(self):
+        """Test converting WKT MultiPolygon with an interior ring."""
+        wkt = (
+            "MULTIPOLYGON (((0 0, 1 0, 1 1, 0 0)), "
+            "((5 5, 6 5, 6 6, 5 5), (5.1 5.1, 5.2 5.1, 5.2 5.2, 5.1 5.1)))"
+        )
+        result = wkt_to_geojson(wkt)
+        assert result["type"] == "MultiPolygon"
+        assert [len(polygon) for polygon in result["coordinates"]] == [1, 2]
+        assert result["coordinates"][1][1][0] == [5.1, 5.1]
+
+    def test_multilinestring_from_wkt(self):
+        """Test converting WKT MultiLineString to GeoJSON."""
+        result = wkt_to_geojson("MULTILINESTRING ((0 0, 1 1), (2 2, 3 3))")
+        assert result == {
+            "type": "MultiLineString",
+            "coordinates": [[[0.0, 0.0], [1.0, 1.0]], [[2.0, 2.0], [3.0, 3.0]]],
+        }
+
+    def test_lowercase_multipoint_from_wkt(self):
+        """Test that type keywords are matched case-insensitively."""
+        result = wkt_to_geojson("  multipoint ((0 0), (1 1))")
+        assert result == {"type": "MultiPoint", "coordinates": [[0.0, 0.0], [1.0, 1.0]]}
+
+    def test_linestring_z_from_wkt(self):
+        """Test that Z values are dropped from parsed positions."""
+        result = wkt_to_geojson("LINESTRING Z (0 0 5, 1.5 1 6)")
+        assert result["coordinates"] == [[0.0, 0.0], [1.5, 1.0]]
+
     def test_invalid_wkt_raises_error(self):
         """Test that invalid WKT raises error."""
         with pytest.raises(ValidationError):
@@ -139,6 +245,23 @@ class TestBboxToGeoJSON:
             bbox_to_geojson([1, 2, 3])
 
 
+class TestBboxToGeoJSONBytes:
+    """Tests for bbox_to_geojson_bytes function."""
+
+    def test_matches_bbox_to_geojson(self):
+        """Test that the bytes decode to the bbox_to_geojson geometry."""
+        bbox = [9.0, 45.0, 9.5, 45.5]
+        result = bbox_to_geojson_bytes(bbox)
+
+        assert isinstance(result, bytes)
+        assert json.loads(result) == bbox_to_geojson(bbox)
+
+    def test_invalid_bbox_length(self):
+        """Test that invalid bbox length raises error."""
+        with pytest.raises(ValidationError):
+            bbox_to_geojson_bytes([1, 2, 3])
+
+
 class TestGeoJSONToBbox:
     """Tests for geojson_to_bbox function."""
 
@@ -148,6 +271,44 @@ class TestGeoJSONToBbox:
         result = geojson_to_bbox(geojson)
         assert result == [0, 0, 10, 5]
 
+    def test_multipolygon_to_bbox(self):
+        """Test extracting bbox across polygons, holes and 3D positions."""
+        geojson = {
+            "type": "MultiPolygon",
+            "coordinates": [
+                [[[0, 0, 5], [4, 0, 5], [4, 3, 5], [0, 0, 5]], []],
+                [[[-2, 1], [1, 7], [-1, 2], [-2, 1]]],
+            ],
+        }
+        result = geojson_to_bbox(geojson)
+        assert result == [-2, 0, 4, 7]
+
+    def test_long_linestring_to_bbox(self):
+        """Test extracting bbox from a LineString with many positions."""
+        coords = [[i * 0.01, -i * 0.02] for i in range(1000)]
+        result = geojson_to_bbox({"type": "LineString", "coordinates": coords})
+        assert result == pytest.approx([0.0, -19.98, 9.99, 0.0])
+
+    def test_point_to_bbox(self):
+        """Test extracting a degenerate bbox from a Point."""
+        result = geojson_to_bbox({"type": "Point", "coordinates": [3, 4, 100]})
+        assert result == [3, 4, 3, 4]
+
+    def test_irregular_nesting_to_bbox(self):
+        """Test that coordinates nested deeper than the type implies still work."""
+        geojson = {"type": "LineString", "coordinates": [[[0, 1], [2, 3]], [[-1, 5]]]}
+        assert geojson_to_bbox(geojson) == [-1, 1, 2, 5]
+
+    def test_empty_coordinates_raise_error(self):
+        """Test that a geometry without positions raises error."""
+        with pytest.raises(ValidationError):
+            geojson_to_bbox({"type": "Polygon", "coordinates": [[]]})
+
+    def test_collection_bbox_used_without_geometry_walk(self):
+        """Test that a top-level bbox is returned before extracting geometry."""
+        geojson = {"type": "FeatureCollection", "bbox": [1, 2, 3, 4], "features": []}
+        assert geojson_to_bbox(geojson) == [1, 2, 3, 4]
+
     def test_feature_with_bbox(self):
         """Test that existing bbox is used."""
         geojson = {
@@ -159,6 +320,44 @@ class TestGeoJSONToBbox:
         assert result == [1, 2, 3, 4]
 
 
+class TestSimplifyGeometry:
+    """Tests for simplify_geometry function (requires shapely)."""
+
+    @pytest.fixture(autouse=True)
+    def _require_shapely(self):
+        pytest.importorskip("shapely")
+
+    @staticmethod
+    def _circle(n, radius=1.0):
+        import math
+
+        ring = [
+            [radius * math.cos(2 * math.pi * i / n), radius * math.sin(2 * math.pi * i / n)]
+            for i in range(n)
+        ]
+        return ring + [ring[0]]
+
+    def test_polygon_with_hole(self):
+        """Test simplifying a polygon keeps its interior ring."""
+        geojson = {
+            "type": "Polygon",
+            "coordinates": [self._circle(500), self._circle(200, radius=0.5)],
+        }
+        result = simplify_geometry(geojson, tolerance=0.01)
+
+        assert result["type"] == "Polygon"
+        assert len(result["coordinates"]) == 2
+        assert len(result["coordinates"][0]) < 500
+
+    def test_without_preserving_topology(self):
+        """Test the faster non-topology-preserving mode."""
+        geojson = {"type": "Polygon", "coordinates": [self._circle(1000)]}
+        result = simplify_geometry(geojson, tolerance=0.01, preserve_topology=False)
+
+        assert result["type"] == "Polygon"
+        assert 4 <= len(result["coordinates"][0]) < 1000
+
+
 class TestValidateGeometry:
     """Tests for validate_geometry function."""
 
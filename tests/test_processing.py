@@ -1,7 +1,8 @@
 """Tests for processing module."""
 
-import tempfile
-from pathlib import Path
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import pytest
 
@@ -24,6 +25,7 @@ from cdse.processing import (  # noqa: E402
     get_bounds_from_raster,
     preview_product,
     quick_preview,
+    read_bbox,
     reproject,
     stack_bands,
 )
@@ -65,59 +67,29 @@ class TestConstants:
 
 
 class TestFunctionsCallable:
-    """Tests that all processing functions are callable."""
-
-    def test_crop_to_bbox_callable(self):
-        """Test crop_to_bbox is callable."""
-        assert callable(crop_to_bbox)
-
-    def test_extract_bands_callable(self):
-        """Test extract_bands_from_safe is callable."""
-        assert callable(extract_bands_from_safe)
-
-    def test_stack_bands_callable(self):
-        """Test stack_bands is callable."""
-        assert callable(stack_bands)
-
-    def test_crop_and_stack_callable(self):
-        """Test crop_and_stack is callable."""
-        assert callable(crop_and_stack)
-
-    def test_calculate_ndvi_callable(self):
-        """Test calculate_ndvi is callable."""
-        assert callable(calculate_ndvi)
-
-    def test_reproject_callable(self):
-        """Test reproject is callable."""
-        assert callable(reproject)
-
-
-class TestPreviewFunctionsCallable:
-    """Tests that preview functions are callable."""
-
-    def test_create_rgb_preview_callable(self):
-        """Test create_rgb_preview is callable."""
-        assert callable(create_rgb_preview)
-
-    def test_preview_product_callable(self):
-        """Test preview_product is callable."""
-        assert callable(preview_product)
-
-    def test_quick_preview_callable(self):
-        """Test quick_preview is callable."""
-        assert callable(quick_preview)
-
-    def test_create_thumbnail_callable(self):
-        """Test create_thumbnail is callable."""
-        assert callable(create_thumbnail)
-
-    def test_compare_previews_callable(self):
-        """Test compare_previews is callable."""
-        assert callable(compare_previews)
-
-    def test_get_bounds_from_raster_callable(self):
-        """Test get_bounds_from_raster is callable."""
-        assert callable(get_bounds_from_raster)
+    """Tests that all processing and preview functions are callable."""
+
+    @pytest.mark.parametrize(
+        "func",
+        [
+            crop_to_bbox,
+            extract_bands_from_safe,
+            stack_bands,
+            crop_and_stack,
+            calculate_ndvi,
+            reproject,
+            create_rgb_preview,
+            preview_product,
+            quick_preview,
+            create_thumbnail,
+            compare_previews,
+            get_bounds_from_raster,
+        ],
+        ids=lambda func: func.__name__,
+    )
+    def test_callable(self, func):
+        """Test the function is callable."""
+        assert callable(func)
 
 
 # Check if PIL is available for preview tests
@@ -139,38 +111,298 @@ class TestCreateRgbPreview:
             create_rgb_preview("/nonexistent/file.tif")
         assert "not found" in str(exc_info.value)
 
+    @pytest.mark.skipif(not HAS_PIL, reason="Pillow not installed")
+    def test_writes_stretched_rgb(self, tmp_path):
+        """Test bands are read in the requested order and stretched to 8 bits."""
+        from PIL import Image
+        from rasterio.transform import from_origin
+
+        ramp = np.tile(np.arange(1, 101, dtype=np.uint16), (50, 1))
+        data = np.stack([ramp, ramp * 2, ramp[:, ::-1] * 3])
+        src_path = tmp_path / "rgb.tif"
+        with rasterio.open(
+            src_path,
+            "w",
+            driver="GTiff",
+            height=50,
+            width=100,
+            count=3,
+            dtype="uint16",
+            crs="EPSG:32632",
+            transform=from_origin(500000, 5000000, 10, 10),
+        ) as dst:
+            dst.write(data)
+
+        out = create_rgb_preview(src_path, tmp_path / "preview.png", bands=(3, 2, 1))
+
+        img = np.asarray(Image.open(out))
+        assert img.shape == (50, 100, 3)
+        # Each ramp is stretched over the full 8-bit range
+        assert img[0, 0].tolist() == [255, 0, 0]
+        assert img[0, -1].tolist() == [0, 255, 255]
+        np.testing.assert_array_equal(img[:, :, 1], img[:, :, 2])
+
+    @pytest.mark.skipif(not HAS_PIL, reason="Pillow not installed")
+    @pytest.mark.parametrize("overviews", [[2], []])
+    @pytest.mark.parametrize("size", [(25, 10), (200, 100)])
+    def test_resized_preview(self, tmp_path, size, overviews):
+        """Test previews are resized from overviews or with Pillow."""
+        from PIL import Image
+        from rasterio.transform import from_origin
+
+        ramp = np.tile(np.arange(1, 101, dtype=np.uint16), (50, 1))
+        src_path = tmp_path / "rgb.tif"
+        with rasterio.open(
+            src_path,
+            "w",
+            driver="GTiff",
+            height=50,
+            width=100,
+            count=3,
+            dtype="uint16",
+            crs="EPSG:32632",
+            transform=from_origin(500000, 5000000, 10, 10),
+        ) as dst:
+            dst.write(np.stack([ramp] * 3))
+            if overviews:
+                dst.build_overviews(overviews)
+
+        out = create_rgb_preview(src_path, tmp_path / "preview.png", size=size)
+
+        img = np.asarray(Image.open(out))
+        assert img.shape == (size[1], size[0], 3)
+        # The ramp still increases left to right after resampling
+        assert img[0, 0, 0] < img[0, size[0] // 2, 0] < img[0, -1, 0]
+
+
+class TestPercentileStretch:
+    """Tests for the preview contrast stretch."""
+
+    def test_histogram_matches_float_percentiles(self):
+        """Test uint16 channels stretch exactly like their float32 copies."""
+        from cdse.processing import _percentile_stretch
+
+        rng = np.random.default_rng(0)
+        rgb = rng.integers(0, 3000, size=(40, 30, 3), dtype=np.uint16)
+        rgb[:5] = 0
+        rgb[..., 2] = 0  # no valid pixels: left unchanged
+
+        stretched = _percentile_stretch(rgb, (2, 98))
+        expected = _percentile_stretch(rgb.astype(np.float32), (2, 98))
+
+        assert stretched.dtype == np.float32
+        np.testing.assert_allclose(stretched, expected, rtol=0, atol=1e-6)
+        assert stretched[..., :2].min() == 0 and stretched[..., :2].max() == 1
+
+    @pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.float32])
+    def test_uint8_lookup_matches_float_stretch(self, dtype):
+        """Test the 8-bit stretch equals scaling the float32 stretch."""
+        from cdse.processing import _percentile_stretch, _stretch_to_uint8
+
+        rng = np.random.default_rng(1)
+        rgb = rng.integers(0, 250, size=(40, 30, 3)).astype(dtype)
+        rgb[..., 2] = 7  # flat channel: left unchanged
+
+        result = _stretch_to_uint8(rgb, (2, 98))
+        expected = (_percentile_stretch(rgb, (2, 98)) * 255).astype(np.uint8)
+
+        assert result.dtype == np.uint8
+        np.testing.assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_numpy_fallback_matches(self, monkeypatch, dtype):
+        """Test the numpy float path gives the same 8 bits as the numba kernel."""
+        from cdse.processing import _stretch_to_uint8
+
+        rng = np.random.default_rng(3)
+        rgb = (rng.random((40, 30, 3)) * 3000).astype(dtype)
+        rgb[:4] = 0
+        default = _stretch_to_uint8(rgb, (2, 98))
+
+        monkeypatch.setattr("cdse.processing._stretch_kernel", lambda: None)
+        fallback = _stretch_to_uint8(rgb, (2, 98))
+
+        np.testing.assert_array_equal(default, fallback)
+
+    def test_row_strips_match_whole_image(self, tmp_path, monkeypatch):
+        """Test the strip-wise stretch of a dataset equals the in-memory one."""
+        from rasterio.transform import from_origin
+
+        from cdse import processing
+        from cdse.processing import _stretch_rows_to_uint8, _stretch_to_uint8
+
+        monkeypatch.setattr(processing, "_BLOCK_SIZE", 16)
+        rng = np.random.default_rng(2)
+        data = rng.integers(0, 5000, size=(3, 50, 40), dtype=np.uint16)
+        data[2] = 0  # no valid pixels
+        src_path = tmp_path / "rgb.tif"
+        with rasterio.open(
+            src_path,
+            "w",
+            driver="GTiff",
+            height=50,
+            width=40,
+            count=3,
+            dtype="uint16",
+            crs="EPSG:32632",
+            transform=from_origin(500000, 5000000, 10, 10),
+        ) as dst:
+            dst.write(data)
+
+        with rasterio.open(src_path) as src:
+            result = _stretch_rows_to_uint8(src, [3, 1, 2], (2, 98))
+
+        expected = _stretch_to_uint8(np.moveaxis(data[[2, 0, 1]], 0, -1), (2, 98))
+        np.testing.assert_array_equal(result, expected)
+
+
+class TestComparePreviews:
+    """Tests for compare_previews function."""
+
+    def test_images_keep_input_order(self, tmp_path):
+        """Test rasters loaded in parallel are drawn in the order given."""
+        matplotlib = pytest.importorskip("matplotlib")
+        matplotlib.use("Agg")
+        from rasterio.transform import from_origin
+
+        from cdse.processing import _percentile_stretch
+
+        rng = np.random.default_rng(0)
+        paths, expected = [], []
+        for i in range(3):
+            data = rng.integers(1, 1000 * (i + 1), size=(3, 20, 30), dtype=np.uint16)
+            path = tmp_path / f"rgb{i}.tif"
+            with rasterio.open(
+                path,
+                "w",
+                driver="GTiff",
+                height=20,
+                width=30,
+                count=3,
+                dtype="uint16",
+                crs="EPSG:32632",
+                transform=from_origin(500000, 5000000, 10, 10),
+            ) as dst:
+                dst.write(data)
+            paths.append(path)
+            expected.append(_percentile_stretch(np.moveaxis(data, 0, -1), (2, 98)))
+
+        fig = compare_previews(paths, titles=["a", "b", "c"])
+
+        assert [ax.get_title() for ax in fig.axes] == ["a", "b", "c"]
+        for ax, rgb in zip(fig.axes, expected):
+            np.testing.assert_array_equal(ax.images[0].get_array(), rgb)
+
 
 class TestPreviewProduct:
     """Tests for preview_product function."""
 
     @pytest.mark.skipif(not HAS_PIL, reason="Pillow not installed")
-    def test_wrong_band_count_raises_error(self):
+    def test_wrong_band_count_raises_error(self, tmp_path):
         """Test that wrong number of bands raises ValidationError."""
-        with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "product.zip"
+        temp_path.touch()
+
+        with pytest.raises(ValidationError, match="Exactly 3 bands required"):
+            preview_product(temp_path, bands=["B04", "B03"])  # Only 2 bands
+
+    @pytest.mark.skipif(not HAS_PIL, reason="Pillow not installed")
+    @pytest.mark.parametrize("bbox", [None, [9.0103, 45.1401, 9.0252, 45.1489]])
+    def test_preview_of_safe_folder(self, tmp_path, bbox):
+        """Test the RGB GeoTIFF and preview image of a SAFE folder."""
+        from PIL import Image
+
+        img_data = tmp_path / "S2A_MSIL2A_TEST.SAFE" / "GRANULE" / "L2A_T32TNR" / "IMG_DATA"
+        res_folder = img_data / "R10m"
+        res_folder.mkdir(parents=True)
+        rng = np.random.default_rng(0)
+        for band in ("B04", "B03", "B02"):
+            data = rng.integers(1, 10000, size=(200, 300), dtype=np.uint16)
+            _write_band(res_folder / f"T32TNR_20240115_{band}_10m.jp2", data)
+
+        result = preview_product(
+            img_data.parents[2],
+            bbox=bbox,
+            output_path=tmp_path / "out" / "rgb",
+            display=False,
+            size=(60, 40),
+        )
+
+        assert result["preview_path"] == tmp_path / "out" / "rgb.png"
+        assert result["image"].size == (60, 40)
+        # The returned image is the one saved, without reading it back
+        with Image.open(result["preview_path"]) as saved:
+            np.testing.assert_array_equal(np.asarray(result["image"]), np.asarray(saved))
+        with rasterio.open(result["tiff_path"]) as src:
+            assert src.descriptions == ("B04", "B03", "B02")
+            assert src.shape == ((200, 300) if bbox is None else (99, 119))
 
-        try:
-            with pytest.raises(ValidationError) as exc_info:
-                preview_product(temp_path, bands=["B04", "B03"])  # Only 2 bands
-            assert "Exactly 3 bands required" in str(exc_info.value)
-        finally:
-            temp_path.unlink(missing_ok=True)
+    @pytest.mark.skipif(not HAS_PIL, reason="Pillow not installed")
+    def test_zip_preview_reads_bands_inside_archive(self, tmp_path):
+        """Test a ZIP product is stacked without extracting its bands."""
+        granule = "S2A_MSIL2A_TEST.SAFE/GRANULE/L2A_T32TNR/IMG_DATA/R10m"
+        zip_path = tmp_path / "S2A_MSIL2A_TEST.zip"
+        rng = np.random.default_rng(1)
+        band_dir = tmp_path / "bands"
+        band_dir.mkdir()
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            for band in ("B04", "B03", "B02"):
+                data = rng.integers(1, 10000, size=(20, 30), dtype=np.uint16)
+                band_path = _write_band(band_dir / f"{band}.tif", data)
+                zf.write(band_path, f"{granule}/T32TNR_20240115_{band}_10m.jp2")
+
+        result = preview_product(zip_path, display=False, size=(30, 20))
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "S2A_MSIL2A_TEST.zip",
+            "S2A_MSIL2A_TEST_preview",
+            "bands",
+        ]
+        with rasterio.open(result["tiff_path"]) as src:
+            assert src.descriptions == ("B04", "B03", "B02")
+            with rasterio.open(band_dir / "B02.tif") as ref:
+                np.testing.assert_array_equal(src.read(3), ref.read(1))
+
+
+class TestDisplayInJupyter:
+    """Tests for the inline notebook preview."""
+
+    @pytest.mark.skipif(not HAS_PIL, reason="Pillow not installed")
+    def test_embeds_saved_png(self, tmp_path, monkeypatch):
+        """Test the PNG on disk is inlined as is, without encoding it again."""
+        pytest.importorskip("IPython")
+        import base64
+        import builtins
+        from unittest.mock import patch
+
+        from PIL import Image
+
+        from cdse.processing import _display_in_jupyter
+
+        path = tmp_path / "preview.png"
+        Image.new("RGB", (4, 3), (10, 20, 30)).save(path)
+        img = Image.open(path)
+        monkeypatch.setattr(builtins, "get_ipython", lambda: None, raising=False)
+
+        with patch.object(Image.Image, "save") as save, patch("IPython.display.display") as display:
+            _display_in_jupyter(img, path, [9.0, 45.0, 9.1, 45.1])
+
+        save.assert_not_called()
+        html = display.call_args[0][0].data
+        assert base64.b64encode(path.read_bytes()).decode() in html
+        assert "4 × 3 px" in html
 
 
 class TestCropToBbox:
     """Tests for crop_to_bbox function."""
 
-    def test_invalid_bbox_length(self):
+    def test_invalid_bbox_length(self, tmp_path):
         """Test that bbox with wrong length raises ValidationError."""
-        with tempfile.NamedTemporaryFile(suffix=".tif", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "image.tif"
+        temp_path.touch()
 
-        try:
-            with pytest.raises(ValidationError) as exc_info:
-                crop_to_bbox(temp_path, bbox=[9.1, 45.4, 9.28])  # Only 3 values
-            assert "bbox must have 4 values" in str(exc_info.value)
-        finally:
-            temp_path.unlink(missing_ok=True)
+        with pytest.raises(ValidationError, match="bbox must have 4 values"):
+            crop_to_bbox(temp_path, bbox=[9.1, 45.4, 9.28])  # Only 3 values
 
     def test_nonexistent_file_raises_error(self):
         """Test that non-existent file raises ValidationError."""
@@ -178,6 +410,61 @@ class TestCropToBbox:
             crop_to_bbox("/nonexistent/file.tif", bbox=[9.1, 45.4, 9.28, 45.52])
         assert "not found" in str(exc_info.value)
 
+    def test_matches_polygon_mask_crop(self, tmp_path):
+        """Test the windowed crop matches masking with the bbox polygon."""
+        pytest.importorskip("shapely")
+        from rasterio.mask import mask
+        from rasterio.warp import transform_bounds
+        from shapely.geometry import box
+
+        data = np.arange(200 * 300, dtype=np.uint16).reshape(200, 300)
+        src_path = tmp_path / "utm.tif"
+        _write_band(src_path, data)
+        bbox = [9.0103, 45.1401, 9.0252, 45.1489]
+
+        out = crop_to_bbox(src_path, bbox, tmp_path / "crop.tif", bands=[1])
+
+        with rasterio.open(src_path) as src:
+            geom = box(*transform_bounds("EPSG:4326", src.crs, *bbox))
+            expected, expected_transform = mask(src, [geom], crop=True, all_touched=True)
+        with rasterio.open(out) as dst:
+            assert dst.transform == expected_transform
+            np.testing.assert_array_equal(dst.read(), expected)
+
+    def test_bbox_containing_raster(self, tmp_path):
+        """Test a bbox larger than the raster crops to the whole raster."""
+        data = np.arange(100, dtype=np.uint16).reshape(10, 10)
+        src_path = _write_band(tmp_path / "utm.tif", data)
+
+        out = crop_to_bbox(src_path, bbox=[8.9, 45.0, 9.2, 45.2])
+
+        with rasterio.open(out) as src:
+            np.testing.assert_array_equal(src.read(1), data)
+
+    def test_bbox_outside_raster_raises_error(self, tmp_path):
+        """Test that a bbox not overlapping the raster raises ValidationError."""
+        src_path = _write_band(tmp_path / "utm.tif", np.ones((10, 10), dtype=np.uint16))
+        with pytest.raises(ValidationError, match="does not overlap"):
+            crop_to_bbox(src_path, bbox=[-70.0, -10.0, -69.0, -9.0])
+
+
+class TestReadBbox:
+    """Tests for read_bbox function."""
+
+    def test_returns_cropped_array(self, tmp_path):
+        """Test the in-memory crop matches the written crop."""
+        data = np.arange(200 * 300, dtype=np.uint16).reshape(200, 300)
+        src_path = _write_band(tmp_path / "utm.tif", data)
+        bbox = [9.0103, 45.1401, 9.0252, 45.1489]
+
+        array, meta = read_bbox(src_path, bbox)
+
+        assert list(tmp_path.iterdir()) == [src_path]
+        with rasterio.open(crop_to_bbox(src_path, bbox)) as ref:
+            np.testing.assert_array_equal(array, ref.read())
+            assert meta["transform"] == ref.transform
+            assert (meta["count"], meta["height"], meta["width"]) == array.shape
+
 
 class TestExtractBandsFromSafe:
     """Tests for extract_bands_from_safe function."""
@@ -188,14 +475,333 @@ class TestExtractBandsFromSafe:
             extract_bands_from_safe("/nonexistent/product.zip", bands=["B04"])
         assert "not found" in str(exc_info.value)
 
-    def test_unsupported_format_raises_error(self):
+    def test_unsupported_format_raises_error(self, tmp_path):
         """Test that unsupported format raises ValidationError."""
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            with pytest.raises(ValidationError) as exc_info:
-                extract_bands_from_safe(temp_path, bands=["B04"])
-            assert "Unsupported format" in str(exc_info.value)
-        finally:
-            temp_path.unlink(missing_ok=True)
+        temp_path = tmp_path / "product.txt"
+        temp_path.touch()
+
+        with pytest.raises(ValidationError, match="Unsupported format"):
+            extract_bands_from_safe(temp_path, bands=["B04"])
+
+    def test_extract_bands_from_zip(self, tmp_path):
+        """Test that requested bands are streamed out of a product ZIP."""
+        zip_path = tmp_path / "S2A_MSIL2A_TEST.zip"
+        granule = "S2A_MSIL2A_TEST.SAFE/GRANULE/L2A_T32TNR/IMG_DATA"
+        payload = bytes(range(256)) * 8192  # 2 MiB, more than one copy buffer
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr(f"{granule}/R10m/T32TNR_20240115_B04_10m.jp2", payload)
+            zf.writestr(f"{granule}/R10m/T32TNR_20240115_B08_10m.jp2", b"nir")
+            zf.writestr(f"{granule}/R20m/T32TNR_20240115_B04_20m.jp2", b"red-20m")
+
+        out_dir = tmp_path / "bands"
+        extracted = extract_bands_from_safe(zip_path, ["B04", "B08"], output_dir=out_dir)
+
+        assert extracted == {"B04": out_dir / "B04_10m.jp2", "B08": out_dir / "B08_10m.jp2"}
+        assert extracted["B04"].read_bytes() == payload
+        assert extracted["B08"].read_bytes() == b"nir"
+
+    def test_extract_bands_from_zip_fallback_names(self, tmp_path):
+        """Test bands outside the standard naming are still found."""
+        zip_path = tmp_path / "S2B_MSIL2A_TEST.zip"
+        img_data = "S2B_MSIL2A_TEST.SAFE/GRANULE/L2A_T32TNR/IMG_DATA"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr(f"{img_data}/R10m/T32TNR_20240115_TCI_10m.jp2", b"tci")
+            zf.writestr(f"{img_data}/R10m/custom-B02-band.jp2", b"blue")
+
+        out_dir = tmp_path / "bands"
+        extracted = extract_bands_from_safe(zip_path, ["TCI", "B02", "B03"], output_dir=out_dir)
+
+        assert extracted["TCI"].read_bytes() == b"tci"
+        assert extracted["B02"].read_bytes() == b"blue"
+        assert "B03" not in extracted
+
+    def test_extract_bands_from_safe_folder(self, tmp_path):
+        """Test bands are found in L2A and L1C folder layouts."""
+        granule = tmp_path / "S2A_MSIL2A_TEST.SAFE" / "GRANULE" / "L2A_T32TNR"
+        r10m = granule / "IMG_DATA" / "R10m"
+        r10m.mkdir(parents=True)
+        for name in ("T32TNR_20240115_B04_10m.jp2", "T32TNR_20240115_TCI_10m.jp2", "B08.xml"):
+            (r10m / name).write_bytes(b"")
+        l1c = tmp_path / "S2A_MSIL1C_TEST.SAFE" / "GRANULE" / "L1C_T32TNR" / "IMG_DATA"
+        l1c.mkdir(parents=True)
+        (l1c / "T32TNR_20240115T101301_B8A.jp2").write_bytes(b"")
+
+        l2a_bands = extract_bands_from_safe(
+            tmp_path / "S2A_MSIL2A_TEST.SAFE", ["B04", "TCI", "B08"], output_dir=tmp_path / "a"
+        )
+        l1c_bands = extract_bands_from_safe(
+            tmp_path / "S2A_MSIL1C_TEST.SAFE", ["B8A"], output_dir=tmp_path / "b"
+        )
+
+        assert l2a_bands == {
+            "B04": r10m / "T32TNR_20240115_B04_10m.jp2",
+            "TCI": r10m / "T32TNR_20240115_TCI_10m.jp2",
+        }
+        assert l1c_bands == {"B8A": l1c / "T32TNR_20240115T101301_B8A.jp2"}
+
+
+def _write_band(path, data, crs="EPSG:32632"):
+    """Write a single-band GeoTIFF with a 10 m grid."""
+    from rasterio.transform import from_origin
+
+    with rasterio.open(
+        path,
+        "w",
+        driver="GTiff",
+        height=data.shape[0],
+        width=data.shape[1],
+        count=1,
+        dtype=data.dtype,
+        crs=crs,
+        transform=from_origin(500000, 5000000, 10, 10),
+    ) as dst:
+        dst.write(data, 1)
+    return path
+
+
+class TestCalculateNdvi:
+    """Tests for calculate_ndvi function."""
+
+    @pytest.fixture
+    def bands(self, tmp_path):
+        nir = np.array([[3000, 0, 1000], [2000, 500, 0]], dtype=np.uint16)
+        red = np.array([[1000, 0, 3000], [2000, 0, 700]], dtype=np.uint16)
+        nir_path = _write_band(tmp_path / "B08.tif", nir)
+        red_path = _write_band(tmp_path / "B04.tif", red)
+        return nir_path, red_path
+
+    def test_float32_output(self, bands, tmp_path):
+        """Test NDVI values, including pixels with no signal."""
+        out = calculate_ndvi(*bands, tmp_path / "ndvi.tif")
+
+        with rasterio.open(out) as src:
+            assert src.dtypes[0] == "float32"
+            ndvi = src.read(1)
+        expected = np.array([[0.5, 0.0, -0.5], [0.0, 1.0, -1.0]], dtype=np.float32)
+        np.testing.assert_allclose(ndvi, expected, atol=1e-6)
+
+    def test_int16_output(self, bands, tmp_path):
+        """Test scaled int16 output."""
+        out = calculate_ndvi(*bands, tmp_path / "ndvi_i16.tif", dtype="int16")
+
+        with rasterio.open(out) as src:
+            assert src.dtypes[0] == "int16"
+            ndvi = src.read(1)
+        np.testing.assert_array_equal(ndvi, [[5000, 0, -5000], [0, 10000, -10000]])
+
+    @pytest.mark.parametrize("dtype", ["float32", "int16"])
+    def test_numpy_fallback_matches(self, tmp_path, monkeypatch, dtype):
+        """Test the numpy path gives the same output as the numba kernel."""
+        rng = np.random.default_rng(0)
+        nir = _write_band(tmp_path / "B08.tif", rng.integers(0, 10000, (64, 64), dtype=np.uint16))
+        red = _write_band(tmp_path / "B04.tif", rng.integers(0, 10000, (64, 64), dtype=np.uint16))
+        default = calculate_ndvi(nir, red, tmp_path / "default.tif", dtype=dtype)
+
+        monkeypatch.setattr("cdse.processing._ndvi_kernel", lambda: None)
+        fallback = calculate_ndvi(nir, red, tmp_path / "fallback.tif", dtype=dtype)
+
+        with rasterio.open(default) as a, rasterio.open(fallback) as b:
+            np.testing.assert_array_equal(a.read(1), b.read(1))
+
+    def test_unsupported_dtype_raises_error(self, bands, tmp_path):
+        """Test that an unsupported dtype raises ValidationError."""
+        with pytest.raises(ValidationError, match="dtype"):
+            calculate_ndvi(*bands, tmp_path / "ndvi.tif", dtype="uint8")
+
+    def test_multiple_blocks(self, tmp_path):
+        """Test a raster spanning several output blocks matches the formula."""
+        rng = np.random.default_rng(0)
+        nir = rng.integers(0, 10000, size=(700, 1100), dtype=np.uint16)
+        red = rng.integers(0, 10000, size=(700, 1100), dtype=np.uint16)
+        nir_path = _write_band(tmp_path / "B08.tif", nir)
+        red_path = _write_band(tmp_path / "B04.tif", red)
+
+        out = calculate_ndvi(nir_path, red_path, tmp_path / "ndvi.tif", max_workers=4)
+
+        with rasterio.open(out) as src:
+            assert src.block_shapes[0] == (512, 512)
+            ndvi = src.read(1)
+        nir, red = nir.astype(np.float64), red.astype(np.float64)
+        expected = (nir - red) / np.where(nir + red > 0, nir + red, np.inf)
+        np.testing.assert_allclose(ndvi, expected, atol=1e-6)
+
+
+class TestStackBands:
+    """Tests for stack_bands function."""
+
+    def test_stacks_in_band_order(self, tmp_path):
+        """Test bands are written in order, resampling mismatched sizes."""
+        red = np.full((4, 6), 1, dtype=np.uint16)
+        green = np.full((4, 6), 2, dtype=np.uint16)
+        coarse = np.full((2, 3), 3, dtype=np.uint16)
+        paths = {
+            "B04": _write_band(tmp_path / "B04.tif", red),
+            "B03": _write_band(tmp_path / "B03.tif", green),
+            "B11": _write_band(tmp_path / "B11.tif", coarse),
+        }
+
+        out = stack_bands(
+            paths, tmp_path / "stack.tif", band_order=["B04", "B03", "B11"], max_workers=3
+        )
+
+        with rasterio.open(out) as src:
+            assert src.count == 3
+            assert src.descriptions == ("B04", "B03", "B11")
+            assert src.interleaving.name == "pixel"
+            data = src.read()
+        assert data.shape == (3, 4, 6)
+        assert (data[0] == 1).all() and (data[1] == 2).all() and (data[2] == 3).all()
+
+    def test_more_bands_than_workers(self, tmp_path):
+        """Test bands read in several batches through reused buffers."""
+        rng = np.random.default_rng(0)
+        data = {f"B0{i}": rng.integers(0, 10000, size=(5, 7), dtype=np.uint16) for i in range(2, 7)}
+        paths = {band: _write_band(tmp_path / f"{band}.tif", arr) for band, arr in data.items()}
+
+        out = stack_bands(paths, tmp_path / "stack.tif", max_workers=2)
+
+        with rasterio.open(out) as src:
+            assert src.descriptions == tuple(sorted(data))
+            np.testing.assert_array_equal(src.read(), np.stack([data[b] for b in sorted(data)]))
+
+    def test_more_workers_than_bands(self, tmp_path):
+        """Test the thread pool is capped at one worker per band."""
+        paths = {
+            band: _write_band(tmp_path / f"{band}.tif", np.full((3, 3), i, dtype=np.uint16))
+            for i, band in enumerate(("B02", "B03"))
+        }
+
+        with patch("cdse.processing.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_pool:
+            out = stack_bands(paths, tmp_path / "stack.tif", max_workers=8)
+
+        mock_pool.assert_called_once_with(max_workers=2)
+        with rasterio.open(out) as src:
+            assert src.read().shape == (2, 3, 3)
+
+
+class TestCropAndStack:
+    """Tests for crop_and_stack function."""
+
+    def test_matches_stack_then_crop(self, tmp_path):
+        """Test windowed per-band reads match cropping a full-scene stack."""
+        img_data = tmp_path / "S2A_MSIL2A_TEST.SAFE" / "GRANULE" / "L2A_T32TNR" / "IMG_DATA"
+        res_folder = img_data / "R10m"
+        res_folder.mkdir(parents=True)
+        rng = np.random.default_rng(0)
+        paths = {}
+        for band in ("B04", "B03", "B02"):
+            data = rng.integers(0, 10000, size=(200, 300), dtype=np.uint16)
+            paths[band] = _write_band(res_folder / f"T32TNR_20240115_{band}_10m.jp2", data)
+        bbox = [9.0103, 45.1401, 9.0252, 45.1489]
+
+        out = crop_and_stack(img_data.parents[2], bbox, output_path=tmp_path / "crop.tif")
+
+        expected = crop_to_bbox(stack_bands(paths, tmp_path / "stack.tif"), bbox)
+        with rasterio.open(out) as src, rasterio.open(expected) as ref:
+            assert src.descriptions == ("B04", "B03", "B02")
+            assert src.transform == ref.transform
+            np.testing.assert_array_equal(src.read(), ref.read()[::-1])
+
+    def test_reads_bands_inside_zip(self, tmp_path):
+        """Test a ZIP product is cropped without extracting its bands."""
+        granule = "S2A_MSIL2A_TEST.SAFE/GRANULE/L2A_T32TNR/IMG_DATA/R10m"
+        zip_path = tmp_path / "S2A_MSIL2A_TEST.zip"
+        rng = np.random.default_rng(1)
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            for band in ("B08", "B04"):
+                data = rng.integers(0, 10000, size=(200, 300), dtype=np.uint16)
+                band_path = _write_band(tmp_path / f"{band}.tif", data)
+                zf.write(band_path, f"{granule}/T32TNR_20240115_{band}_10m.jp2")
+        bbox = [9.0103, 45.1401, 9.0252, 45.1489]
+
+        out = crop_and_stack(zip_path, bbox, bands=["B08", "B04"])
+
+        assert out == tmp_path / "S2A_MSIL2A_TEST_cropped.tif"
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "B04.tif",
+            "B08.tif",
+            "S2A_MSIL2A_TEST.zip",
+            "S2A_MSIL2A_TEST_cropped.tif",
+        ]
+        with rasterio.open(out) as src:
+            assert src.descriptions == ("B08", "B04")
+            data = src.read()
+        for i, band in enumerate(("B08", "B04")):
+            expected = crop_to_bbox(tmp_path / f"{band}.tif", bbox, tmp_path / "ref.tif")
+            with rasterio.open(expected) as ref:
+                np.testing.assert_array_equal(data[i], ref.read(1))
+
+    def test_output_is_cog_with_overviews(self, tmp_path):
+        """Test the output is a Cloud-Optimized GeoTIFF with overviews."""
+        img_data = tmp_path / "S2A_MSIL2A_TEST.SAFE" / "GRANULE" / "L2A_T32TNR" / "IMG_DATA"
+        (img_data / "R10m").mkdir(parents=True)
+        data = np.ones((1200, 1200), dtype=np.uint16)
+        _write_band(img_data / "R10m" / "T32TNR_20240115_B04_10m.jp2", data)
+
+        out = crop_and_stack(img_data.parents[2], [8.9, 45.0, 9.2, 45.2], bands=["B04"])
+
+        with rasterio.open(out) as src:
+            assert src.shape == (1200, 1200)
+            assert src.tags(ns="IMAGE_STRUCTURE")["LAYOUT"] == "COG"
+            assert src.compression.name == "zstd"
+            assert src.overviews(1) == [2, 4]
+
+
+class TestOutputCompression:
+    """Tests for GeoTIFF creation options of processing outputs."""
+
+    def test_integer_output_uses_zstd(self, tmp_path):
+        """Test integer outputs are tiled ZSTD with horizontal differencing."""
+        src_path = _write_band(tmp_path / "B04.tif", np.ones((600, 600), dtype=np.uint16))
+
+        out = stack_bands({"B04": src_path}, tmp_path / "stack.tif")
+
+        with rasterio.open(out) as src:
+            assert src.compression.name == "zstd"
+            assert src.block_shapes[0] == (512, 512)
+            assert src.tags(ns="IMAGE_STRUCTURE").get("PREDICTOR") == "2"
+
+    def test_float_output_uses_float_predictor(self, tmp_path):
+        """Test float outputs use the floating-point predictor."""
+        band = _write_band(tmp_path / "B.tif", np.ones((4, 4), dtype=np.uint16))
+
+        out = calculate_ndvi(band, band, tmp_path / "ndvi.tif")
+
+        with rasterio.open(out) as src:
+            assert src.compression.name == "zstd"
+            assert src.tags(ns="IMAGE_STRUCTURE").get("PREDICTOR") == "3"
+
+
+class TestGetBoundsFromRaster:
+    """Tests for get_bounds_from_raster function."""
+
+    def test_utm_bounds_in_wgs84(self, tmp_path):
+        """Test bounds are transformed to WGS84, reusing cached transforms."""
+        from cdse.processing import _transform_bounds
+
+        first = _write_band(tmp_path / "a.tif", np.ones((10, 10), dtype=np.uint16))
+        second = _write_band(tmp_path / "b.tif", np.ones((10, 10), dtype=np.uint16))
+        _transform_bounds.cache_clear()
+
+        bbox, crs = get_bounds_from_raster(first)
+
+        assert crs == "EPSG:32632"
+        assert 8.99 < bbox[0] < bbox[2] < 9.01
+        assert 45.15 < bbox[1] < bbox[3] < 45.16
+        assert get_bounds_from_raster(second) == (bbox, crs)
+        assert _transform_bounds.cache_info().hits == 1
+
+
+class TestReproject:
+    """Tests for reproject function."""
+
+    def test_reproject_to_wgs84(self, tmp_path):
+        """Test reprojecting a UTM raster to WGS84."""
+        data = np.arange(100, dtype=np.uint16).reshape(10, 10)
+        src_path = _write_band(tmp_path / "utm.tif", data)
+
+        out = reproject(src_path, tmp_path / "wgs84.tif")
+
+        with rasterio.open(out) as src:
+            assert src.crs.to_epsg() == 4326
+            assert src.count == 1
@@ -44,6 +44,11 @@ class TestProduct:
             },
         }
 
+    @pytest.fixture
+    def product(self, sample_feature):
+        """Create a Product from the sample feature."""
+        return Product.from_stac_feature(sample_feature)
+
     def test_from_stac_feature(self, sample_feature):
         """Test creating Product from STAC feature."""
         product = Product.from_stac_feature(sample_feature)
@@ -54,50 +59,35 @@ class TestProduct:
         assert product.cloud_cover == 15.5
         assert product.bbox == [9.0, 45.0, 10.0, 46.0]
 
-    def test_datetime_parsing(self, sample_feature):
+    def test_datetime_parsing(self, product):
         """Test datetime parsing from feature."""
-        product = Product.from_stac_feature(sample_feature)
-
         assert product.datetime is not None
         assert product.datetime.year == 2024
         assert product.datetime.month == 1
         assert product.datetime.day == 15
 
-    def test_properties_access(self, sample_feature):
+    def test_properties_access(self, product):
         """Test accessing properties."""
-        product = Product.from_stac_feature(sample_feature)
-
         assert product.platform == "sentinel-2a"
         assert product.instrument == "MSI"
         assert product.processing_level == "L2A"
         assert product.tile_id == "32TNR"
         assert product.orbit_number == 65
 
-    def test_download_url(self, sample_feature):
+    def test_download_url(self, product):
         """Test download URL extraction."""
-        product = Product.from_stac_feature(sample_feature)
-
         assert product.download_url == "https://example.com/download/product.zip"
 
-    def test_download_url_missing(self):
-        """Test download URL when not available."""
-        feature = {"id": "test", "properties": {}}
-        product = Product.from_stac_feature(feature)
-
-        assert product.download_url is None
-
-    def test_str_representation(self, sample_feature):
+    def test_str_representation(self, product):
         """Test string representation."""
-        product = Product.from_stac_feature(sample_feature)
         str_repr = str(product)
 
         assert "S2A_MSIL2A_20240115_T32TNR" in str_repr
         assert "2024-01-15" in str_repr
         assert "15.5%" in str_repr
 
-    def test_to_dict(self, sample_feature):
+    def test_to_dict(self, product):
         """Test conversion to dictionary."""
-        product = Product.from_stac_feature(sample_feature)
         d = product.to_dict()
 
         assert d["id"] == "S2A_MSIL2A_20240115_T32TNR"
@@ -106,23 +96,35 @@ class TestProduct:
         assert "datetime" in d
         assert d["bbox"] == [9.0, 45.0, 10.0, 46.0]
 
-    def test_size_properties(self):
-        """Test size property methods."""
-        feature = {
-            "id": "test",
-            "properties": {"size": 1073741824},  # 1 GB
-        }
-        product = Product.from_stac_feature(feature)
-
-        assert product.size == 1073741824
-        assert product.size_mb == pytest.approx(1024.0, rel=0.01)
+    def test_utc_datetime_and_invalid_datetime(self):
+        """Test a "Z" datetime is timezone-aware and an invalid one is None."""
+        from datetime import timezone
 
-    def test_missing_properties(self):
-        """Test handling of missing properties."""
-        feature = {"id": "minimal-product", "properties": {}}
-        product = Product.from_stac_feature(feature)
+        product = Product.from_stac_feature(
+            {"id": "a", "properties": {"datetime": "2024-01-15T10:30:00.024Z"}}
+        )
+        assert product.datetime is not None
+        assert product.datetime.tzinfo == timezone.utc
+        assert product.datetime.microsecond == 24000
 
-        assert product.id == "minimal-product"
-        assert product.cloud_cover is None
+        product = Product.from_stac_feature({"id": "b", "properties": {"datetime": "yesterday"}})
         assert product.datetime is None
-        assert product.platform is None
+
+    @pytest.mark.parametrize(
+        "properties, attr, expected",
+        [
+            ({}, "id", "minimal-product"),
+            ({}, "download_url", None),
+            ({}, "cloud_cover", None),
+            ({}, "datetime", None),
+            ({}, "platform", None),
+            ({"size": 1073741824}, "size", 1073741824),  # 1 GB
+            ({"size": 1073741824}, "size_mb", 1024.0),
+        ],
+        ids=["id", "download_url", "cloud_cover", "datetime", "platform", "size", "size_mb"],
+    )
+    def test_minimal_feature(self, properties, attr, expected):
+        """Test attributes of a feature with few or no properties."""
+        product = Product.from_stac_feature({"id": "minimal-product", "properties": properties})
+
+        assert getattr(product, attr) == expected